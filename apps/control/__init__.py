@@ -12,17 +12,48 @@ PID控制系统模块
 - io/visualize.py: 通用数据可视化工具
 """
 
-from .core.pid import PIDController
-from .core.controller import (
-    PlaneController,
-    PlaneYawController,
-    YawOnlyController,
-    quaternion_to_yaw,
-    normalize_angle,
-    get_yaw_error,
-)
-from .io.logger import DataLogger
-from . import config
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import config
+    from .core.controller import (
+        PlaneController,
+        PlaneYawController,
+        YawOnlyController,
+        get_yaw_error,
+        normalize_angle,
+        quaternion_to_yaw,
+    )
+    from .core.pid import PIDController
+    from .io.logger import DataLogger
+
+# Resolved on first attribute access (PEP 562) so `import apps.control.x`
+# does not load the controllers, logger and config up front.
+_LAZY_ATTRS = {
+    "PIDController": ".core.pid",
+    "PlaneController": ".core.controller",
+    "PlaneYawController": ".core.controller",
+    "YawOnlyController": ".core.controller",
+    "quaternion_to_yaw": ".core.controller",
+    "normalize_angle": ".core.controller",
+    "get_yaw_error": ".core.controller",
+    "DataLogger": ".io.logger",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "config":
+        return importlib.import_module(".config", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PIDController",
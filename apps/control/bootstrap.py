@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
 
 def ensure_project_path() -> Path:
@@ -18,3 +20,19 @@ def ensure_pydjimqtt() -> None:
     sdk_root = project_root / "thirdparty" / "pydjimqtt" / "src"
     if str(sdk_root) not in sys.path:
         sys.path.insert(0, str(sdk_root))
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return ``name`` as a module that is only executed on first attribute access."""
+
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -20,6 +20,10 @@ DRC_HEARTBEAT_INTERVAL = 1.0
 # ========== SLAM 数据源 ==========
 SLAM_POSE_TOPIC = "slam/position"
 SLAM_YAW_TOPIC = "slam/yaw"
+# 本地位姿总线（共享内存）名称；为空则各脚本自行订阅 MQTT。
+# 由 dashboard（POSE_BUS_NAME）或 `python -m apps.control.main_pose_bus` 发布。
+POSE_BUS_NAME = ""
+POSE_BUS_STALE_AFTER = 0.5  # s，序号不再前进即视为过期
 
 # ========== 数据记录 ==========
 ENABLE_DATA_LOGGING = True
@@ -88,6 +92,14 @@ PLANE_SETTLE_KP = KP_XY * 10
 PLANE_SETTLE_KI = 10.0
 PLANE_SETTLE_KD = KD_XY
 
+# ========== 平面参考轨迹 ==========
+# "step"：阶跃目标 + APPROACH/BRAKE/SETTLE；"min_jerk" / "trapezoid"：按时间生成参考点并跟踪（无刹车）
+PLANE_REF_MODE = "step"
+PLANE_REF_MAX_SPEED = 1.5  # m/s
+PLANE_REF_MAX_ACCEL = 1.5  # m/s²
+PLANE_REF_FF_GAIN = 132.0  # 杆量/(m/s)，速度前馈；满杆 660 对应仿真最大水平速度 5 m/s，实机需标定
+PLANE_REF_FF_LEAD = 0.3  # s，前馈速度提前量（约等于机体速度响应时间常数）
+
 # ========== 垂直运动（Z） ==========
 VERTICAL_HEIGHT_SOURCE = "slam"  # "slam" or "relative"
 VERTICAL_TARGET_HEIGHT = 1.0
@@ -104,6 +116,14 @@ VERTICAL_MAX_THROTTLE_OUTPUT = 330
 VERTICAL_CONTROL_FREQUENCY = 20
 VERTICAL_ARRIVAL_STABLE_TIME = 1.0
 
+# ========== 不拍照航点：连续通过 ==========
+# 不拍照的中间航点进入捕获半径即切换到下一目标（不刹车、不计稳定时间）
+PASS_THROUGH_ENABLED = True
+PASS_THROUGH_RADIUS = 0.3  # m，不小于 PLANE_BRAKE_DISTANCE，否则先触发刹车
+PASS_THROUGH_YAW_BLEND_DISTANCE = 0.8  # m，距航点多远开始向下一段航向过渡
+PASS_THROUGH_MAX_TURN_DEG = 90.0  # 下一段转角超过此值仍停稳后再转向
+PASS_THROUGH_MAX_DZ = VERTICAL_TOLERANCE  # 高度变化超过此值需经垂直阶段
+
 # ========== 旋转运动（Yaw） ==========
 TARGET_YAWS = [
     0,
@@ -113,6 +133,7 @@ TARGET_YAWS = [
 ]
 
 YAW_ARRIVAL_STABLE_TIME = 0.5
+TASK_HOLD_TIME = 1.0  # 拍照航点在任务朝向保持的时间（秒）
 YAW_I_ACTIVATION_ERROR = 10
 YAW_DEADZONE = 0
 
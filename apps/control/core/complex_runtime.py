@@ -20,7 +20,12 @@ from apps.control.core.complex_utils import (
     yaw_from_points,
 )
 from apps.control.core.controller import get_yaw_error
-from apps.control.core.plane_logic import PlaneControlState, plane_control_step
+from apps.control.core.plane_logic import (
+    PlaneControlState,
+    plane_control_step,
+    plane_tracking_step,
+)
+from apps.control.core.trajectory_gen import carried_speed, plan_plane_reference
 from apps.control.core.yaw_logic import yaw_control_step
 
 
@@ -197,6 +202,7 @@ def _advance_after_task(cfg: Any, ctx: ComplexContext, state: Any) -> None:
     state.brake_started_at = None
     state.brake_count = 0
     state.settle_started_at = None
+    state.plane_reference = None
     state.control_start_time = time.time()
     _ensure_next_move_target(cfg, ctx)
 
@@ -207,6 +213,67 @@ def _is_last_waypoint(ctx: ComplexContext) -> bool:
     )
 
 
+def _pass_through_heading(
+    cfg: Any, ctx: ComplexContext, current_z: float | None
+) -> float | None:
+    """Heading of the leg after the move target, if the target can be flown through.
+
+    ``current_z`` is the measured height: the move phase sends no throttle,
+    so any height error against the target forces the stop and vertical phase.
+    """
+    index = ctx.move_target_index
+    if (
+        not cfg.PASS_THROUGH_ENABLED
+        or cfg.PLANE_USE_RANDOM_WAYPOINTS
+        or ctx.task_required is None
+        or index is None
+        or ctx.move_target_waypoint is None
+        or ctx.move_yaw is None
+    ):
+        return None
+    # Photo waypoints, the last waypoint and the return leg keep the full stop.
+    if index >= len(ctx.task_required) - 1 or ctx.task_required[index]:
+        return None
+    if ctx.final_index_start is not None and index >= ctx.final_index_start:
+        return None
+    # Move phase sends no throttle; a height error still needs the vertical phase.
+    if (
+        ctx.move_target_z is None
+        or current_z is None
+        or abs(current_z - ctx.move_target_z) > cfg.PASS_THROUGH_MAX_DZ
+    ):
+        return None
+    next_raw = cfg.WAYPOINTS[(index + 1) % len(cfg.WAYPOINTS)]
+    target_x, target_y = ctx.move_target_waypoint
+    if math.hypot(next_raw[0] - target_x, next_raw[1] - target_y) <= cfg.TOLERANCE_XY:
+        return None
+    heading = yaw_from_points(target_x, target_y, next_raw[0], next_raw[1])
+    if abs(get_yaw_error(heading, ctx.move_yaw)) > cfg.PASS_THROUGH_MAX_TURN_DEG:
+        return None
+    return heading
+
+
+def _pass_through(cfg: Any, ctx: ComplexContext, state: Any, console: Any) -> None:
+    console.print(
+        f"[cyan]↷ 通过航点{ctx.move_target_index} - ({ctx.move_target_waypoint[0]:.2f}, {ctx.move_target_waypoint[1]:.2f})m（不停留）[/cyan]"
+    )
+    ctx.current_waypoint = ctx.move_target_waypoint
+    ctx.current_target_yaw = ctx.move_target_yaw
+    ctx.current_target_z = ctx.move_target_z
+    ctx.waypoint_index = ctx.move_target_index
+    ctx.move_target_waypoint = None
+    ctx.move_target_index = None
+    ctx.move_target_yaw = None
+    ctx.move_target_z = None
+    ctx.move_yaw = None
+    _ensure_next_move_target(cfg, ctx)
+    state.plane_state = "approach"
+    state.plane_in_tolerance_since = None
+    state.brake_started_at = None
+    state.brake_count = 0
+    state.settle_started_at = None
+
+
 def step_complex(
     *,
     cfg: Any,
@@ -283,7 +350,7 @@ def step_complex(
         else:
             error_yaw = get_yaw_error(ctx.current_target_yaw, current_yaw)
             abs_error = abs(error_yaw)
-            task_hold_time = 1.0
+            task_hold_time = cfg.TASK_HOLD_TIME
             state.yaw_in_tolerance_since, stable_duration = update_stability_timer(
                 in_range=abs_error < cfg.TOLERANCE_YAW,
                 in_tolerance_since=state.yaw_in_tolerance_since,
@@ -356,6 +423,41 @@ def step_complex(
         )
 
     elif state.phase == "move":
+        pass_heading = (
+            _pass_through_heading(cfg, ctx, current_z)
+            if state.plane_state in ("approach", "track")
+            else None
+        )
+        capture_radius = max(cfg.PASS_THROUGH_RADIUS, cfg.PLANE_BRAKE_DISTANCE)
+        if (
+            pass_heading is not None
+            and math.hypot(target_x - current_x, target_y - current_y) <= capture_radius
+        ):
+            # Switch targets before the brake fires; the reset avoids a D-term kick.
+            _pass_through(cfg, ctx, state, console)
+            plane_approach.reset()
+            target_x, target_y = ctx.move_target_waypoint
+            pass_heading = _pass_through_heading(cfg, ctx, current_z)
+
+        tracking = cfg.PLANE_REF_MODE != "step"
+        if tracking and (
+            state.plane_reference is None
+            or state.plane_reference.end != (target_x, target_y)
+        ):
+            # Plan from where the drone is; keep the speed carried through a pass-through.
+            start = (current_x, current_y)
+            state.plane_reference = plan_plane_reference(
+                start,
+                (target_x, target_y),
+                current_time,
+                profile=cfg.PLANE_REF_MODE,
+                max_speed=cfg.PLANE_REF_MAX_SPEED,
+                max_accel=cfg.PLANE_REF_MAX_ACCEL,
+                v0=carried_speed(
+                    state.plane_reference, current_time, start, (target_x, target_y)
+                ),
+            )
+
         yaw_for_control = (
             0.0 if abs(current_yaw) <= cfg.YAW_ZERO_THRESHOLD_DEG else current_yaw
         )
@@ -372,7 +474,16 @@ def step_complex(
 
         distance = plane_approach.get_distance(target_x, target_y, current_x, current_y)
 
-        error_yaw = get_yaw_error(ctx.move_yaw, current_yaw)
+        yaw_target = ctx.move_yaw
+        if pass_heading is not None:
+            # Turn toward the next leg while closing in on a pass-through waypoint.
+            blend_span = max(cfg.PASS_THROUGH_YAW_BLEND_DISTANCE - capture_radius, 1e-6)
+            weight = min(
+                max((cfg.PASS_THROUGH_YAW_BLEND_DISTANCE - distance) / blend_span, 0.0),
+                1.0,
+            )
+            yaw_target = ctx.move_yaw + weight * get_yaw_error(pass_heading, ctx.move_yaw)
+        error_yaw = get_yaw_error(yaw_target, current_yaw)
         yaw_offset, yaw_pid_components, yaw = yaw_control_step(
             cfg,
             yaw_controller,
@@ -424,11 +535,24 @@ def step_complex(
                 state.phase = "vertical"
                 state.z_in_tolerance_since = None
                 state.yaw_in_tolerance_since = None
+                state.plane_reference = None
                 plane_approach.reset()
                 plane_settle.reset()
                 yaw_controller.reset()
 
-        if state.phase == "move":
+        if state.phase == "move" and tracking:
+            state.plane_state = "track"
+            roll_offset, pitch_offset, pid_components, roll, pitch = plane_tracking_step(
+                state.plane_reference,
+                cfg,
+                plane_approach,
+                current_x,
+                current_y,
+                yaw_rad,
+                mqtt_client,
+                current_time,
+            )
+        elif state.phase == "move":
             plane_state = PlaneControlState(
                 plane_state=state.plane_state,
                 brake_started_at=state.brake_started_at,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import time
+from typing import Any
 
 
 @dataclass
@@ -20,6 +21,7 @@ class ControlState:
     settle_started_at: float | None = None
     task_photo_printed: bool = False
     task_completed_count: int = 0
+    plane_reference: Any = None  # PlaneReference when PLANE_REF_MODE != "step"
 
 
 def reset_for_next_target(state: ControlState) -> None:
@@ -35,3 +37,4 @@ def reset_for_next_target(state: ControlState) -> None:
     state.settle_started_at = None
     state.task_photo_printed = False
     state.task_completed_count = 0
+    state.plane_reference = None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from .complex_utils import parse_waypoint
 
@@ -99,8 +99,9 @@ def build_move_target_fixed(
     index: int,
     fallback_z: float,
 ) -> tuple[tuple[float, float], float, float, str]:
-    waypoint_list = list(waypoints)
-    yaw_list = list(target_yaws)
+    # Mission routes can be long; index lists directly instead of copying per call.
+    waypoint_list = waypoints if isinstance(waypoints, Sequence) else list(waypoints)
+    yaw_list = target_yaws if isinstance(target_yaws, Sequence) else list(target_yaws)
     next_index = index % len(waypoint_list)
     raw = waypoint_list[next_index]
     fallback_yaw = yaw_list[next_index % len(yaw_list)]
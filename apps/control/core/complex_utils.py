@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import math
-from typing import Sequence
-from rich.console import Console
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 def update_stability_timer(
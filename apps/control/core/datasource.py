@@ -6,10 +6,13 @@ SLAM 数据源抽象层
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from pydjimqtt.core.mqtt_client import MQTTClient
 
+from apps.control import config as cfg
+
+from .pose_bus import PoseBusReader
 from .pose_service import PoseService
 
 
@@ -68,8 +71,78 @@ class SlamDataSource(DataSource):
         return None
 
 
+class PoseBusDataSource(DataSource):
+    """本地位姿总线数据源（共享内存，不订阅 MQTT、不解析 JSON）"""
+
+    def __init__(self, reader: PoseBusReader) -> None:
+        self.reader = reader
+
+    def _latest_valid(self) -> Optional[Tuple[float, float, float, float]]:
+        if self.reader.is_stale():
+            return None
+        sample = self.reader.sample()
+        if sample is None:
+            return None
+        if sample.x is None or sample.y is None or sample.z is None or sample.yaw is None:
+            return None
+        return (sample.x, sample.y, sample.z, sample.yaw)
+
+    def get_position(self) -> Optional[Tuple[float, float, float]]:
+        latest = self._latest_valid()
+        if latest is None:
+            return None
+        x, y, z, _ = latest
+        return (x, y, z)
+
+    def get_yaw(self) -> Optional[float]:
+        latest = self._latest_valid()
+        if latest is None:
+            return None
+        return latest[3]
+
+    def latest(self) -> Dict[str, Optional[float]]:
+        """与 `PoseService.latest()` 相同的字典格式，供起飞/降落逻辑使用"""
+        latest = self._latest_valid()
+        if latest is None:
+            return {"x": None, "y": None, "z": None, "yaw": None}
+        x, y, z, yaw = latest
+        return {"x": x, "y": y, "z": z, "yaw": yaw}
+
+    def stop(self) -> None:
+        self.reader.close()
+
+
+def _open_pose_bus(bus_name: Optional[str]) -> Optional[PoseBusReader]:
+    name = cfg.POSE_BUS_NAME if bus_name is None else bus_name
+    if not name:
+        return None
+    reader = PoseBusReader(name, stale_after=cfg.POSE_BUS_STALE_AFTER)
+    if not reader.attached:
+        return None
+    return reader
+
+
 def create_datasource(
-    mqtt_client: MQTTClient, pose_topic: str, yaw_topic: str
+    mqtt_client: MQTTClient,
+    pose_topic: str,
+    yaw_topic: str,
+    bus_name: Optional[str] = None,
 ) -> DataSource:
-    """创建 SLAM 数据源"""
+    """创建 SLAM 数据源（已配置且存在位姿总线时优先使用总线）"""
+    reader = _open_pose_bus(bus_name)
+    if reader is not None:
+        return PoseBusDataSource(reader)
     return SlamDataSource(mqtt_client, pose_topic, yaw_topic)
+
+
+def create_pose_feed(
+    mqtt_client: MQTTClient,
+    pose_topic: str,
+    yaw_topic: str,
+    bus_name: Optional[str] = None,
+) -> Any:
+    """创建带 `latest()` 的位姿源（总线优先，否则订阅 MQTT 的 PoseService）"""
+    reader = _open_pose_bus(bus_name)
+    if reader is not None:
+        return PoseBusDataSource(reader)
+    return PoseService(mqtt_client, pose_topic, yaw_topic)
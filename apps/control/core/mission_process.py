@@ -0,0 +1,171 @@
+"""Run `run_complex_mission` in a spawned child process.
+
+The child gets its own interpreter (and GIL), its own MQTT connection for
+stick commands, and reads pose from a `PoseBlock` written by the parent.
+Progress, tick timings and the outcome come back over a `multiprocessing`
+pipe; the parent sends ``("abort",)`` to stop the run.
+
+`run_mission_in_process` takes the same callbacks as `run_complex_mission`,
+so callers can switch between the two.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from apps.control.core.mission_runner import MissionSpec
+
+MSG_PROGRESS = "progress"
+MSG_TICKS = "ticks"
+MSG_DONE = "done"
+MSG_ERROR = "error"
+MSG_ABORT = "abort"
+
+# Tick timings are batched so the pipe stays quiet at 50 Hz.
+TICK_BATCH = 25
+
+
+@dataclass(frozen=True)
+class MissionProcessRequest:
+    spec: MissionSpec
+    pose_block: str
+    gateway_sn: str
+    mqtt_config: dict[str, Any]
+    pose_stale_after: float = 1.0
+
+
+def run_mission_in_process(
+    request: MissionProcessRequest,
+    *,
+    should_abort: Callable[[], bool] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    on_tick: Callable[[float, float | None], None] | None = None,
+    name: str = "mission-process",
+) -> None:
+    """Start the child, relay its messages, and raise if the run failed.
+
+    ``on_tick`` receives ``(work_seconds, period_seconds)`` per control tick.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(
+        target=_child_main, args=(child_conn, request), name=name, daemon=True
+    )
+    process.start()
+    child_conn.close()
+
+    result: tuple | None = None
+    abort_sent = False
+    try:
+        while result is None:
+            if should_abort and should_abort() and not abort_sent:
+                parent_conn.send((MSG_ABORT,))
+                abort_sent = True
+            if not parent_conn.poll(0.1):
+                if not process.is_alive():
+                    break
+                continue
+            try:
+                message = parent_conn.recv()
+            except EOFError:
+                break
+            kind = message[0]
+            if kind == MSG_PROGRESS:
+                if on_progress:
+                    on_progress(message[1], message[2])
+            elif kind == MSG_TICKS:
+                if on_tick:
+                    for work, period in message[1]:
+                        on_tick(work, period)
+            else:
+                result = message
+    finally:
+        process.join(timeout=5.0)
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout=2.0)
+        parent_conn.close()
+
+    if result is None:
+        raise RuntimeError(
+            f"Mission process exited unexpectedly (exit code {process.exitcode})."
+        )
+    if result[0] == MSG_ERROR:
+        raise RuntimeError(result[1])
+
+
+def _child_main(conn: Any, request: MissionProcessRequest) -> None:
+    from apps.control.bootstrap import ensure_pydjimqtt
+
+    ensure_pydjimqtt()
+    from pydjimqtt.core import MQTTClient
+    from rich.console import Console
+
+    from apps.control.core.mission_runner import run_complex_mission
+    from apps.control.core.pose_shm import PoseBlock, SharedPoseDataSource
+
+    datasource = SharedPoseDataSource(
+        PoseBlock.attach(request.pose_block), stale_after=request.pose_stale_after
+    )
+    mqtt = None
+    aborted = False
+    last_progress: tuple[int, int] | None = None
+    ticks: list[tuple[float, float | None]] = []
+    last_tick_at: float | None = None
+
+    def _should_abort() -> bool:
+        nonlocal aborted
+        while conn.poll():
+            if conn.recv()[0] == MSG_ABORT:
+                aborted = True
+        return aborted
+
+    def _on_progress(index: int, total: int) -> None:
+        nonlocal last_progress
+        if (index, total) != last_progress:
+            last_progress = (index, total)
+            conn.send((MSG_PROGRESS, index, total))
+
+    def _on_tick(work: float) -> None:
+        nonlocal last_tick_at
+        now = time.monotonic()
+        period = None if last_tick_at is None else now - last_tick_at
+        last_tick_at = now
+        ticks.append((work, period))
+        if len(ticks) >= TICK_BATCH:
+            _flush_ticks()
+
+    def _flush_ticks() -> None:
+        if ticks:
+            conn.send((MSG_TICKS, list(ticks)))
+            ticks.clear()
+
+    try:
+        mqtt = MQTTClient(request.gateway_sn, request.mqtt_config)
+        mqtt.connect()
+        run_complex_mission(
+            mqtt=mqtt,
+            datasource=datasource,
+            console=Console(),
+            spec=request.spec,
+            should_abort=_should_abort,
+            on_progress=_on_progress,
+            on_tick=_on_tick,
+        )
+        _flush_ticks()
+        conn.send((MSG_DONE,))
+    except Exception as exc:  # noqa: BLE001
+        _flush_ticks()
+        conn.send((MSG_ERROR, str(exc)))
+    finally:
+        datasource.stop()
+        if mqtt is not None:
+            try:
+                mqtt.disconnect()
+            except Exception:  # noqa: BLE001
+                pass
+        conn.close()
@@ -6,8 +6,7 @@ import json
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
-from rich.console import Console
+from typing import TYPE_CHECKING, Callable, Sequence
 
 from apps.control import config as cfg
 from apps.control.core.complex_runtime import init_context, init_phase, step_complex
@@ -16,6 +15,9 @@ from apps.control.core.complex_targets import build_move_target_random
 from apps.control.core.controller import PlaneController, YawOnlyController
 from apps.control.core.pid import PIDController
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 @dataclass(frozen=True)
 class MissionPoint:
@@ -29,7 +31,8 @@ class MissionPoint:
 @dataclass(frozen=True)
 class MissionSpec:
     initial: MissionPoint
-    waypoints: list[MissionPoint]
+    # Any sequence of points; the dashboard passes its read-only WaypointArray.
+    waypoints: Sequence[MissionPoint]
     final: MissionPoint | None
 
 
@@ -102,6 +105,7 @@ def run_complex_mission(
     spec: MissionSpec,
     should_abort: Callable[[], bool] | None = None,
     on_progress: Callable[[int, int], None] | None = None,
+    on_tick: Callable[[float], None] | None = None,
 ) -> None:
     plane_approach = PlaneController(
         cfg.KP_XY,
@@ -145,6 +149,8 @@ def run_complex_mission(
         current_yaw = datasource.get_yaw()
         time.sleep(0.1)
 
+    # Later targets are read from cfg.WAYPOINTS, so the spec must be applied.
+    apply_mission_to_config(spec)
     ctx = init_context(cfg, position, current_yaw)
     ctx.current_waypoint = (spec.initial.x, spec.initial.y)
     ctx.current_target_z = spec.initial.z
@@ -199,6 +205,8 @@ def run_complex_mission(
                 f"Out:P{info.pitch_offset:+5.0f}/R{info.roll_offset:+5.0f}/Y{info.yaw_offset:+5.0f}"
             )
             last_print = loop_start
+        if on_tick:
+            on_tick(time.time() - loop_start)
         if state.phase == "done":
             return
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
 from typing import Tuple
 
 from pydjimqtt import drone_emergency_stop, send_stick_control
@@ -109,3 +110,46 @@ def plane_control_step(
             send_stick_control(mqtt_client, roll=roll, pitch=pitch)
 
     return roll_offset, pitch_offset, pid_components, roll, pitch
+
+
+def plane_tracking_step(
+    reference,
+    cfg,
+    plane_controller,
+    current_x: float,
+    current_y: float,
+    yaw_rad: float,
+    mqtt_client,
+    now: float,
+) -> Tuple[float, float, dict, int, int]:
+    """
+    Track a moving `PlaneReference`: PID on the setpoint error plus
+    reference-velocity feedforward. Replaces approach/brake/settle.
+
+    Returns:
+        roll_offset, pitch_offset, pid_components, roll, pitch
+    """
+    ref_x, ref_y, _, _ = reference.sample(now)
+    # 前馈取稍后时刻的参考速度，补偿机体速度响应滞后
+    _, _, ref_vx, ref_vy = reference.sample(now + cfg.PLANE_REF_FF_LEAD)
+    cos_yaw = math.cos(yaw_rad)
+    sin_yaw = math.sin(yaw_rad)
+    error_x = ref_x - current_x
+    error_y = ref_y - current_y
+    roll_offset, pitch_offset, pid_components = plane_controller.compute(
+        cos_yaw * error_x + sin_yaw * error_y,
+        -sin_yaw * error_x + cos_yaw * error_y,
+        0.0,
+        0.0,
+        now,
+    )
+    # 前向速度 → Pitch 正，左向速度 → Roll 负
+    pitch_offset += cfg.PLANE_REF_FF_GAIN * (cos_yaw * ref_vx + sin_yaw * ref_vy)
+    roll_offset -= cfg.PLANE_REF_FF_GAIN * (-sin_yaw * ref_vx + cos_yaw * ref_vy)
+    limit = cfg.MAX_STICK_OUTPUT
+    pitch_offset = max(-limit, min(limit, pitch_offset))
+    roll_offset = max(-limit, min(limit, roll_offset))
+    roll = int(cfg.NEUTRAL + roll_offset)
+    pitch = int(cfg.NEUTRAL + pitch_offset)
+    send_stick_control(mqtt_client, roll=roll, pitch=pitch)
+    return roll_offset, pitch_offset, pid_components, roll, pitch
@@ -0,0 +1,255 @@
+"""Local SLAM pose bus: one decoder, many readers, over a shared-memory ring.
+
+One process (the dashboard with ``POSE_BUS_NAME`` set, or
+``python -m apps.control.main_pose_bus``) subscribes to ``slam/position`` /
+``slam/yaw``, decodes each message once and appends the merged pose to the
+ring. Control scripts and other readers attach by name and read samples
+straight out of the mapping with ``struct.unpack_from``: no MQTT connection,
+no JSON, no copy of the segment.
+
+Layout (little endian)::
+
+    header: 4s magic | u32 capacity | u64 head | u64 writer pid
+    slot:   u64 seq | f64 x | f64 y | f64 z | f64 yaw | f64 updated_at
+
+``head`` is the sequence number of the newest complete sample (samples are
+numbered from 1). The writer zeroes a slot's ``seq`` before filling it and
+stores the sample number last, so a reader detects torn or overwritten
+slots by comparing ``seq`` before and after the read. Staleness is judged
+by the sequence number not advancing, so readers never compare clocks with
+the writer.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+from .pose_shm import PoseSample, _nan, _none, attach_shared_memory
+
+DEFAULT_BUS_NAME = "drone3plot_pose"
+DEFAULT_CAPACITY = 256
+MAGIC = b"D3PB"
+
+_HEADER = struct.Struct("<4sIQQ")
+_HEAD_OFFSET = 8
+_HEAD = struct.Struct("<Q")
+_SLOT = struct.Struct("<Qddddd")
+_SLOT_SEQ = struct.Struct("<Q")
+
+READ_RETRIES = 100
+REATTACH_INTERVAL = 1.0
+
+
+def _segment_size(capacity: int) -> int:
+    return _HEADER.size + capacity * _SLOT.size
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0 or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user.
+        return True
+    return True
+
+
+class PoseBusWriter:
+    """Single writer; merges position and yaw updates into full samples.
+
+    Raises `RuntimeError` if another live process already writes the bus.
+    """
+
+    def __init__(self, name: str = DEFAULT_BUS_NAME, capacity: int = DEFAULT_CAPACITY):
+        self.name = name
+        self.capacity = capacity
+        self._shm = self._open(name, capacity)
+        self._buf = self._shm.buf
+        self._head = _HEAD.unpack_from(self._buf, _HEAD_OFFSET)[0]
+        self._pose: list[Optional[float]] = [None, None, None, None]
+
+    @staticmethod
+    def _open(name: str, capacity: int) -> shared_memory.SharedMemory:
+        size = _segment_size(capacity)
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            shm.buf[:size] = bytes(size)
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+            magic, existing_capacity, _, writer_pid = _HEADER.unpack_from(shm.buf, 0)
+            if magic == MAGIC and _pid_alive(writer_pid):
+                shm.close()
+                raise RuntimeError(
+                    f"Pose bus {name!r} already has a live writer (pid {writer_pid}); "
+                    "run only one of the dashboard POSE_BUS_NAME / main_pose_bus."
+                )
+            # Left behind by a writer that did not exit cleanly: take it over
+            # if the layout matches, otherwise replace it.
+            if magic == MAGIC and existing_capacity == capacity and shm.size >= size:
+                head = _HEAD.unpack_from(shm.buf, _HEAD_OFFSET)[0]
+                _HEADER.pack_into(shm.buf, 0, MAGIC, capacity, head, os.getpid())
+                return shm
+            shm.close()
+            shm.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            shm.buf[:size] = bytes(size)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, capacity, 0, os.getpid())
+        return shm
+
+    @property
+    def head(self) -> int:
+        return self._head
+
+    def update_position(
+        self, x: Optional[float], y: Optional[float], z: Optional[float]
+    ) -> int:
+        self._pose[0:3] = [x, y, z]
+        return self._append()
+
+    def update_yaw(self, yaw: Optional[float]) -> int:
+        self._pose[3] = yaw
+        return self._append()
+
+    def write(
+        self,
+        x: Optional[float],
+        y: Optional[float],
+        z: Optional[float],
+        yaw: Optional[float],
+        updated_at: float | None = None,
+    ) -> int:
+        """Append a full sample (same signature as `PoseBlock.write`)."""
+
+        self._pose = [x, y, z, yaw]
+        return self._append(updated_at)
+
+    def _append(self, updated_at: float | None = None) -> int:
+        seq = self._head + 1
+        offset = _HEADER.size + ((seq - 1) % self.capacity) * _SLOT.size
+        _SLOT_SEQ.pack_into(self._buf, offset, 0)
+        x, y, z, yaw = (_nan(value) for value in self._pose)
+        stamp = time.monotonic() if updated_at is None else updated_at
+        _SLOT.pack_into(self._buf, offset, 0, x, y, z, yaw, stamp)
+        _SLOT_SEQ.pack_into(self._buf, offset, seq)
+        _HEAD.pack_into(self._buf, _HEAD_OFFSET, seq)
+        self._head = seq
+        return seq
+
+    def close(self, unlink: bool = True) -> None:
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class PoseBusReader:
+    """Attach to a bus by name; ``sample()`` returns the newest pose."""
+
+    def __init__(self, name: str = DEFAULT_BUS_NAME, stale_after: float = 0.5) -> None:
+        self.name = name
+        self.stale_after = stale_after
+        self._shm: shared_memory.SharedMemory | None = None
+        self._capacity = 0
+        self._last_head = 0
+        self._head_changed_at = time.monotonic()
+        self._attached_at = 0.0
+        self._attach()
+
+    def _attach(self) -> bool:
+        self._attached_at = time.monotonic()
+        try:
+            shm = attach_shared_memory(self.name)
+        except FileNotFoundError:
+            return False
+        magic, capacity, head, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or capacity == 0:
+            shm.close()
+            return False
+        if self._shm is not None:
+            self._shm.close()
+        self._shm = shm
+        self._capacity = capacity
+        # Only a head that moves after attaching counts as fresh data.
+        self._last_head = head
+        return True
+
+    @property
+    def attached(self) -> bool:
+        return self._shm is not None
+
+    def poll(self) -> int:
+        """Current head sequence; also tracks staleness and re-attaches."""
+
+        if self._shm is None:
+            return 0
+        head = _HEAD.unpack_from(self._shm.buf, _HEAD_OFFSET)[0]
+        now = time.monotonic()
+        if head != self._last_head:
+            self._last_head = head
+            self._head_changed_at = now
+        elif (
+            now - self._head_changed_at > self.stale_after
+            and now - self._attached_at > REATTACH_INTERVAL
+        ):
+            # The writer may have restarted under a fresh segment.
+            self._attach()
+        return head
+
+    def is_stale(self) -> bool:
+        self.poll()
+        return self._shm is None or (
+            time.monotonic() - self._head_changed_at > self.stale_after
+        )
+
+    def sample(self) -> PoseSample | None:
+        if self._shm is None:
+            if time.monotonic() - self._attached_at > REATTACH_INTERVAL:
+                self._attach()
+            if self._shm is None:
+                return None
+        for _ in range(READ_RETRIES):
+            head = self.poll()
+            if head == 0 or self._shm is None:
+                return None
+            sample = self._read_slot(head)
+            if sample is not None:
+                return sample
+        return None
+
+    def since(self, seq: int) -> list[PoseSample]:
+        """Samples newer than ``seq`` still held in the ring (oldest first)."""
+
+        head = self.poll()
+        if self._shm is None or head <= seq:
+            return []
+        first = max(seq + 1, head - self._capacity + 1, 1)
+        samples = []
+        for number in range(first, head + 1):
+            sample = self._read_slot(number)
+            if sample is not None:
+                samples.append(sample)
+        return samples
+
+    def _read_slot(self, seq: int) -> PoseSample | None:
+        assert self._shm is not None
+        buf = self._shm.buf
+        offset = _HEADER.size + ((seq - 1) % self._capacity) * _SLOT.size
+        before, x, y, z, yaw, updated_at = _SLOT.unpack_from(buf, offset)
+        if before != seq or _SLOT_SEQ.unpack_from(buf, offset)[0] != seq:
+            return None
+        return PoseSample(seq, _none(x), _none(y), _none(z), _none(yaw), updated_at)
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import json
 import threading
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from pydjimqtt.core.mqtt_client import MQTTClient
 
+if TYPE_CHECKING:
+    from .pose_bus import PoseBusWriter
+
 
 class PoseService:
     """Subscribe to pose/yaw topics and keep the latest payload."""
 
     def __init__(
-        self, client: MQTTClient, pose_topic: str | None, yaw_topic: str | None
+        self,
+        client: MQTTClient,
+        pose_topic: str | None,
+        yaw_topic: str | None,
+        bus: PoseBusWriter | None = None,
     ) -> None:
         self.client = client
+        self.bus = bus
         self.pose_topic = (pose_topic or "").strip()
         self.yaw_topic = (yaw_topic or "").strip()
         self._lock = threading.Lock()
@@ -61,6 +69,10 @@ class PoseService:
             self._pose["x"] = _to_float(x)
             self._pose["y"] = _to_float(y)
             self._pose["z"] = _to_float(z)
+            if self.bus is not None:
+                self.bus.update_position(
+                    self._pose["x"], self._pose["y"], self._pose["z"]
+                )
 
     def _handle_yaw(self, raw_payload: bytes) -> None:
         try:
@@ -71,6 +83,8 @@ class PoseService:
         yaw = data.get("yaw")
         with self._lock:
             self._pose["yaw"] = _to_float(yaw)
+            if self.bus is not None:
+                self.bus.update_yaw(self._pose["yaw"])
 
     def latest(self) -> Dict[str, Optional[float]]:
         with self._lock:
@@ -0,0 +1,162 @@
+"""Latest SLAM pose in a `multiprocessing.shared_memory` block (seqlock).
+
+One writer (the dashboard `PoseService`) and any number of readers in other
+processes. Layout (little endian, 48 bytes)::
+
+    u64 seq | f64 x | f64 y | f64 z | f64 yaw | f64 updated_at
+
+The writer bumps ``seq`` to an odd value, writes the fields, then bumps it
+to the next even value; a reader retries while ``seq`` is odd or changed
+under it. ``updated_at`` is ``time.monotonic()`` (system-wide on Linux and
+macOS). Missing values are stored as NaN.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import struct
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+_SEQ = struct.Struct("<Q")
+_FIELDS = struct.Struct("<ddddd")
+BLOCK_SIZE = _SEQ.size + _FIELDS.size
+
+READ_RETRIES = 100
+
+
+@dataclass(frozen=True)
+class PoseSample:
+    seq: int
+    x: Optional[float]
+    y: Optional[float]
+    z: Optional[float]
+    yaw: Optional[float]
+    updated_at: float
+
+    def age(self) -> float:
+        return time.monotonic() - self.updated_at
+
+
+class PoseBlock:
+    """Seqlock-protected pose record in a named shared-memory segment."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self._owner = owner
+        self._seq = _SEQ.unpack_from(self._buf, 0)[0]
+
+    @classmethod
+    def create(cls, name: str | None = None) -> "PoseBlock":
+        shm = shared_memory.SharedMemory(name=name, create=True, size=BLOCK_SIZE)
+        shm.buf[:BLOCK_SIZE] = bytes(BLOCK_SIZE)
+        block = cls(shm, owner=True)
+        block.write(None, None, None, None, updated_at=0.0)
+        return block
+
+    @classmethod
+    def attach(cls, name: str) -> "PoseBlock":
+        return cls(attach_shared_memory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(
+        self,
+        x: Optional[float],
+        y: Optional[float],
+        z: Optional[float],
+        yaw: Optional[float],
+        updated_at: float | None = None,
+    ) -> None:
+        stamp = time.monotonic() if updated_at is None else updated_at
+        seq = self._seq + 1 if self._seq % 2 == 0 else self._seq
+        _SEQ.pack_into(self._buf, 0, seq)
+        _FIELDS.pack_into(
+            self._buf, _SEQ.size, _nan(x), _nan(y), _nan(z), _nan(yaw), stamp
+        )
+        self._seq = seq + 1
+        _SEQ.pack_into(self._buf, 0, self._seq)
+
+    def read(self) -> PoseSample | None:
+        """Consistent snapshot, or None if the writer kept it busy too long."""
+
+        buf = self._buf
+        for _ in range(READ_RETRIES):
+            before = _SEQ.unpack_from(buf, 0)[0]
+            if before % 2:
+                continue
+            x, y, z, yaw, updated_at = _FIELDS.unpack_from(buf, _SEQ.size)
+            if _SEQ.unpack_from(buf, 0)[0] == before:
+                return PoseSample(
+                    before, _none(x), _none(y), _none(z), _none(yaw), updated_at
+                )
+        return None
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shm.unlink()
+
+
+class SharedPoseDataSource:
+    """`DataSource` over a `PoseBlock`; samples older than ``stale_after`` are None."""
+
+    def __init__(self, block: PoseBlock, stale_after: float = 1.0) -> None:
+        self.block = block
+        self.stale_after = stale_after
+
+    def _latest_valid(self) -> Optional[Tuple[float, float, float, float]]:
+        sample = self.block.read()
+        if sample is None or sample.age() > self.stale_after:
+            return None
+        if sample.x is None or sample.y is None or sample.z is None or sample.yaw is None:
+            return None
+        return (sample.x, sample.y, sample.z, sample.yaw)
+
+    def get_position(self) -> Optional[Tuple[float, float, float]]:
+        latest = self._latest_valid()
+        if latest is None:
+            return None
+        x, y, z, _ = latest
+        return (x, y, z)
+
+    def get_yaw(self) -> Optional[float]:
+        latest = self._latest_valid()
+        if latest is None:
+            return None
+        return latest[3]
+
+    def stop(self) -> None:
+        self.block.close()
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach without letting this process's resource tracker unlink it on exit."""
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    # Children started by multiprocessing share the creator's tracker, where the
+    # segment is already registered; only unrelated processes must unregister
+    # (attaching from the creating process itself is not supported on 3.12).
+    if multiprocessing.parent_process() is None:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _nan(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _none(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
@@ -0,0 +1,178 @@
+"""Time-parameterized plane setpoints (minimum-jerk / trapezoidal velocity).
+
+`plan_plane_reference` turns one straight XY segment into a `PlaneReference`
+that the controller samples every tick for a moving position setpoint plus
+the reference velocity (used as stick feedforward). Profiles end at rest on
+the target, so tracking them needs no brake; the start speed may be non-zero
+(e.g. after flying through a waypoint) and is clamped to what can still stop
+on the segment.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+PROFILES = ("min_jerk", "trapezoid")
+
+# Peak |v| and |a| of the rest-to-rest quintic, as multiples of d/T and d/T².
+_MIN_JERK_PEAK_SPEED = 1.875
+_MIN_JERK_PEAK_ACCEL = 5.7735
+_DURATION_SAMPLES = 32
+_DURATION_STEP = 1.05
+_DURATION_MAX_STEPS = 200
+
+
+@dataclass(frozen=True)
+class PlaneReference:
+    """Straight-line reference from ``start`` to ``end`` starting at ``t0``."""
+
+    start: tuple[float, float]
+    end: tuple[float, float]
+    t0: float
+    duration: float
+    profile: str
+    length: float
+    v0: float
+    accel: float
+    # Quintic c3..c5 for min_jerk; (peak speed, t_accel, t_cruise) for trapezoid.
+    params: tuple[float, float, float] = (0.0, 0.0, 0.0)
+
+    def progress(self, elapsed: float) -> tuple[float, float]:
+        """Distance and speed along the segment ``elapsed`` seconds in."""
+        if self.length <= 0.0 or elapsed >= self.duration:
+            return self.length, 0.0
+        t = max(elapsed, 0.0)
+        if self.profile == "min_jerk":
+            c3, c4, c5 = self.params
+            s = self.v0 * t + c3 * t**3 + c4 * t**4 + c5 * t**5
+            v = self.v0 + 3 * c3 * t**2 + 4 * c4 * t**3 + 5 * c5 * t**4
+            return min(max(s, 0.0), self.length), max(v, 0.0)
+        return _trapezoid_progress(self.length, self.v0, self.accel, self.params, t)
+
+    def sample(self, now: float) -> tuple[float, float, float, float]:
+        """``(x, y, vx, vy)`` of the reference at ``now``."""
+        s, v = self.progress(now - self.t0)
+        if self.length <= 0.0:
+            return self.end[0], self.end[1], 0.0, 0.0
+        ux = (self.end[0] - self.start[0]) / self.length
+        uy = (self.end[1] - self.start[1]) / self.length
+        return self.start[0] + ux * s, self.start[1] + uy * s, ux * v, uy * v
+
+    def finished(self, now: float) -> bool:
+        return now - self.t0 >= self.duration
+
+
+def _min_jerk_params(length: float, v0: float, duration: float) -> tuple[float, float, float]:
+    # s(t) = v0 t + c3 t³ + c4 t⁴ + c5 t⁵ with a(0)=0 and s(T)=d, v(T)=a(T)=0.
+    a = (length - v0 * duration) / duration**3
+    b = -v0 / duration**2
+    return (
+        10 * a - 4 * b,
+        (7 * b - 15 * a) / duration,
+        (6 * a - 3 * b) / duration**2,
+    )
+
+
+def _min_jerk_duration(length: float, v0: float, max_speed: float, max_accel: float) -> float:
+    duration = max(
+        _MIN_JERK_PEAK_SPEED * length / max_speed,
+        math.sqrt(_MIN_JERK_PEAK_ACCEL * length / max_accel),
+    )
+    if v0 <= 0.0:
+        return duration
+    # A moving start shortens the move: search up from d / v_max for the first
+    # duration that stays within the limits and never reverses.
+    duration = max(length / max(max_speed, v0), 1e-3)
+    for _ in range(_DURATION_MAX_STEPS):
+        c3, c4, c5 = _min_jerk_params(length, v0, duration)
+        within = True
+        for step in range(1, _DURATION_SAMPLES + 1):
+            t = duration * step / _DURATION_SAMPLES
+            v = v0 + 3 * c3 * t**2 + 4 * c4 * t**3 + 5 * c5 * t**4
+            acc = 6 * c3 * t + 12 * c4 * t**2 + 20 * c5 * t**3
+            if v < -1e-6 or v > max_speed * 1.001 or abs(acc) > max_accel * 1.001:
+                within = False
+                break
+        if within:
+            return duration
+        duration *= _DURATION_STEP
+    return duration
+
+
+def _trapezoid_plan(
+    length: float, v0: float, max_speed: float, accel: float
+) -> tuple[float, tuple[float, float, float]]:
+    """Duration and ``(peak_speed, t_accel, t_cruise)``."""
+    peak = min(max_speed, math.sqrt((2 * accel * length + v0**2) / 2))
+    peak = max(peak, v0)
+    t_accel = (peak - v0) / accel
+    d_accel = (v0 + peak) / 2 * t_accel
+    d_decel = peak**2 / (2 * accel)
+    t_cruise = max(length - d_accel - d_decel, 0.0) / peak if peak > 0 else 0.0
+    return t_accel + t_cruise + peak / accel, (peak, t_accel, t_cruise)
+
+
+def _trapezoid_progress(
+    length: float,
+    v0: float,
+    accel: float,
+    plan: tuple[float, float, float],
+    t: float,
+) -> tuple[float, float]:
+    peak, t_accel, t_cruise = plan
+    if t < t_accel:
+        return v0 * t + 0.5 * accel * t**2, v0 + accel * t
+    d_accel = (v0 + peak) / 2 * t_accel
+    if t < t_accel + t_cruise:
+        return d_accel + peak * (t - t_accel), peak
+    t_decel = t - t_accel - t_cruise
+    speed = max(peak - accel * t_decel, 0.0)
+    s = d_accel + peak * t_cruise + (peak + speed) / 2 * t_decel
+    return min(s, length), speed
+
+
+def plan_plane_reference(
+    start: tuple[float, float],
+    end: tuple[float, float],
+    now: float,
+    *,
+    profile: str,
+    max_speed: float,
+    max_accel: float,
+    v0: float = 0.0,
+) -> PlaneReference:
+    """Reference for one segment; ``v0`` is the start speed along it."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown plane reference profile: {profile!r}")
+    max_speed = max(float(max_speed), 1e-3)
+    max_accel = max(float(max_accel), 1e-3)
+    length = math.hypot(end[0] - start[0], end[1] - start[1])
+    # Never start faster than the segment can absorb without overshooting.
+    v0 = min(max(v0, 0.0), max_speed, math.sqrt(max_accel * length))
+    if length <= 0.0:
+        return PlaneReference(start, end, now, 0.0, profile, 0.0, 0.0, max_accel)
+    if profile == "min_jerk":
+        duration = _min_jerk_duration(length, v0, max_speed, max_accel)
+        params = _min_jerk_params(length, v0, duration)
+    else:
+        duration, params = _trapezoid_plan(length, v0, max_speed, max_accel)
+    return PlaneReference(
+        start, end, now, duration, profile, length, v0, max_accel, params
+    )
+
+
+def carried_speed(
+    previous: PlaneReference | None,
+    now: float,
+    start: tuple[float, float],
+    end: tuple[float, float],
+) -> float:
+    """Speed of ``previous`` at ``now`` projected onto the new segment direction."""
+    if previous is None:
+        return 0.0
+    length = math.hypot(end[0] - start[0], end[1] - start[1])
+    if length <= 0.0:
+        return 0.0
+    _, _, vx, vy = previous.sample(now)
+    return max((vx * (end[0] - start[0]) + vy * (end[1] - start[1])) / length, 0.0)
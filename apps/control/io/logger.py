@@ -6,7 +6,6 @@
 import csv
 import os
 from datetime import datetime
-from rich.console import Console
 
 
 # 预定义的字段集合
@@ -248,6 +247,8 @@ class DataLogger:
         """关闭日志文件并创建latest副本"""
         if self.csv_file:
             self.csv_file.close()
+            from rich.console import Console
+
             console = Console()
             console.print(f"[green]✓ 数据已保存至: {self.log_dir}[/green]")
 
@@ -16,9 +16,13 @@
 
 import sys
 import os
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+from apps.control.bootstrap import lazy_import
+
+# pandas/plotly are heavy; they load on first use, not when this module is imported.
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+plotly_subplots = lazy_import("plotly.subplots")
 
 
 def load_data(log_dir):
@@ -69,7 +73,7 @@ def detect_data_type(df):
 
 def create_plane_yaw_plot(df, title="平面+Yaw控制分析"):
     """创建平面+Yaw控制可视化图表"""
-    fig = make_subplots(
+    fig = plotly_subplots.make_subplots(
         rows=4,
         cols=2,
         subplot_titles=(
@@ -327,7 +331,7 @@ def create_plane_yaw_plot(df, title="平面+Yaw控制分析"):
 
 def create_yaw_only_plot(df, title="Yaw角控制分析"):
     """创建Yaw单独控制可视化图表"""
-    fig = make_subplots(
+    fig = plotly_subplots.make_subplots(
         rows=3,
         cols=1,
         subplot_titles=("Yaw角跟踪", "Yaw杆量输出", "Yaw PID分量"),
@@ -442,7 +446,7 @@ def create_yaw_only_plot(df, title="Yaw角控制分析"):
 
 def create_plane_only_plot(df, title="平面位置控制分析"):
     """创建平面位置单独控制可视化图表 (6图布局)"""
-    fig = make_subplots(
+    fig = plotly_subplots.make_subplots(
         rows=3,
         cols=2,
         subplot_titles=(
@@ -658,7 +662,7 @@ def create_plane_only_plot(df, title="平面位置控制分析"):
 
 def create_vertical_plot(df, title="垂直高度控制分析"):
     """创建垂直高度控制可视化图表"""
-    fig = make_subplots(
+    fig = plotly_subplots.make_subplots(
         rows=3,
         cols=1,
         subplot_titles=("高度跟踪", "油门输出", "高度 PID 分量"),
@@ -21,7 +21,7 @@ from rich.console import Console  # noqa: E402
 from rich.panel import Panel  # noqa: E402
 
 from apps.control import config as cfg  # noqa: E402
-from apps.control.core.datasource import create_datasource  # noqa: E402
+from apps.control.core.datasource import create_datasource, create_pose_feed  # noqa: E402
 from apps.control.core.mission_runner import (  # noqa: E402
     MissionPoint,
     MissionSpec,
@@ -30,7 +30,6 @@ from apps.control.core.mission_runner import (  # noqa: E402
     load_mission_from_file,
     run_complex_mission,
 )
-from apps.control.core.pose_service import PoseService  # noqa: E402
 from apps.control.main_takeoff import TakeoffState, _arm_drone, _land, _run_takeoff  # noqa: E402
 
 
@@ -85,7 +84,7 @@ def main(
             wait_for_user=False,
             skip_drc_setup=False,
         )
-        pose_service = PoseService(mqtt, cfg.SLAM_POSE_TOPIC, cfg.SLAM_YAW_TOPIC)
+        pose_service = create_pose_feed(mqtt, cfg.SLAM_POSE_TOPIC, cfg.SLAM_YAW_TOPIC)
 
         _arm_drone(mqtt, console)
         if not _run_takeoff(mqtt, console, state, pose_service, auto_land_on_fail=True):
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+本地位姿总线发布器
+
+功能：
+- 订阅 SLAM 位置 (slam/position) 与 yaw (slam/yaw)，每条消息只解析一次
+- 写入共享内存环形缓冲（apps/control/core/pose_bus.py）
+- main_plane / main_yaw / main_vertical / main_complex 等脚本在 config.POSE_BUS_NAME
+  非空时直接读取总线，不再各自订阅 MQTT
+
+dashboard 设置 POSE_BUS_NAME 时自身即为发布者，无需再运行本脚本。
+
+使用方法：
+1. 在 control/config.py 设置 POSE_BUS_NAME（如 "drone3plot_pose"）
+2. 启动: python -m apps.control.main_pose_bus
+3. 按 Ctrl+C 退出（退出时删除共享内存段）
+"""
+
+import sys
+import time
+from pathlib import Path
+
+if __package__ is None:
+    project_root = Path(__file__).resolve().parents[2]
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+from apps.control.bootstrap import ensure_pydjimqtt
+
+ensure_pydjimqtt()
+
+from pydjimqtt import MQTTClient  # noqa: E402
+from rich.console import Console  # noqa: E402
+
+from apps.control import config as cfg  # noqa: E402
+from apps.control.core.pose_bus import DEFAULT_BUS_NAME, PoseBusWriter  # noqa: E402
+from apps.control.core.pose_service import PoseService  # noqa: E402
+
+REPORT_INTERVAL = 5.0
+
+
+def main() -> int:
+    console = Console()
+    bus_name = cfg.POSE_BUS_NAME or DEFAULT_BUS_NAME
+    try:
+        writer = PoseBusWriter(bus_name)
+    except RuntimeError as e:
+        console.print(f"[red]✗ 位姿总线创建失败: {e}[/red]")
+        return 1
+    console.print(f"[green]✓ 位姿总线已创建: {bus_name}[/green]")
+
+    mqtt_client = MQTTClient(cfg.GATEWAY_SN, cfg.MQTT_CONFIG)
+    try:
+        mqtt_client.connect()
+        console.print(
+            f"[green]✓ MQTT已连接: {cfg.MQTT_CONFIG['host']}:{cfg.MQTT_CONFIG['port']}[/green]"
+        )
+    except Exception as e:
+        console.print(f"[red]✗ MQTT连接失败: {e}[/red]")
+        writer.close()
+        return 1
+
+    PoseService(mqtt_client, cfg.SLAM_POSE_TOPIC, cfg.SLAM_YAW_TOPIC, bus=writer)
+    console.print(
+        f"[green]✓ 已订阅 SLAM: {cfg.SLAM_POSE_TOPIC}, {cfg.SLAM_YAW_TOPIC}[/green]"
+    )
+    console.print("[yellow]提示: 按Ctrl+C可随时退出[/yellow]\n")
+
+    try:
+        last_head = writer.head
+        while True:
+            time.sleep(REPORT_INTERVAL)
+            head = writer.head
+            rate = (head - last_head) / REPORT_INTERVAL
+            last_head = head
+            style = "green" if rate > 0 else "red"
+            console.print(f"[{style}]样本 #{head} | {rate:.1f} Hz[/{style}]")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]收到退出信号[/yellow]")
+    finally:
+        mqtt_client.disconnect()
+        writer.close()
+        console.print("[green]✓ 位姿总线已关闭[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
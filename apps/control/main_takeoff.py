@@ -32,8 +32,8 @@ from rich.console import Console  # noqa: E402
 from rich.panel import Panel  # noqa: E402
 
 from apps.control import config as cfg  # noqa: E402
+from apps.control.core.datasource import create_pose_feed  # noqa: E402
 from apps.control.core.pid import PIDController  # noqa: E402
-from apps.control.core.pose_service import PoseService  # noqa: E402
 
 
 class PoseFeed(Protocol):
@@ -243,7 +243,7 @@ def main(
             skip_drc_setup=False,
         )
 
-        pose_service = PoseService(mqtt, cfg.SLAM_POSE_TOPIC, cfg.SLAM_YAW_TOPIC)
+        pose_service = create_pose_feed(mqtt, cfg.SLAM_POSE_TOPIC, cfg.SLAM_YAW_TOPIC)
 
         if not auto_takeoff:
             console.print(
@@ -19,7 +19,7 @@ from __future__ import annotations
 import time
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 if __package__ is None:
     project_root = Path(__file__).resolve().parents[2]
@@ -34,7 +34,7 @@ from pydjimqtt import MQTTClient, send_stick_control  # noqa: E402
 from rich.console import Console  # noqa: E402
 from rich.panel import Panel  # noqa: E402
 
-from apps.control.core.pose_service import PoseService  # noqa: E402
+from apps.control.core.datasource import create_pose_feed  # noqa: E402
 from apps.control.config import (  # noqa: E402
     GATEWAY_SN,
     MQTT_CONFIG,
@@ -91,10 +91,10 @@ def main() -> int:
         console.print(f"[red]✗ MQTT连接失败: {e}[/red]")
         return 1
 
-    pose_service: Optional[PoseService] = None
+    pose_service: Optional[Any] = None
     slam_zero: Optional[float] = None
     if height_source == "slam":
-        pose_service = PoseService(mqtt_client, SLAM_POSE_TOPIC, SLAM_YAW_TOPIC)
+        pose_service = create_pose_feed(mqtt_client, SLAM_POSE_TOPIC, SLAM_YAW_TOPIC)
         console.print(f"[green]✓ 已订阅 SLAM: {SLAM_POSE_TOPIC}[/green]")
 
     pid = PIDController(
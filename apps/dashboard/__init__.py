@@ -3,22 +3,28 @@
 from __future__ import annotations
 
 import atexit
-import logging
 import os
-import threading
-import time
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
 from flask import Flask
 
 from dashboard.blueprints.api import api_bp
+from dashboard.blueprints.metrics import metrics_bp
 from dashboard.blueprints.ui import ui_bp
 from dashboard.config import CONFIG_FILE_LOADED, CONFIG_FILE_PATH, get_config
 from dashboard.extensions import socketio
+from dashboard.metrics import install_http_metrics
 from dashboard.sockets.events import register_socketio_events
-from dashboard.services.mission_executor import MissionExecutor
-from dashboard.services.runtime_hub import RuntimeHub
+
+if TYPE_CHECKING:
+    from dashboard.services.runtime_remote import (
+        RemoteMissionExecutor,
+        RemoteRuntimeHub,
+    )
+
+RUNTIME_ROLE_WEB = "web"
 
 
 def _inject_pydjimqtt_path() -> None:
@@ -49,15 +55,32 @@ def create_app(config_name: str | None = None) -> Flask:
     cors_origins = app.config.get("CORS_ORIGINS", "*")
     socketio.init_app(app, async_mode="threading", cors_allowed_origins=cors_origins)
 
-    runtime_hub = RuntimeHub(app.config)
-    mission_executor = MissionExecutor(runtime_hub, app.config)
+    role = str(app.config.get("RUNTIME_ROLE", "local") or "local").strip().lower()
+    runtime_hub: RuntimeHub | RemoteRuntimeHub
+    mission_executor: MissionExecutor | RemoteMissionExecutor
+    if role == RUNTIME_ROLE_WEB:
+        from dashboard.services.runtime_remote import connect_remote_runtime
+
+        runtime_hub, mission_executor = connect_remote_runtime(app.config)
+    else:
+        # The local runtime pulls in numpy (waypoints, estimator, optimizer).
+        from dashboard.services.mission_executor import MissionExecutor
+        from dashboard.services.runtime_hub import RuntimeHub
+
+        runtime_hub = RuntimeHub(app.config)
+        mission_executor = MissionExecutor(runtime_hub, app.config)
     app.extensions["runtime_hub"] = runtime_hub
     app.extensions["mission_executor"] = mission_executor
+    app.extensions["scheduler"] = runtime_hub.scheduler
 
     app.register_blueprint(ui_bp, url_prefix="/dashboard")
     app.register_blueprint(api_bp)
+    app.register_blueprint(metrics_bp)
+    install_http_metrics(app)
 
-    register_socketio_events(socketio, runtime_hub, mission_executor)
+    register_socketio_events(
+        socketio, runtime_hub, mission_executor, runtime_hub.scheduler
+    )
 
     def _shutdown_background() -> None:
         mission_executor.shutdown()
@@ -65,21 +88,6 @@ def create_app(config_name: str | None = None) -> Flask:
 
     atexit.register(_shutdown_background)
 
-    def _auto_connect() -> None:
-        logger = logging.getLogger("dashboard")
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                logger.info("[slam] auto-connect attempt %d", attempt)
-                runtime_hub.start_slam()
-                logger.info("[slam] auto-connect succeeded")
-                return
-            except Exception as exc:
-                runtime_hub.slam.stop()
-                logger.warning("[slam] auto-connect failed: %s", exc)
-                time.sleep(2.0)
-
     def _should_start_auto_connect() -> bool:
         # In debug mode, Werkzeug reloader starts a parent watcher process and a
         # child serving process. Only start background workers in the child.
@@ -87,9 +95,8 @@ def create_app(config_name: str | None = None) -> Flask:
             return True
         return os.environ.get("WERKZEUG_RUN_MAIN") == "true"
 
-    if _should_start_auto_connect():
-        threading.Thread(
-            target=_auto_connect, name="mqtt-auto-connect", daemon=True
-        ).start()
+    # Web workers leave SLAM to the runtime daemon.
+    if role != RUNTIME_ROLE_WEB and _should_start_auto_connect():
+        runtime_hub.schedule_slam_auto_connect()
 
     return app
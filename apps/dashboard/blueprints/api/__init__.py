@@ -4,7 +4,17 @@ from __future__ import annotations
 
 from flask import Blueprint
 
-from . import camera, config, control, livestream, logs, mission, telemetry, trajectory
+from . import (
+    camera,
+    config,
+    control,
+    debug,
+    livestream,
+    logs,
+    mission,
+    telemetry,
+    trajectory,
+)
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 api_bp.register_blueprint(telemetry.bp)
@@ -15,3 +25,4 @@ api_bp.register_blueprint(config.bp)
 api_bp.register_blueprint(logs.bp)
 api_bp.register_blueprint(trajectory.bp)
 api_bp.register_blueprint(mission.bp)
+api_bp.register_blueprint(debug.bp)
@@ -28,6 +28,7 @@ def _runtime_state_payload(hub) -> dict:
             "port": drone.port,
             "drc_state": drone.drc_state,
             "last_error": drone.drc_error,
+            "link": drone.link,
         },
     }
 
@@ -0,0 +1,70 @@
+"""Debug endpoints for inspecting the live server."""
+
+from __future__ import annotations
+
+import hmac
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from dashboard.services.profiler import MAX_SECONDS, profile_process
+
+bp = Blueprint("debug_api", __name__)
+
+
+def _authorized() -> tuple[bool, tuple | None]:
+    token = str(current_app.config.get("DEBUG_API_TOKEN", "") or "")
+    if not token:
+        message = "Debug API disabled (set DEBUG_API_TOKEN)."
+        return False, (jsonify({"error": message}), 403)
+    supplied = request.headers.get("X-Debug-Token", "")
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return False, (jsonify({"error": "Invalid debug token."}), 401)
+    return True, None
+
+
+@bp.post("/debug/profile")
+def debug_profile():
+    ok, error = _authorized()
+    if not ok:
+        return error
+    try:
+        seconds = float(request.args.get("seconds", 10))
+        hz = float(request.args.get("hz", 100))
+    except (TypeError, ValueError):
+        return jsonify({"error": "seconds and hz must be numbers."}), 400
+    if seconds <= 0 or seconds > MAX_SECONDS:
+        return jsonify({"error": f"seconds must be in (0, {MAX_SECONDS:g}]."}), 400
+
+    try:
+        sampler = profile_process(seconds, hz)
+    except RuntimeError as exc:
+        return jsonify({"error": str(exc)}), 409
+
+    if request.args.get("format", "collapsed") == "json":
+        payload = sampler.summary()
+        payload["collapsed"] = sampler.collapsed()
+        return jsonify(payload)
+    return Response(sampler.collapsed(), mimetype="text/plain; charset=utf-8")
+
+
+@bp.get("/debug/scheduler")
+def debug_scheduler():
+    ok, error = _authorized()
+    if not ok:
+        return error
+    scheduler = current_app.extensions.get("scheduler")
+    if scheduler is None:
+        return jsonify({"error": "Scheduler not initialized."}), 503
+    return jsonify({"jobs": scheduler.stats()})
+
+
+@bp.get("/debug/mqtt")
+def debug_mqtt():
+    ok, error = _authorized()
+    if not ok:
+        return error
+    hub = current_app.extensions.get("runtime_hub")
+    pool = getattr(hub, "mqtt_pool", None)
+    if pool is None:
+        return jsonify({"error": "MQTT pool not available in this process."}), 503
+    return jsonify({"connections": pool.stats()})
@@ -20,6 +20,20 @@ def mission_start():
     return jsonify({"status": "started", "run_id": run_id, "mission": executor.status()})
 
 
+@bp.post("/mission/resume")
+def mission_resume():
+    """Continue an aborted/failed run from its first incomplete waypoint."""
+    executor = current_app.extensions["mission_executor"]
+    payload = request.get_json(silent=True) or {}
+    try:
+        resumed = executor.resume(payload)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    except RuntimeError as exc:
+        return jsonify({"error": str(exc)}), 409
+    return jsonify({"status": "started", **resumed, "mission": executor.status()})
+
+
 @bp.post("/mission/abort")
 def mission_abort():
     executor = current_app.extensions["mission_executor"]
@@ -35,6 +49,56 @@ def mission_status():
 
 @bp.get("/mission/history")
 def mission_history():
+    """Finished runs, newest first: ?limit=&before=<next_before>&phase=."""
+    executor = current_app.extensions["mission_executor"]
+    try:
+        limit = int(request.args.get("limit", 20))
+        page = executor.history(
+            limit, request.args.get("before") or None, request.args.get("phase") or None
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(page)
+
+
+@bp.get("/mission/runs/<run_id>")
+def mission_run_detail(run_id: str):
     executor = current_app.extensions["mission_executor"]
-    return jsonify({"items": executor.history()})
+    record = executor.run_detail(run_id)
+    if record is None:
+        return jsonify({"error": f"Unknown mission run: {run_id}"}), 404
+    return jsonify(record)
 
+
+@bp.post("/mission/optimize")
+def mission_optimize():
+    """Reorder photo waypoints (payload or current draft) for a shorter flight.
+
+    Non-photo waypoints stay in place; ``start`` defaults to ``return_point``.
+    The draft is not changed: send the returned points to /trajectory or
+    /mission/start to use them.
+    """
+    executor = current_app.extensions["mission_executor"]
+    payload = request.get_json(silent=True) or {}
+    try:
+        result = executor.optimize(payload)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(result)
+
+
+@bp.post("/mission/estimate")
+def mission_estimate():
+    """Predicted duration and battery use of the draft (or payload points).
+
+    Per-leg align / move / settle / vertical / task seconds, takeoff and
+    landing, and whether the route fits the current battery above the
+    reserve. Timings are calibrated from stored runs when there are any.
+    """
+    executor = current_app.extensions["mission_executor"]
+    payload = request.get_json(silent=True) or {}
+    try:
+        estimate = executor.estimate(payload)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(estimate)
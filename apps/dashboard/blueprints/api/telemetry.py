@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, current_app, jsonify, request
+
+from dashboard.services.telemetry_history import parse_fields
 
 bp = Blueprint("telemetry_api", __name__)
 
@@ -15,6 +17,33 @@ def telemetry_snapshot():
     return jsonify(hub.drone.telemetry.latest_dict())
 
 
+@bp.get("/telemetry/history")
+def telemetry_history():
+    """Bucketed min/max/mean series: ?fields=a,b&from=&to=&step= (seconds)."""
+    hub = current_app.extensions["runtime_hub"]
+    if not hub.drone.connected or not hub.drone.telemetry:
+        return jsonify({"error": "Telemetry is not available before drone connect."}), 503
+    try:
+        start = _optional_float(request.args.get("from"))
+        end = _optional_float(request.args.get("to"))
+        step = _optional_float(request.args.get("step"))
+        payload = hub.drone.telemetry.history.query(
+            parse_fields(request.args.get("fields")), start, end, step
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(payload)
+
+
+def _optional_float(raw: str | None) -> float | None:
+    if raw is None or raw == "":
+        return None
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ValueError(f"Invalid number: {raw!r}") from exc
+
+
 @bp.get("/pose")
 def pose_snapshot():
     hub = current_app.extensions["runtime_hub"]
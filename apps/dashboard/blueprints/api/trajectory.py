@@ -3,45 +3,27 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List
 
 from flask import Blueprint, current_app, jsonify, request
 
 bp = Blueprint("trajectory_api", __name__)
 
 
-def _parse_float(value: Any) -> float:
-    return float(value)
-
-
-def _coerce_point(entry: Any) -> Dict[str, Any] | None:
-    if not isinstance(entry, dict):
-        return None
-    try:
-        return {
-            "x": _parse_float(entry.get("x")),
-            "y": _parse_float(entry.get("y")),
-            "z": _parse_float(entry.get("z")),
-            "yaw": _parse_float(entry.get("yaw")),
-            "takePhoto": bool(entry.get("takePhoto", True)),
-        }
-    except (TypeError, ValueError):
-        return None
-
-
 @bp.post("/trajectory")
 def update_trajectory():
+    from dashboard.services.waypoints import WaypointArray, WaypointBounds
+
     payload = request.get_json(force=True) or {}
     points_raw = payload.get("points")
     if not isinstance(points_raw, list):
         return jsonify({"error": "points must be a list."}), 400
 
-    points: List[Dict[str, Any]] = []
-    for entry in points_raw:
-        normalized = _coerce_point(entry)
-        if normalized is None:
-            return jsonify({"error": "Invalid point payload."}), 400
-        points.append(normalized)
+    try:
+        points = WaypointArray.from_payload(
+            points_raw, WaypointBounds.from_config(current_app.config)
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
     trajectory_payload = {
         "trajectory_id": payload.get("trajectory_id") or "current",
@@ -54,9 +36,10 @@ def update_trajectory():
     draft = mission_executor.update_draft(trajectory_payload)
 
     published = False
+    transfer = None
     hub = current_app.extensions["runtime_hub"]
     if hub.drone.connected and hub.drone.trajectory:
-        hub.drone.trajectory.set_http_payload(trajectory_payload)
+        transfer = hub.drone.trajectory.set_http_payload(trajectory_payload)
         published = True
 
     return jsonify(
@@ -64,6 +47,7 @@ def update_trajectory():
             "status": "ok",
             "points": len(points),
             "published": published,
+            "transfer": transfer,
             "draft": draft,
         }
     )
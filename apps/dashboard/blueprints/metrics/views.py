@@ -0,0 +1,16 @@
+"""Metrics text exposition endpoint."""
+
+from __future__ import annotations
+
+from flask import Blueprint, Response
+
+from dashboard.metrics import REGISTRY
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.get("/metrics")
+def metrics():
+    return Response(
+        REGISTRY.render(), mimetype="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -65,6 +65,11 @@ class BaseConfig:
     DRC_HEARTBEAT_INTERVAL: float = float(
         os.getenv("DJI_DRC_HEARTBEAT_INTERVAL", "1.0")
     )
+    DRONE_LINK_CHECK_INTERVAL: float = float(
+        os.getenv("DRONE_LINK_CHECK_INTERVAL", "0.25")
+    )
+    DRONE_RECONNECT_INITIAL: float = float(os.getenv("DRONE_RECONNECT_INITIAL", "0.5"))
+    DRONE_RECONNECT_MAX: float = float(os.getenv("DRONE_RECONNECT_MAX", "10"))
     SLAM_POSE_TOPIC: str = os.getenv("DJI_SLAM_POSE_TOPIC", "slam/position")
     SLAM_YAW_TOPIC: str = os.getenv("DJI_SLAM_YAW_TOPIC", "slam/yaw")
     SLAM_STATUS_TOPIC: str = os.getenv("DJI_SLAM_STATUS_TOPIC", "slam/status")
@@ -74,12 +79,68 @@ class BaseConfig:
     SLAM_MQTT_USERNAME: str = os.getenv("DJI_SLAM_MQTT_USERNAME", "")
     SLAM_MQTT_PASSWORD: str = os.getenv("DJI_SLAM_MQTT_PASSWORD", "")
     TRAJECTORY_MQTT_TOPIC: str = os.getenv("DJI_TRAJECTORY_TOPIC", "uav/trajectory")
-    TRAJECTORY_PUBLISH_RATE: float = float(
-        os.getenv("DJI_TRAJECTORY_PUBLISH_RATE", "1")
+    TRAJECTORY_KEEPALIVE: float = float(
+        os.getenv("DJI_TRAJECTORY_KEEPALIVE", "30")
+    )
+    TRAJECTORY_SIMPLIFY_TOLERANCE_M: float = float(
+        os.getenv("TRAJECTORY_SIMPLIFY_TOLERANCE_M", "0.02")
+    )
+    TRAJECTORY_SIMPLIFY_YAW_DEG: float = float(
+        os.getenv("TRAJECTORY_SIMPLIFY_YAW_DEG", "1.0")
     )
+    TRAJECTORY_CHUNK_POINTS: int = int(os.getenv("TRAJECTORY_CHUNK_POINTS", "500"))
     TELEMETRY_POLL_HZ: float = float(os.getenv("TELEMETRY_POLL_HZ", "2"))
+    TELEMETRY_HISTORY_SECONDS: float = float(
+        os.getenv("TELEMETRY_HISTORY_SECONDS", "3600")
+    )
     SOCKET_RATE_LIMIT: float = float(os.getenv("TELEMETRY_SOCKET_RATE", "0.5"))
     POSE_SOCKET_RATE: float = float(os.getenv("POSE_SOCKET_RATE", "0.2"))
+    TELEMETRY_SOCKET_INTERVAL: float = float(
+        os.getenv("TELEMETRY_SOCKET_INTERVAL", "0.2")
+    )
+    MQTT_RECORD_DIR: str = os.getenv("MQTT_RECORD_DIR", "")
+    MQTT_RECORD_SEGMENT_MB: int = int(os.getenv("MQTT_RECORD_SEGMENT_MB", "256"))
+    SIM_MODE: bool = os.getenv("DASHBOARD_SIM", "0").lower() in {"1", "true", "yes"}
+    SIM_OSD_HZ: float = float(os.getenv("SIM_OSD_HZ", "30"))
+    SIM_POSE_HZ: float = float(os.getenv("SIM_POSE_HZ", "30"))
+    DEBUG_API_TOKEN: str = os.getenv("DEBUG_API_TOKEN", "")
+    MISSION_PROCESS_MODE: str = os.getenv("MISSION_PROCESS_MODE", "thread")
+    MISSION_MAX_ABS_XY: float = float(os.getenv("MISSION_MAX_ABS_XY", "5000"))
+    MISSION_MIN_Z: float = float(os.getenv("MISSION_MIN_Z", "-50"))
+    MISSION_MAX_Z: float = float(os.getenv("MISSION_MAX_Z", "500"))
+    MISSION_DB_PATH: str = os.getenv(
+        "MISSION_DB_PATH", str(Path.home() / ".drone3plot" / "missions.db")
+    )
+    MISSION_DB_MAX_RUNS: int = int(os.getenv("MISSION_DB_MAX_RUNS", "10000"))
+    MISSION_ROUTE_SPEED_XY: float = float(os.getenv("MISSION_ROUTE_SPEED_XY", "0.8"))
+    MISSION_ROUTE_SPEED_Z: float = float(os.getenv("MISSION_ROUTE_SPEED_Z", "0.5"))
+    MISSION_ROUTE_YAW_RATE: float = float(os.getenv("MISSION_ROUTE_YAW_RATE", "45"))
+    MISSION_OPTIMIZE_TIME_BUDGET: float = float(
+        os.getenv("MISSION_OPTIMIZE_TIME_BUDGET", "2.0")
+    )
+    MISSION_OPTIMIZE_MAX_POINTS: int = int(os.getenv("MISSION_OPTIMIZE_MAX_POINTS", "2000"))
+    MISSION_EST_TAKEOFF_S: float = float(os.getenv("MISSION_EST_TAKEOFF_S", "15"))
+    MISSION_EST_LANDING_S: float = float(os.getenv("MISSION_EST_LANDING_S", "15"))
+    MISSION_EST_BATTERY_PCT_PER_MIN: float = float(
+        os.getenv("MISSION_EST_BATTERY_PCT_PER_MIN", "4.0")
+    )
+    MISSION_EST_BATTERY_RESERVE_PCT: float = float(
+        os.getenv("MISSION_EST_BATTERY_RESERVE_PCT", "25")
+    )
+    MISSION_EST_CALIBRATION_RUNS: int = int(os.getenv("MISSION_EST_CALIBRATION_RUNS", "20"))
+    POSE_BUS_NAME: str = os.getenv("DASHBOARD_POSE_BUS", "")
+    RUNTIME_ROLE: str = os.getenv("DASHBOARD_RUNTIME_ROLE", "local")
+    RUNTIME_ADDRESS: str = os.getenv(
+        "DASHBOARD_RUNTIME_ADDRESS", "/tmp/drone3plot-runtime.sock"
+    )
+    RUNTIME_AUTHKEY: str = os.getenv("DASHBOARD_RUNTIME_AUTHKEY", "")
+    RUNTIME_SNAPSHOT_NAME: str = os.getenv(
+        "DASHBOARD_RUNTIME_SNAPSHOT", "drone3plot_runtime"
+    )
+    RUNTIME_SNAPSHOT_INTERVAL: float = float(
+        os.getenv("RUNTIME_SNAPSHOT_INTERVAL", "0.05")
+    )
+    RUNTIME_RPC_TIMEOUT: float = float(os.getenv("RUNTIME_RPC_TIMEOUT", "30"))
     CORS_ORIGINS: str | list[str] = os.getenv("DASHBOARD_CORS_ORIGINS", "*")
     AVAILABLE_LENSES: tuple[str, ...] = ("zoom", "wide", "ir")
 
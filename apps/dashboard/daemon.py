@@ -0,0 +1,48 @@
+"""Headless runtime daemon for ``RUNTIME_ROLE=web`` workers.
+
+Owns the `RuntimeHub`, the `MissionExecutor` and every MQTT client, and
+serves them through `RuntimeServer` until SIGINT/SIGTERM.
+"""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from pathlib import Path
+
+from flask import Config
+
+from dashboard import _inject_pydjimqtt_path
+from dashboard.config import CONFIG_FILE_LOADED, CONFIG_FILE_PATH, get_config
+from dashboard.services.mission_executor import MissionExecutor
+from dashboard.services.runtime_hub import RuntimeHub
+from dashboard.services.runtime_ipc import RuntimeServer
+
+
+def run_runtime_daemon(config_name: str | None = None) -> None:
+    _inject_pydjimqtt_path()
+    # Same keys as `app.config`, without building a Flask app.
+    config = Config(str(Path(__file__).resolve().parent))
+    config.from_object(get_config(config_name))
+    config["CONFIG_FILE_LOADED"] = CONFIG_FILE_LOADED
+    config["CONFIG_FILE_PATH"] = CONFIG_FILE_PATH
+
+    hub = RuntimeHub(config)
+    executor = MissionExecutor(hub, config)
+    server = RuntimeServer.from_config(hub, executor, config)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_args: stop.set())
+
+    server.start()
+    hub.schedule_slam_auto_connect()
+    logging.getLogger("dashboard").info("[runtime] daemon ready")
+    try:
+        while not stop.wait(1.0):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        executor.shutdown()
+        hub.stop_all()
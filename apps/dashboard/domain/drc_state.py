@@ -18,6 +18,7 @@ class DrcEvent(str, Enum):
     CONFIRMED = "confirmed"
     CONFIRM_FAILED = "confirm_failed"
     OFFLINE = "offline"
+    RESUMED = "resumed"
     RESET = "reset"
 
 
@@ -34,6 +35,7 @@ TRANSITIONS = {
     (DrcState.IDLE, DrcEvent.OFFLINE): DrcState.DISCONNECTED,
     (DrcState.IDLE, DrcEvent.RESET): DrcState.IDLE,
     (DrcState.DISCONNECTED, DrcEvent.REQUESTED): DrcState.WAITING,
+    (DrcState.DISCONNECTED, DrcEvent.RESUMED): DrcState.READY,
     (DrcState.DISCONNECTED, DrcEvent.RESET): DrcState.IDLE,
     (DrcState.WAITING, DrcEvent.CONFIRMED): DrcState.READY,
     (DrcState.WAITING, DrcEvent.CONFIRM_FAILED): DrcState.ERROR,
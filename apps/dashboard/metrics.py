@@ -0,0 +1,313 @@
+"""In-process metrics (counters, gauges, histograms) with text exposition.
+
+Rendered at ``GET /metrics`` in the Prometheus text format (0.0.4); nothing
+is pushed anywhere, so scraping is optional.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum.
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(counts)) for key, counts in self._counts.items())
+            sums = dict(self._sums)
+        lines: list[str] = []
+        for key, counts in items:
+            labels = self._format_labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = self._format_labels(key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += counts[-1]
+            le = self._format_labels(key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+
+PROCESS_START_TIME = REGISTRY.gauge(
+    "dashboard_process_start_time_seconds", "Unix time the dashboard process started."
+)
+PROCESS_START_TIME.set(time.time())
+
+MQTT_MESSAGES = REGISTRY.counter(
+    "dashboard_mqtt_messages_total", "MQTT messages received.", ("source", "topic")
+)
+MQTT_PAYLOAD_BYTES = REGISTRY.counter(
+    "dashboard_mqtt_payload_bytes_total", "MQTT payload bytes received.", ("source",)
+)
+POSE_HANDLE_SECONDS = REGISTRY.histogram(
+    "dashboard_pose_handle_seconds", "SLAM pose/yaw message handling time.", ("topic",)
+)
+TELEMETRY_COLLECT_SECONDS = REGISTRY.histogram(
+    "dashboard_telemetry_collect_seconds", "Time to build one telemetry snapshot."
+)
+SOCKET_EMITS = REGISTRY.counter(
+    "dashboard_socket_emits_total",
+    "Socket.IO emits.",
+    ("namespace", "event", "encoding"),
+)
+SOCKET_EMIT_SECONDS = REGISTRY.histogram(
+    "dashboard_socket_emit_seconds",
+    "Socket.IO emit call duration.",
+    ("namespace", "event"),
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "dashboard_http_request_seconds",
+    "HTTP request latency by blueprint.",
+    ("blueprint", "method", "status"),
+)
+MISSION_TICK_SECONDS = REGISTRY.histogram(
+    "dashboard_mission_tick_seconds",
+    "Mission control loop work per tick (excluding sleep).",
+)
+MISSION_TICK_JITTER_SECONDS = REGISTRY.histogram(
+    "dashboard_mission_tick_jitter_seconds",
+    "Deviation of the mission control loop period from its target interval.",
+    ("mode",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1),
+)
+
+DRONE_LINK_DROPS = REGISTRY.counter(
+    "dashboard_drone_link_drops_total", "Drone MQTT transport losses."
+)
+DRONE_LINK_RESTORE_SECONDS = REGISTRY.histogram(
+    "dashboard_drone_link_restore_seconds",
+    "Drone link loss to control restored (reconnect, resubscribe, DRC re-entry).",
+    ("drc",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+def attach_mqtt_metrics(client: Any, source: str) -> None:
+    """Count messages per topic on ``client.client.on_message`` (chained)."""
+
+    mqtt_client = getattr(client, "client", None)
+    if not mqtt_client:
+        return
+    original = mqtt_client.on_message
+
+    def _counting(raw_client, userdata, msg):
+        try:
+            MQTT_MESSAGES.inc(source=source, topic=msg.topic)
+            MQTT_PAYLOAD_BYTES.inc(len(msg.payload or b""), source=source)
+        except Exception as exc:  # noqa: BLE001
+            logging.getLogger("dashboard").debug("[metrics] mqtt tap failed: %s", exc)
+        if original:
+            original(raw_client, userdata, msg)
+
+    mqtt_client.on_message = _counting
+
+
+def install_http_metrics(app: Any) -> None:
+    """Observe per-blueprint request latency via Flask request hooks."""
+
+    from flask import g, request
+
+    @app.before_request
+    def _metrics_start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _metrics_observe(response):
+        started = g.pop("metrics_started", None)
+        if started is not None:
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                blueprint=request.blueprint or "app",
+                method=request.method,
+                status=response.status_code,
+            )
+        return response
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -18,6 +18,9 @@ from dashboard.domain.drc_state import DrcEvent, DrcState, TRANSITIONS
 class DrcControlService:
     """Split DRC flow into request + confirm steps for UI-driven control."""
 
+    # Do not resume a session that would expire this soon after re-entry.
+    RESUME_MARGIN_SEC = 30.0
+
     def __init__(
         self,
         client: MQTTClient,
@@ -43,6 +46,8 @@ class DrcControlService:
         self._state = DrcState.IDLE
         self._last_error: Optional[str] = None
         self._heartbeat_thread: Optional[threading.Thread] = None
+        self._session: Optional[Dict[str, Any]] = None
+        self._resume_pending = False
         self._lock = threading.Lock()
 
     def _transition(self, event: DrcEvent) -> None:
@@ -55,7 +60,8 @@ class DrcControlService:
             if self.is_local_slam_mode:
                 return {"state": self._state.value, "last_error": self._last_error}
             # Keep status() side-effect free: state polling must not stop heartbeat.
-            # Heartbeat lifecycle is controlled only by confirm_control()/shutdown().
+            # The heartbeat is started/stopped by confirm_control()/shutdown() and,
+            # across transport drops, by suspend()/resume() (the link supervisor).
             mqtt_connected = True
             raw_client = getattr(self.client, "client", None)
             if raw_client and hasattr(raw_client, "is_connected"):
@@ -67,6 +73,8 @@ class DrcControlService:
                 DrcState.IDLE,
                 DrcState.WAITING,
             }:
+                if self._state == DrcState.READY:
+                    self._resume_pending = True
                 self._transition(DrcEvent.OFFLINE)
                 self._last_error = "MQTT disconnected."
             return {"state": self._state.value, "last_error": self._last_error}
@@ -144,11 +152,7 @@ class DrcControlService:
                 osd_frequency=self.osd_frequency,
                 hsi_frequency=self.hsi_frequency,
             )
-            if self._heartbeat_thread:
-                stop_heartbeat(self._heartbeat_thread)
-            self._heartbeat_thread = start_heartbeat(
-                self.client, interval=self.heartbeat_interval
-            )
+            self._restart_heartbeat()
         except Exception as exc:
             with self._lock:
                 self._transition(DrcEvent.CONFIRM_FAILED)
@@ -156,13 +160,67 @@ class DrcControlService:
                 return {"state": self._state.value, "last_error": self._last_error}
 
         with self._lock:
+            self._session = mqtt_broker_config
             self._transition(DrcEvent.CONFIRMED)
             return {"state": self._state.value, "last_error": None}
 
+    def suspend(self) -> None:
+        """Transport lost: stop the heartbeat and remember whether DRC was live."""
+
+        self._stop_heartbeat()
+        with self._lock:
+            if self._state == DrcState.READY:
+                self._resume_pending = True
+            self._transition(DrcEvent.OFFLINE)
+            self._last_error = "MQTT disconnected."
+
+    def resume(self) -> bool:
+        """Transport back: re-enter DRC with the confirmed session if still valid.
+
+        Returns True when control was restored without a new auth request.
+        """
+
+        with self._lock:
+            if not self._resume_pending or self._session is None:
+                return False
+            self._resume_pending = False
+            session = self._session
+            if session["expire_time"] - self.RESUME_MARGIN_SEC <= time.time():
+                self._session = None
+                self._last_error = "DRC session expired; request control again."
+                return False
+        try:
+            enter_drc_mode(
+                self.caller,
+                mqtt_broker=session,
+                osd_frequency=self.osd_frequency,
+                hsi_frequency=self.hsi_frequency,
+            )
+            self._restart_heartbeat()
+        except Exception as exc:
+            with self._lock:
+                self._last_error = f"DRC resume failed: {exc}"
+            return False
+        with self._lock:
+            self._transition(DrcEvent.RESUMED)
+            self._last_error = None
+            return self._state == DrcState.READY
+
     def shutdown(self) -> None:
-        if self._heartbeat_thread:
-            stop_heartbeat(self._heartbeat_thread)
-            self._heartbeat_thread = None
+        self._stop_heartbeat()
         with self._lock:
             self._last_error = None
+            self._session = None
+            self._resume_pending = False
             self._transition(DrcEvent.RESET)
+
+    def _restart_heartbeat(self) -> None:
+        self._stop_heartbeat()
+        self._heartbeat_thread = start_heartbeat(
+            self.client, interval=self.heartbeat_interval
+        )
+
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat_thread:
+            stop_heartbeat(self._heartbeat_thread)
+            self._heartbeat_thread = None
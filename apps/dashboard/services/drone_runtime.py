@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-from pydjimqtt.core import MQTTClient, ServiceCaller
+from .link_supervisor import LinkSupervisor
+from .mqtt_pool import MqttConnectionPool, instrumentation_hook
+from .scheduler import shared_scheduler
 
-from .camera import CameraService
-from .control import ControlService
-from .drc import DrcControlService
-from .streaming import StreamingService
-from .telemetry import TelemetryService
-from .trajectory import TrajectoryService
+if TYPE_CHECKING:
+    from pydjimqtt.core import MQTTClient, ServiceCaller
+
+    from .camera import CameraService
+    from .control import ControlService
+    from .drc import DrcControlService
+    from .flight_recorder import FlightRecorder
+    from .mqtt_pool import MqttLease
+    from .scheduler import PeriodicScheduler
+    from .streaming import StreamingService
+    from .telemetry import TelemetryService
+    from .trajectory import TrajectoryService
 
 
 @dataclass(frozen=True)
@@ -24,16 +32,34 @@ class DroneRuntimeStatus:
     port: int
     drc_state: str | None
     drc_error: str | None
+    link: dict[str, Any] | None = None
 
 
 class DroneRuntime:
     """Owns mutable drone-side connection and services."""
 
-    def __init__(self, app_config: Mapping[str, Any], active_config: Mapping[str, Any]):
+    def __init__(
+        self,
+        app_config: Mapping[str, Any],
+        active_config: Mapping[str, Any],
+        recorder: FlightRecorder | None = None,
+        client_factory: Callable[[str, dict[str, Any]], MQTTClient] | None = None,
+        caller_factory: Callable[[MQTTClient], ServiceCaller] | None = None,
+        scheduler: PeriodicScheduler | None = None,
+        mqtt_pool: MqttConnectionPool | None = None,
+    ):
         self._app_config = app_config
         self._active_config = active_config
+        self._recorder = recorder
+        self._client_factory = client_factory
+        self._caller_factory = caller_factory
+        self._scheduler = scheduler
+        self._pool = mqtt_pool or MqttConnectionPool(
+            on_connect=instrumentation_hook(recorder)
+        )
 
-        self.mqtt_client: MQTTClient | None = None
+        self.mqtt_client: MqttLease | None = None
+        self.link: LinkSupervisor | None = None
         self.service_caller: ServiceCaller | None = None
         self.telemetry: TelemetryService | None = None
         self.camera: CameraService | None = None
@@ -49,6 +75,16 @@ class DroneRuntime:
             return
         self._validate_required_config()
 
+        # Deferred so app startup does not pay for pydjimqtt and every service.
+        from pydjimqtt.core import ServiceCaller
+
+        from .camera import CameraService
+        from .control import ControlService
+        from .drc import DrcControlService
+        from .streaming import StreamingService
+        from .telemetry import TelemetryService
+        from .trajectory import TrajectoryService
+
         gateway_sn = str(self._active_config.get("GATEWAY_SN", "") or "").strip()
         host = str(self._active_config.get("MQTT_HOST", "") or "").strip()
         port = int(self._active_config.get("MQTT_PORT", 0))
@@ -59,11 +95,20 @@ class DroneRuntime:
             "username": self._active_config.get("MQTT_USERNAME", ""),
             "password": self._active_config.get("MQTT_PASSWORD", ""),
         }
-        client = MQTTClient(gateway_sn, mqtt_config)
-        client.connect()
+        client = self._pool.acquire(
+            mqtt_config,
+            source="drone",
+            gateway_sn=gateway_sn,
+            client_factory=self._client_factory,
+        )
 
-        caller = ServiceCaller(client)
-        telemetry = TelemetryService(client, poll_hz=float(self._app_config.get("TELEMETRY_POLL_HZ", 2)))
+        caller = (self._caller_factory or ServiceCaller)(client)
+        telemetry = TelemetryService(
+            client,
+            poll_hz=float(self._app_config.get("TELEMETRY_POLL_HZ", 2)),
+            history_seconds=float(self._app_config.get("TELEMETRY_HISTORY_SECONDS", 3600)),
+            scheduler=self._scheduler,
+        )
         telemetry.start()
 
         self.mqtt_client = client
@@ -80,7 +125,15 @@ class DroneRuntime:
         self.trajectory = TrajectoryService(
             client,
             self._app_config.get("TRAJECTORY_MQTT_TOPIC", "uav/trajectory"),
-            publish_rate=float(self._app_config.get("TRAJECTORY_PUBLISH_RATE", 1.0)),
+            keepalive=float(self._app_config.get("TRAJECTORY_KEEPALIVE", 30.0)),
+            simplify_tolerance_m=float(
+                self._app_config.get("TRAJECTORY_SIMPLIFY_TOLERANCE_M", 0.02)
+            ),
+            simplify_tolerance_yaw_deg=float(
+                self._app_config.get("TRAJECTORY_SIMPLIFY_YAW_DEG", 1.0)
+            ),
+            chunk_points=int(self._app_config.get("TRAJECTORY_CHUNK_POINTS", 500)),
+            scheduler=self._scheduler,
         )
         self.drc = DrcControlService(
             client,
@@ -98,9 +151,22 @@ class DroneRuntime:
             hsi_frequency=int(self._app_config.get("DRC_HSI_FREQUENCY", 10)),
             heartbeat_interval=float(self._app_config.get("DRC_HEARTBEAT_INTERVAL", 1.0)),
         )
+        # Link blips reconnect the transport under the live services.
+        self.link = LinkSupervisor(
+            client,
+            self._scheduler or shared_scheduler(),
+            on_lost=self._on_link_lost,
+            on_restored=self._on_link_restored,
+            check_interval=float(self._app_config.get("DRONE_LINK_CHECK_INTERVAL", 0.25)),
+            backoff_initial=float(self._app_config.get("DRONE_RECONNECT_INITIAL", 0.5)),
+            backoff_max=float(self._app_config.get("DRONE_RECONNECT_MAX", 10.0)),
+        )
+        self.link.start()
         self._connected = True
 
     def disconnect(self) -> None:
+        if self.link:
+            self.link.stop()
         if self.telemetry:
             self.telemetry.stop()
         if self.drc:
@@ -114,6 +180,7 @@ class DroneRuntime:
                 pass
 
         self.mqtt_client = None
+        self.link = None
         self.service_caller = None
         self.telemetry = None
         self.camera = None
@@ -142,6 +209,8 @@ class DroneRuntime:
             drc_state = payload.get("state")
             drc_error = payload.get("last_error")
 
+        link = self.link.stats() if self.link else None
+
         state = "DISCONNECTED"
         if self._connected:
             state = "CONNECTED"
@@ -149,6 +218,8 @@ class DroneRuntime:
             state = "AUTH_PENDING"
         if drc_state == "drc_ready":
             state = "DRC_READY"
+        if link and not link["up"]:
+            state = "RECONNECTING"
 
         return DroneRuntimeStatus(
             state=state,
@@ -158,8 +229,21 @@ class DroneRuntime:
             port=port,
             drc_state=drc_state,
             drc_error=drc_error,
+            link=link,
         )
 
+    def _on_link_lost(self) -> None:
+        if self.drc:
+            self.drc.suspend()
+
+    def _on_link_restored(self) -> str:
+        drc = self.drc
+        if drc is None:
+            return "none"
+        if drc.resume():
+            return "resumed"
+        return "lost" if drc.status().get("state") == "disconnected" else "none"
+
     def _validate_required_config(self) -> None:
         gateway_sn = str(self._active_config.get("GATEWAY_SN", "") or "").strip()
         host = str(self._active_config.get("MQTT_HOST", "") or "").strip()
@@ -0,0 +1,329 @@
+"""Append-only MQTT capture ("flight recorder") and time-scaled replay.
+
+A capture is a pair of files:
+
+- ``<name>.d3rec``: ``MAGIC`` followed by records ``<BdHI`` (kind, timestamp,
+  topic id, length) + body. ``kind=0`` defines a topic id (body is
+  ``source\\0topic``), ``kind=1`` is a message (body is the raw payload).
+- ``<name>.d3idx``: sparse index. ``b"T"`` entries repeat topic definitions,
+  ``b"I"`` entries map a timestamp to the byte offset of the first message
+  recorded at or after it (one entry per ``index_interval`` seconds).
+
+Segments roll over at ``max_segment_bytes``; each segment is self-contained.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Protocol
+
+MAGIC = b"D3REC\x01"
+SEGMENT_SUFFIX = ".d3rec"
+INDEX_SUFFIX = ".d3idx"
+
+KIND_TOPIC = 0
+KIND_MESSAGE = 1
+
+_RECORD = struct.Struct("<BdHI")
+_INDEX_TAG = struct.Struct("<c")
+_INDEX_POINT = struct.Struct("<dQ")
+_INDEX_TOPIC = struct.Struct("<HH")
+
+MIN_REPLAY_SPEED = 1.0
+MAX_REPLAY_SPEED = 100.0
+
+
+@dataclass(frozen=True)
+class CapturedMessage:
+    timestamp: float
+    source: str
+    topic: str
+    payload: bytes
+
+
+class FlightRecorder:
+    """Tap MQTT clients and append every received message to a capture."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        index_interval: float = 1.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.index_interval = index_interval
+        self._lock = threading.Lock()
+        self._segment: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._segment_path: Path | None = None
+        self._segment_no = 0
+        self._topics: dict[tuple[str, str], int] = {}
+        self._last_index_at = 0.0
+        self._messages = 0
+        self._closed = False
+        self._stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    @property
+    def path(self) -> Path | None:
+        return self._segment_path
+
+    @property
+    def message_count(self) -> int:
+        return self._messages
+
+    def attach(
+        self,
+        client: Any,
+        source: str,
+        resolve: Callable[[str], str | None] | None = None,
+    ) -> None:
+        """Chain onto ``client.client.on_message`` (same pattern as services).
+
+        ``resolve`` maps a topic to the source that subscribed it on a shared
+        connection; topics it does not know are recorded under ``source``.
+        """
+
+        mqtt_client = getattr(client, "client", None)
+        if not mqtt_client:
+            return
+        original = mqtt_client.on_message
+
+        def _recording(raw_client, userdata, msg):
+            try:
+                tagged = (resolve(msg.topic) if resolve else None) or source
+                self.record(tagged, msg.topic, msg.payload)
+            except Exception as exc:  # noqa: BLE001
+                logging.getLogger("dashboard").warning("[recorder] write failed: %s", exc)
+            if original:
+                original(raw_client, userdata, msg)
+
+        mqtt_client.on_message = _recording
+        logging.getLogger("dashboard").info(
+            "[recorder] capturing source=%s into %s", source, self.directory
+        )
+
+    def record(self, source: str, topic: str, payload: bytes, at: float | None = None) -> None:
+        at = time.time() if at is None else at
+        body = bytes(payload)
+        with self._lock:
+            if self._closed:
+                return
+            if self._segment is None or self._segment.tell() >= self.max_segment_bytes:
+                self._roll_segment()
+            assert self._segment is not None and self._index is not None
+            topic_id = self._topics.get((source, topic))
+            if topic_id is None:
+                topic_id = self._define_topic(source, topic, at)
+            offset = self._segment.tell()
+            self._segment.write(_RECORD.pack(KIND_MESSAGE, at, topic_id, len(body)))
+            self._segment.write(body)
+            self._messages += 1
+            if at - self._last_index_at >= self.index_interval:
+                self._index.write(_INDEX_TAG.pack(b"I") + _INDEX_POINT.pack(at, offset))
+                self._index.flush()
+                self._segment.flush()
+                self._last_index_at = at
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._close_files()
+
+    def _roll_segment(self) -> None:
+        self._close_files()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_no += 1
+        base = self.directory / f"capture-{self._stamp}-{self._segment_no:04d}"
+        self._segment_path = base.with_suffix(SEGMENT_SUFFIX)
+        self._segment = open(self._segment_path, "wb")
+        self._index = open(base.with_suffix(INDEX_SUFFIX), "wb")
+        self._segment.write(MAGIC)
+        self._topics = {}
+        self._last_index_at = 0.0
+
+    def _define_topic(self, source: str, topic: str, at: float) -> int:
+        assert self._segment is not None and self._index is not None
+        topic_id = len(self._topics)
+        if topic_id > 0xFFFF:
+            raise RuntimeError("Too many distinct topics in one segment.")
+        body = f"{source}\0{topic}".encode("utf-8")
+        self._segment.write(_RECORD.pack(KIND_TOPIC, at, topic_id, len(body)))
+        self._segment.write(body)
+        self._index.write(_INDEX_TAG.pack(b"T") + _INDEX_TOPIC.pack(topic_id, len(body)))
+        self._index.write(body)
+        self._topics[(source, topic)] = topic_id
+        return topic_id
+
+    def _close_files(self) -> None:
+        for handle in (self._segment, self._index):
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+        self._segment = None
+        self._index = None
+
+
+class FlightCapture:
+    """Read a recorded segment, optionally seeking through its sparse index."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(INDEX_SUFFIX)
+        self._topics: dict[int, tuple[str, str]] = {}
+        self._points: list[tuple[float, int]] = []
+        if self.index_path.exists():
+            self._load_index()
+
+    @property
+    def topics(self) -> dict[int, tuple[str, str]]:
+        return dict(self._topics)
+
+    def time_range(self) -> tuple[float, float] | None:
+        first = last = None
+        for message in self.messages():
+            if first is None:
+                first = message.timestamp
+            last = message.timestamp
+        if first is None or last is None:
+            return None
+        return first, last
+
+    def messages(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[CapturedMessage]:
+        topics = dict(self._topics)
+        with open(self.path, "rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a flight capture.")
+            offset = self._seek_offset(start) if topics else 0
+            if offset:
+                handle.seek(offset)
+            while True:
+                header = handle.read(_RECORD.size)
+                if len(header) < _RECORD.size:
+                    return
+                kind, at, topic_id, length = _RECORD.unpack(header)
+                body = handle.read(length)
+                if len(body) < length:
+                    return  # Truncated tail (recorder was killed mid-write).
+                if kind == KIND_TOPIC:
+                    source, _, topic = body.decode("utf-8").partition("\0")
+                    topics[topic_id] = (source, topic)
+                    continue
+                if start is not None and at < start:
+                    continue
+                if end is not None and at > end:
+                    return
+                source, topic = topics.get(topic_id, ("", f"#{topic_id}"))
+                yield CapturedMessage(at, source, topic, body)
+
+    def _seek_offset(self, start: float | None) -> int:
+        if start is None:
+            return 0
+        offset = 0
+        for at, point_offset in self._points:
+            if at > start:
+                break
+            offset = point_offset
+        return offset
+
+    def _load_index(self) -> None:
+        data = self.index_path.read_bytes()
+        pos = 0
+        while pos < len(data):
+            (tag,) = _INDEX_TAG.unpack_from(data, pos)
+            pos += _INDEX_TAG.size
+            if tag == b"I":
+                if pos + _INDEX_POINT.size > len(data):
+                    break
+                self._points.append(_INDEX_POINT.unpack_from(data, pos))
+                pos += _INDEX_POINT.size
+            elif tag == b"T":
+                if pos + _INDEX_TOPIC.size > len(data):
+                    break
+                topic_id, length = _INDEX_TOPIC.unpack_from(data, pos)
+                pos += _INDEX_TOPIC.size
+                source, _, topic = data[pos : pos + length].decode("utf-8").partition("\0")
+                self._topics[topic_id] = (source, topic)
+                pos += length
+            else:
+                break
+
+
+class ReplaySink(Protocol):
+    def __call__(self, message: CapturedMessage) -> None: ...
+
+
+@dataclass(frozen=True)
+class ReplayMessage:
+    """Minimal stand-in for ``paho.mqtt.client.MQTTMessage``."""
+
+    topic: str
+    payload: bytes
+    qos: int = 0
+    retain: bool = False
+
+
+def broker_sink(raw_client: Any) -> ReplaySink:
+    """Republish captured messages through a connected paho client."""
+
+    def _publish(message: CapturedMessage) -> None:
+        raw_client.publish(message.topic, message.payload, qos=0)
+
+    return _publish
+
+
+def service_sink(clients: Mapping[str, Any]) -> ReplaySink:
+    """Feed messages straight into the ``on_message`` chain of each source client."""
+
+    def _dispatch(message: CapturedMessage) -> None:
+        client = clients.get(message.source)
+        raw_client = getattr(client, "client", None)
+        handler = getattr(raw_client, "on_message", None)
+        if handler:
+            handler(raw_client, None, ReplayMessage(message.topic, message.payload))
+
+    return _dispatch
+
+
+def replay(
+    capture: FlightCapture,
+    sink: ReplaySink,
+    *,
+    speed: float = 1.0,
+    start: float | None = None,
+    end: float | None = None,
+    stop_event: threading.Event | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Replay a capture at ``speed``× real time; returns messages delivered."""
+
+    if not MIN_REPLAY_SPEED <= speed <= MAX_REPLAY_SPEED:
+        raise ValueError(
+            f"speed must be between {MIN_REPLAY_SPEED:g} and {MAX_REPLAY_SPEED:g}."
+        )
+    delivered = 0
+    first_at: float | None = None
+    wall_start = time.monotonic()
+    for message in capture.messages(start, end):
+        if stop_event is not None and stop_event.is_set():
+            break
+        if first_at is None:
+            first_at = message.timestamp
+        due = (message.timestamp - first_at) / speed
+        wait = due - (time.monotonic() - wall_start)
+        if wait > 0:
+            sleep(wait)
+        sink(message)
+        delivered += 1
+    return delivered
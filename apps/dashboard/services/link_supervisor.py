@@ -0,0 +1,152 @@
+"""Keep a pooled MQTT transport up without tearing down the services on it.
+
+`LinkSupervisor` polls the raw client's ``is_connected()`` on the shared
+scheduler. On loss it calls ``on_lost`` once, then retries
+``lease.reconnect()`` with exponential backoff. Once the transport is back
+(through a retry or the client's own reconnect) it replays the router's
+subscription ledger and calls ``on_restored``, which re-enters DRC when the
+confirmed session is still valid. Loss-to-restored time is recorded in
+``dashboard_drone_link_restore_seconds``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from dashboard.metrics import DRONE_LINK_DROPS, DRONE_LINK_RESTORE_SECONDS
+
+if TYPE_CHECKING:
+    from .mqtt_pool import MqttLease
+    from .scheduler import Job, PeriodicScheduler
+
+
+class LinkSupervisor:
+    """Reconnect one lease's transport with backoff and report restore time."""
+
+    def __init__(
+        self,
+        lease: MqttLease,
+        scheduler: PeriodicScheduler,
+        *,
+        on_lost: Callable[[], None],
+        on_restored: Callable[[], str],
+        check_interval: float = 0.25,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 10.0,
+        name: str = "drone-link",
+    ) -> None:
+        self._lease = lease
+        self._scheduler = scheduler
+        self._on_lost = on_lost
+        self._on_restored = on_restored
+        self._check_interval = max(check_interval, 0.05)
+        self._backoff_initial = max(backoff_initial, 0.05)
+        self._backoff_max = max(backoff_max, self._backoff_initial)
+        self._name = name
+        self._lock = threading.Lock()
+        self._job: Job | None = None
+        self._lost_at: float | None = None
+        self._next_attempt = 0.0
+        self._delay = self._backoff_initial
+        self._drops = 0
+        self._attempts = 0
+        self._last_restore: float | None = None
+        self._last_outcome: str | None = None
+        self._last_error: str | None = None
+
+    def start(self) -> None:
+        # Offloaded: a reconnect attempt blocks for the socket connect timeout.
+        self._job = self._scheduler.add_job(
+            self._name, self._tick, self._check_interval, offload=True
+        )
+
+    def stop(self) -> None:
+        if self._job is not None:
+            self._scheduler.remove_job(self._job)
+            self._job = None
+
+    @property
+    def link_up(self) -> bool:
+        with self._lock:
+            return self._lost_at is None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "up": self._lost_at is None,
+                "down_for_s": None if self._lost_at is None else now - self._lost_at,
+                "next_retry_in_s": (
+                    None if self._lost_at is None else max(self._next_attempt - now, 0.0)
+                ),
+                "drops": self._drops,
+                "reconnect_attempts": self._attempts,
+                "last_restore_s": self._last_restore,
+                "last_drc": self._last_outcome,
+                "last_error": self._last_error,
+            }
+
+    def _connected(self) -> bool:
+        try:
+            return bool(self._lease.client.is_connected())
+        except Exception:  # noqa: BLE001
+            return False
+
+    def _tick(self) -> None:
+        logger = logging.getLogger("dashboard")
+        now = time.monotonic()
+        if self._connected():
+            if self._lost_at is not None:
+                self._restore()
+            return
+
+        if self._lost_at is None:
+            with self._lock:
+                self._lost_at = now
+                self._next_attempt = now
+                self._delay = self._backoff_initial
+                self._drops += 1
+            DRONE_LINK_DROPS.inc()
+            logger.warning("[drone] MQTT link lost; reconnecting")
+            self._on_lost()
+        if now < self._next_attempt:
+            return
+
+        with self._lock:
+            self._attempts += 1
+        try:
+            self._lease.reconnect()
+        except Exception as exc:  # noqa: BLE001
+            with self._lock:
+                self._last_error = str(exc) or type(exc).__name__
+                self._next_attempt = time.monotonic() + self._delay
+                self._delay = min(self._delay * 2.0, self._backoff_max)
+            logger.info(
+                "[drone] reconnect failed (%s); next try in %.1fs",
+                self._last_error,
+                self._next_attempt - time.monotonic(),
+            )
+            return
+        if self._connected():
+            self._restore()
+
+    def _restore(self) -> None:
+        restored = self._lease.router.resubscribe()
+        outcome = self._on_restored()
+        with self._lock:
+            lost_at = self._lost_at or time.monotonic()
+            elapsed = time.monotonic() - lost_at
+            self._lost_at = None
+            self._last_restore = elapsed
+            self._last_outcome = outcome
+            self._last_error = None
+        DRONE_LINK_RESTORE_SECONDS.observe(elapsed, drc=outcome)
+        logging.getLogger("dashboard").info(
+            "[drone] MQTT link restored in %.2fs (resubscribed=%d drc=%s)",
+            elapsed,
+            restored,
+            outcome,
+        )
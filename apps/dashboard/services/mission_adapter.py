@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any, Sequence
 
-from apps.control.core.mission_runner import MissionPoint, MissionSpec
+from .mission_models import MissionSnapshot
+from .waypoints import WaypointArray, WaypointBounds
 
-from .mission_models import MissionSnapshot, MissionWaypoint
+if TYPE_CHECKING:
+    from apps.control.core.mission_runner import MissionSpec
 
 
 class RuntimeHubDataSource:
@@ -66,30 +68,17 @@ class RuntimeHubPoseFeed:
         return payload
 
 
-def parse_mission_waypoints(points_raw: list[dict[str, Any]]) -> list[MissionWaypoint]:
-    points: list[MissionWaypoint] = []
-    for idx, entry in enumerate(points_raw):
-        if not isinstance(entry, dict):
-            raise ValueError(f"Point[{idx}] must be an object.")
-        try:
-            point = MissionWaypoint(
-                x=_require_float(entry.get("x"), idx, "x"),
-                y=_require_float(entry.get("y"), idx, "y"),
-                z=_require_float(entry.get("z"), idx, "z"),
-                yaw=_require_float(entry.get("yaw"), idx, "yaw"),
-                take_photo=bool(entry.get("takePhoto", True)),
-            )
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"Invalid point[{idx}] fields.") from exc
-        points.append(point)
-    return points
+def parse_mission_waypoints(
+    points_raw: Sequence[Any], bounds: WaypointBounds | None = None
+) -> WaypointArray:
+    return WaypointArray.from_payload(points_raw, bounds)
 
 
 def build_snapshot(
     *,
     run_id: str,
     revision: int,
-    points: list[MissionWaypoint],
+    points: WaypointArray,
     options: dict[str, Any] | None = None,
 ) -> MissionSnapshot:
     return MissionSnapshot(
@@ -110,28 +99,47 @@ class ReturnPoint:
     yaw: float = 0.0
     take_photo: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "x": self.x,
+            "y": self.y,
+            "z": self.z,
+            "yaw": self.yaw,
+            "takePhoto": self.take_photo,
+        }
+
+
+def parse_return_point(raw: Any) -> ReturnPoint:
+    """``{"x", "y", "z", "yaw", "takePhoto"}`` (all optional) to a `ReturnPoint`."""
+
+    if not isinstance(raw, dict):
+        return ReturnPoint()
+    try:
+        return ReturnPoint(
+            x=float(raw.get("x", 0.0)),
+            y=float(raw.get("y", 0.0)),
+            z=float(raw.get("z", 1.0)),
+            yaw=float(raw.get("yaw", 0.0)),
+            take_photo=bool(raw.get("takePhoto", False)),
+        )
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid return_point payload.") from exc
+
+
+def to_control_spec(
+    snapshot: MissionSnapshot, return_point: ReturnPoint, start_index: int = 0
+) -> MissionSpec:
+    """Control spec for snapshot waypoints ``[start_index:]`` plus the return point."""
+
+    from apps.control.core.mission_runner import MissionPoint, MissionSpec
 
-def to_control_spec(snapshot: MissionSnapshot, return_point: ReturnPoint) -> MissionSpec:
     if not snapshot.points:
         raise ValueError("Mission snapshot has no waypoints.")
-    points = snapshot.points
-    initial = MissionPoint(
-        x=points[0].x,
-        y=points[0].y,
-        z=points[0].z,
-        yaw=points[0].yaw,
-        take_photo=points[0].take_photo,
-    )
-    waypoints = [
-        MissionPoint(
-            x=point.x,
-            y=point.y,
-            z=point.z,
-            yaw=point.yaw,
-            take_photo=point.take_photo,
-        )
-        for point in points
-    ]
+    if not 0 <= start_index < len(snapshot.points):
+        raise ValueError("No remaining waypoints to fly.")
+    # The control side iterates `MissionPoint`s over the snapshot's array.
+    waypoints = snapshot.points[start_index:].with_point_type(MissionPoint)
+    initial = waypoints[0]
     final = MissionPoint(
         x=return_point.x,
         y=return_point.y,
@@ -150,8 +158,3 @@ def slam_payload_is_fresh(payload: dict[str, Any] | None) -> bool:
         return False
     return all(payload.get(key) is not None for key in ("x", "y", "z", "yaw"))
 
-
-def _require_float(value: Any, idx: int, key: str) -> float:
-    if value is None:
-        raise ValueError(f"Point[{idx}] field '{key}' cannot be null.")
-    return float(value)
@@ -0,0 +1,359 @@
+"""Pre-flight duration and battery estimate for mission drafts.
+
+A mission flies ``start -> waypoints... -> return point``; every leg goes
+through the phases of `step_complex`: align (turn to the leg heading, hold
+``YAW_ARRIVAL_STABLE_TIME``), move, settle (``PLANE_ARRIVAL_STABLE_TIME``),
+vertical (fix height, hold ``VERTICAL_ARRIVAL_STABLE_TIME``) and, for photo
+waypoints, task (turn to the task yaw, hold ``TASK_HOLD_TIME``). Non-photo
+waypoints that qualify for pass-through skip the holds on both sides.
+
+Motion seconds come from `route_optimizer.leg_components`; `calibrate`
+scales them (plus a per-stop settle overhead) by a ridge fit to the arrival
+intervals of stored runs, and takes takeoff, landing and battery drain from
+their phase logs. Without history the nominal profile from config is used.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+from .mission_adapter import parse_return_point
+from .mission_models import MissionPhase, MissionSnapshot
+from .route_optimizer import RouteCostModel, leg_components
+from .waypoints import WAYPOINT_DTYPE, WaypointArray
+
+COMPONENTS = ("align", "move", "vertical", "task")
+_MIN_LEG_M = 1e-6
+# Prior weight of the nominal profile, in typical legs' worth of evidence.
+_PRIOR_LEGS = 1.0
+_SCALE_RANGE = (0.2, 5.0)
+_MIN_BATTERY_RUN_S = 60.0
+
+
+@dataclass(frozen=True)
+class EstimatorProfile:
+    """Rates, holds and overheads used to price a mission, nominal or calibrated."""
+
+    model: RouteCostModel
+    align_hold_s: float
+    arrival_hold_s: float
+    vertical_hold_s: float
+    task_hold_s: float
+    takeoff_s: float
+    landing_s: float
+    battery_pct_per_min: float
+    # Pass-through rules mirrored from the control config.
+    pass_through: bool = True
+    pass_max_dz: float = 0.08
+    pass_max_turn_deg: float = 90.0
+    tolerance_xy: float = 0.1
+    # Fitted multipliers on `COMPONENTS` seconds and extra settle per stop.
+    scales: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+    settle_overhead_s: float = 0.0
+    calibrated_runs: int = 0
+    calibrated_legs: int = 0
+
+    @classmethod
+    def nominal(cls, config: Mapping[str, Any], control: Any = None) -> EstimatorProfile:
+        """Profile from dashboard config and the control module's timers."""
+
+        def ctl(name: str, default: float) -> float:
+            return float(getattr(control, name, default)) if control is not None else default
+
+        arrival_hold = ctl("PLANE_ARRIVAL_STABLE_TIME", 1.0)
+        if str(getattr(control, "PLANE_REF_MODE", "step")) == "step":
+            # Arrival waits for the brake hold too; both timers run together.
+            arrival_hold = max(arrival_hold, ctl("PLANE_BRAKE_HOLD_TIME", 1.0))
+        return cls(
+            model=RouteCostModel.from_config(config),
+            align_hold_s=ctl("YAW_ARRIVAL_STABLE_TIME", 0.5),
+            arrival_hold_s=arrival_hold,
+            vertical_hold_s=ctl("VERTICAL_ARRIVAL_STABLE_TIME", 1.0),
+            task_hold_s=ctl("TASK_HOLD_TIME", 1.0),
+            takeoff_s=float(config.get("MISSION_EST_TAKEOFF_S", 15.0)),
+            landing_s=float(config.get("MISSION_EST_LANDING_S", 15.0)),
+            battery_pct_per_min=float(config.get("MISSION_EST_BATTERY_PCT_PER_MIN", 4.0)),
+            pass_through=bool(getattr(control, "PASS_THROUGH_ENABLED", True)),
+            pass_max_dz=ctl("PASS_THROUGH_MAX_DZ", 0.08),
+            pass_max_turn_deg=ctl("PASS_THROUGH_MAX_TURN_DEG", 90.0),
+            tolerance_xy=ctl("TOLERANCE_XY", 0.1),
+        )
+
+
+def _turn_deg(delta: np.ndarray) -> np.ndarray:
+    return np.abs((delta + 180.0) % 360.0 - 180.0)
+
+
+def _node(x: float, y: float, z: float, yaw: float, take_photo: bool = False) -> np.ndarray:
+    return np.array([(x, y, z, yaw, take_photo)], dtype=WAYPOINT_DTYPE)
+
+
+def route_nodes(
+    points: WaypointArray,
+    start: tuple[float, float, float, float],
+    end: tuple[float, float, float, float, bool],
+) -> np.ndarray:
+    """``[start, waypoints..., return point]`` as one `WAYPOINT_DTYPE` array."""
+
+    return np.concatenate((_node(*start), points.data, _node(*end)))
+
+
+def segment_features(profile: EstimatorProfile, nodes: np.ndarray) -> dict[str, np.ndarray]:
+    """Per-leg motion seconds and hold flags for ``nodes[i] -> nodes[i + 1]``.
+
+    Returns ``components`` (legs x 4, `COMPONENTS` order, unscaled), the
+    boolean masks ``align_hold`` / ``stop`` / ``task`` and ``pass_through``
+    (the leg's destination is flown through).
+    """
+
+    src, dst = nodes[:-1], nodes[1:]
+    legs = len(dst)
+    dx = dst["x"] - src["x"]
+    dy = dst["y"] - src["y"]
+    distance = np.hypot(dx, dy)
+    moving = distance > _MIN_LEG_M
+    heading = np.where(moving, np.degrees(np.arctan2(dy, dx)), dst["yaw"])
+
+    # Leaving a waypoint: photo ones face their task yaw, others the arrival heading.
+    departure = src.copy()
+    departure["yaw"][1:] = np.where(src["take_photo"][1:], src["yaw"][1:], heading[:-1])
+
+    # Same rule as `complex_runtime._pass_through_heading`: any waypoint
+    # (the last one included, not the return point) without photo, with a
+    # small enough turn and the drone's height within `pass_max_dz` of it is
+    # captured without stopping.
+    eligible = np.zeros(legs, dtype=bool)
+    if profile.pass_through and legs > 1:
+        inner = np.arange(legs - 1)
+        next_turn = _turn_deg(heading[inner + 1] - heading[inner])
+        eligible[inner] = (
+            ~dst["take_photo"][inner]
+            & moving[inner]
+            & (distance[inner + 1] > profile.tolerance_xy)
+            & (next_turn <= profile.pass_max_turn_deg)
+        )
+    # Height is only corrected at stops, so a pass-through keeps the height of
+    # the last stop (the start for leg 0) and the gate compares against that.
+    passing = np.zeros(legs, dtype=bool)
+    height = float(src["z"][0])
+    for leg in range(legs):
+        target = float(dst["z"][leg])
+        departure["z"][leg] = height
+        passing[leg] = eligible[leg] and abs(height - target) <= profile.pass_max_dz
+        if not passing[leg]:
+            height = target
+    # After a pass-through the next leg starts already on its heading.
+    after_pass = np.concatenate(([False], passing[:-1]))
+    departure["yaw"] = np.where(after_pass, heading, departure["yaw"])
+
+    parts = leg_components(profile.model, departure, dst)
+    components = np.stack([parts[name] for name in COMPONENTS], axis=1)
+    components[passing, 2:] = 0.0
+    components[after_pass, 0] = 0.0
+    return {
+        "components": components,
+        "align_hold": moving & ~after_pass,
+        "stop": ~passing,
+        "task": dst["take_photo"] & ~passing,
+        "pass_through": passing,
+    }
+
+
+def _hold_seconds(profile: EstimatorProfile, features: dict[str, np.ndarray]) -> np.ndarray:
+    """Fixed timer seconds per leg (legs x 4, `COMPONENTS` order)."""
+
+    holds = np.zeros_like(features["components"])
+    holds[:, 0] = features["align_hold"] * profile.align_hold_s
+    holds[:, 1] = features["stop"] * profile.arrival_hold_s
+    holds[:, 2] = features["stop"] * profile.vertical_hold_s
+    holds[:, 3] = features["task"] * profile.task_hold_s
+    return holds
+
+
+def _interval_rows(
+    profile: EstimatorProfile,
+    snapshot: MissionSnapshot,
+    arrivals: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Regression rows ``(X, y)`` from one run's arrival log.
+
+    The index changes when XY arrival at a waypoint is confirmed, so the
+    interval from arrival ``k`` to ``k + 1`` is leg ``k``'s vertical and task
+    part plus leg ``k + 1``'s align, move and settle. The first entry is
+    logged at loop start and is not an arrival.
+    """
+
+    empty = (np.empty((0, 5)), np.empty(0))
+    if len(arrivals) < 3:
+        return empty
+    home = parse_return_point((snapshot.options or {}).get("return_point"))
+    end = (home.x, home.y, home.z, home.yaw, home.take_photo)
+    first = snapshot.points.data[0]
+    # The real takeoff position is unknown; leg 0 is never used below.
+    start = (float(first["x"]), float(first["y"]), float(first["z"]), float(first["yaw"]))
+    features = segment_features(profile, route_nodes(snapshot.points, start, end))
+    components = features["components"]
+    holds = _hold_seconds(profile, features)
+    legs = len(components)
+
+    index = arrivals["index"][1:]
+    at = arrivals["at"][1:]
+    keep = (index[1:] == index[:-1] + 1) & (index[:-1] >= 0) & (index[1:] < legs)
+    k = index[:-1][keep]
+    observed = (at[1:] - at[:-1])[keep]
+    if not len(k):
+        return empty
+    x = np.zeros((len(k), 5))
+    x[:, 0] = components[k + 1, 0]
+    x[:, 1] = components[k + 1, 1]
+    x[:, 2] = components[k, 2]
+    x[:, 3] = components[k, 3]
+    # Settle overhead is paid at every real stop (the arrival at k + 1).
+    x[:, 4] = features["stop"][k + 1]
+    fixed = holds[k + 1, 0] + holds[k + 1, 1] + holds[k, 2] + holds[k, 3]
+    return x, observed - fixed
+
+
+def _phase_duration(phases: list[tuple[str, float]], first: str, until: str) -> float | None:
+    started = None
+    for phase, at in phases:
+        if phase == first and started is None:
+            started = at
+        elif phase == until and started is not None:
+            return at - started
+    return None
+
+
+def calibrate(
+    profile: EstimatorProfile,
+    runs: Iterable[tuple[dict[str, Any], MissionSnapshot | None, np.ndarray, list]],
+) -> EstimatorProfile:
+    """Fit ``profile`` to stored runs (`MissionStore.recent` rows)."""
+
+    rows_x: list[np.ndarray] = []
+    rows_y: list[np.ndarray] = []
+    takeoff: list[float] = []
+    landing: list[float] = []
+    battery: list[float] = []
+    used = 0
+    for run, snapshot, arrivals, phases in runs:
+        contributed = False
+        if snapshot is not None and len(snapshot.points):
+            x, y = _interval_rows(profile, snapshot, arrivals)
+            if len(y):
+                rows_x.append(x)
+                rows_y.append(y)
+                contributed = True
+        up = _phase_duration(phases, MissionPhase.ARMING.value, MissionPhase.ALIGNING_TO_FIRST.value)
+        down = _phase_duration(phases, MissionPhase.LANDING.value, MissionPhase.COMPLETED.value)
+        if up is not None:
+            takeoff.append(up)
+            contributed = True
+        if down is not None:
+            landing.append(down)
+            contributed = True
+        started, ended = run.get("started_at"), run.get("ended_at")
+        before, after = run.get("battery_start"), run.get("battery_end")
+        if (
+            run.get("phase") == MissionPhase.COMPLETED.value
+            and None not in (started, ended, before, after)
+            and ended - started >= _MIN_BATTERY_RUN_S
+            and before > after
+        ):
+            battery.append((before - after) / ((ended - started) / 60.0))
+            contributed = True
+        used += contributed
+
+    fitted = profile
+    legs = 0
+    if rows_y:
+        x = np.concatenate(rows_x)
+        y = np.concatenate(rows_y)
+        legs = len(y)
+        prior = np.array([*profile.scales, profile.settle_overhead_s])
+        # Ridge toward the prior, each column weighted like `_PRIOR_LEGS` typical legs.
+        weight = _PRIOR_LEGS * np.maximum((x**2).mean(axis=0), 1e-6)
+        theta = np.linalg.solve(x.T @ x + np.diag(weight), x.T @ y + weight * prior)
+        scales = np.clip(theta[:4], *_SCALE_RANGE)
+        fitted = replace(
+            fitted,
+            scales=tuple(float(value) for value in scales),
+            settle_overhead_s=max(float(theta[4]), 0.0),
+        )
+    return replace(
+        fitted,
+        takeoff_s=float(np.median(takeoff)) if takeoff else profile.takeoff_s,
+        landing_s=float(np.median(landing)) if landing else profile.landing_s,
+        battery_pct_per_min=float(np.median(battery)) if battery else profile.battery_pct_per_min,
+        calibrated_runs=used,
+        calibrated_legs=legs,
+    )
+
+
+def estimate_mission(
+    profile: EstimatorProfile,
+    points: WaypointArray,
+    start: tuple[float, float, float, float],
+    end: tuple[float, float, float, float, bool],
+    *,
+    battery_pct: float | None = None,
+    reserve_pct: float = 25.0,
+) -> dict[str, Any]:
+    """Per-leg and total seconds plus battery use for flying ``points``.
+
+    ``battery_pct`` is the pack's current charge; a full pack is assumed
+    when it is unknown.
+    """
+
+    features = segment_features(profile, route_nodes(points, start, end))
+    motion = features["components"] * np.asarray(profile.scales)
+    holds = _hold_seconds(profile, features)
+    settle = holds[:, 1] + features["stop"] * profile.settle_overhead_s
+    totals = motion.sum(axis=1) + holds[:, 0] + settle + holds[:, 2] + holds[:, 3]
+    segments = [
+        {
+            # Waypoint index; ``len(points)`` is the return point.
+            "to": index,
+            "align_s": float(motion[index, 0] + holds[index, 0]),
+            "move_s": float(motion[index, 1]),
+            "settle_s": float(settle[index]),
+            "vertical_s": float(motion[index, 2] + holds[index, 2]),
+            "task_s": float(motion[index, 3] + holds[index, 3]),
+            "total_s": float(totals[index]),
+            "pass_through": bool(features["pass_through"][index]),
+        }
+        for index in range(len(totals))
+    ]
+    flight_s = float(totals.sum())
+    total_s = profile.takeoff_s + flight_s + profile.landing_s
+    rate = max(profile.battery_pct_per_min, 0.0)
+    consumption = rate * total_s / 60.0
+    available = 100.0 if battery_pct is None else float(battery_pct)
+    remaining = available - consumption
+    usable = max(available - reserve_pct, 0.0)
+    return {
+        "segments": segments,
+        "takeoff_s": profile.takeoff_s,
+        "flight_s": flight_s,
+        "landing_s": profile.landing_s,
+        "total_s": total_s,
+        "battery": {
+            "pct_per_min": rate,
+            "consumption_pct": consumption,
+            "current_pct": battery_pct,
+            "reserve_pct": reserve_pct,
+            "remaining_pct": remaining,
+            "max_flight_s": usable / rate * 60.0 if rate > 0 else None,
+            "fits": remaining >= reserve_pct,
+        },
+        "calibration": {
+            "source": "history" if profile.calibrated_runs else "nominal",
+            "runs": profile.calibrated_runs,
+            "legs": profile.calibrated_legs,
+            "scales": dict(zip(COMPONENTS, profile.scales)),
+            "settle_overhead_s": profile.settle_overhead_s,
+        },
+    }
@@ -2,18 +2,13 @@
 
 from __future__ import annotations
 
-from collections import deque
-import copy
 import logging
 import threading
 import time
 import uuid
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from rich.console import Console
-
-from apps.control.core.mission_runner import run_complex_mission
-from apps.control.main_takeoff import TakeoffState, _arm_drone, _land, _run_takeoff
+from dashboard.metrics import MISSION_TICK_JITTER_SECONDS, MISSION_TICK_SECONDS
 
 from .mission_adapter import (
     ReturnPoint,
@@ -21,12 +16,26 @@ from .mission_adapter import (
     RuntimeHubPoseFeed,
     build_snapshot,
     parse_mission_waypoints,
+    parse_return_point,
     slam_payload_is_fresh,
     to_control_spec,
 )
-from .mission_models import MissionPhase, MissionRun, MissionSnapshot
+from .mission_estimator import EstimatorProfile, calibrate, estimate_mission
+from .mission_models import MissionDraft, MissionPhase, MissionRun, MissionSnapshot
+from .mission_store import open_mission_store
+from .route_optimizer import RouteCostModel, optimize_route
+from .waypoints import WaypointArray, WaypointBounds
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from apps.control.core.mission_runner import MissionSpec
+    from apps.control.main_takeoff import TakeoffState
 
 
+MISSION_MODE_THREAD = "thread"
+MISSION_MODE_PROCESS = "process"
+
 _TERMINAL_PHASES = {
     MissionPhase.IDLE,
     MissionPhase.COMPLETED,
@@ -39,6 +48,28 @@ class MissionAbortRequested(Exception):
     """Raised when operator requested mission abort."""
 
 
+class _TickRecorder:
+    """Feed control-loop work time and period jitter into the metrics."""
+
+    def __init__(self, mode: str, interval: float) -> None:
+        self.mode = mode
+        self.interval = interval
+        self._last_at: float | None = None
+
+    def __call__(self, work: float) -> None:
+        now = time.monotonic()
+        period = None if self._last_at is None else now - self._last_at
+        self._last_at = now
+        self.observe(work, period)
+
+    def observe(self, work: float, period: float | None) -> None:
+        MISSION_TICK_SECONDS.observe(work)
+        if period is not None:
+            MISSION_TICK_JITTER_SECONDS.observe(
+                abs(period - self.interval), mode=self.mode
+            )
+
+
 class MissionExecutor:
     """Single-thread mission state machine and background worker."""
 
@@ -46,16 +77,41 @@ class MissionExecutor:
         self._hub = runtime_hub
         self._config = app_config
         self._logger = logging.getLogger("dashboard")
-        self._console = Console()
+        self._console_instance: Console | None = None
         self._lock = threading.Lock()
-        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._store = open_mission_store(
+            str(app_config.get("MISSION_DB_PATH", "") or "").strip(),
+            max_runs=int(app_config.get("MISSION_DB_MAX_RUNS", 10000)),
+            fallback_runs=history_size,
+        )
+        self._arrivals: list[tuple[int, float]] = []
+        self._phases: list[tuple[str, float]] = []
         self._revision = 0
-        self._draft_points: list[dict[str, Any]] = []
-        self._draft_meta: dict[str, Any] = {}
+        self._bounds = WaypointBounds.from_config(app_config)
+        self._draft = MissionDraft(revision=0, points=WaypointArray.empty())
         self._active_snapshot: MissionSnapshot | None = None
         self._active_run = MissionRun(run_id="")
+        # Bumped on every draft/run change; `status()` is rebuilt only then.
+        self._state_version = 0
+        self._status_cache: tuple[int, dict[str, Any]] | None = None
         self._worker: threading.Thread | None = None
         self._abort_event = threading.Event()
+        # Calibrated estimator profile, keyed by the newest stored run id.
+        # Own lock: calibration must not hold up `_lock` (progress callbacks).
+        self._estimator_lock = threading.Lock()
+        self._estimator: tuple[str | None, EstimatorProfile] | None = None
+
+    @property
+    def _console(self) -> Console:
+        # rich is only needed once a mission actually runs.
+        if self._console_instance is None:
+            from rich.console import Console
+
+            self._console_instance = Console()
+        return self._console_instance
+
+    def _changed_locked(self) -> None:
+        self._state_version += 1
 
     def _is_running_locked(self) -> bool:
         phase = self._active_run.phase
@@ -64,31 +120,32 @@ class MissionExecutor:
 
     def update_draft(self, payload: dict[str, Any]) -> dict[str, Any]:
         points_raw = payload.get("points")
-        if not isinstance(points_raw, list):
+        if not isinstance(points_raw, (list, WaypointArray)):
             raise ValueError("points must be a list.")
-        # Validate shape early; keep original JSON-serializable dict for replay.
-        parse_mission_waypoints(points_raw)
+        # Immutable, so snapshots can share it without a copy.
+        points = parse_mission_waypoints(points_raw, self._bounds)
+        meta = {
+            "trajectory_id": payload.get("trajectory_id") or "current",
+            "name": payload.get("name") or "trajectory",
+            "updated_at": payload.get("updated_at") or int(time.time() * 1000),
+        }
         with self._lock:
             self._revision += 1
-            self._draft_points = copy.deepcopy(points_raw)
-            self._draft_meta = {
-                "trajectory_id": payload.get("trajectory_id") or "current",
-                "name": payload.get("name") or "trajectory",
-                "updated_at": payload.get("updated_at") or int(time.time() * 1000),
-            }
-            return {
-                "revision": self._revision,
-                "points": len(self._draft_points),
-                "meta": dict(self._draft_meta),
-            }
+            self._draft = MissionDraft(revision=self._revision, points=points, meta=meta)
+            self._changed_locked()
+            return self._draft.summary
 
     def get_draft(self) -> dict[str, Any]:
+        """The current draft; ``points`` are the validated, normalized waypoints.
+
+        Only x/y/z/yaw/takePhoto survive, as floats/bool, so this is not a
+        byte-for-byte echo of what was submitted.
+        """
+
         with self._lock:
-            return {
-                "revision": self._revision,
-                "points": copy.deepcopy(self._draft_points),
-                "meta": dict(self._draft_meta),
-            }
+            draft = self._draft
+        # Serialized once per revision, outside the lock.
+        return draft.to_dict()
 
     def is_running(self) -> bool:
         with self._lock:
@@ -102,11 +159,11 @@ class MissionExecutor:
                 raise RuntimeError("Mission already running.")
             points_raw = payload.get("points")
             if points_raw is None:
-                points_raw = copy.deepcopy(self._draft_points)
-            if not isinstance(points_raw, list) or len(points_raw) == 0:
+                points_raw = self._draft.points
+            if not isinstance(points_raw, (list, WaypointArray)) or len(points_raw) == 0:
                 raise ValueError("No mission waypoints available.")
 
-            points = parse_mission_waypoints(points_raw)
+            points = parse_mission_waypoints(points_raw, self._bounds)
             self._revision += 1
             run_id = uuid.uuid4().hex[:12]
             return_point = self._resolve_return_point(payload)
@@ -114,33 +171,82 @@ class MissionExecutor:
                 run_id=run_id,
                 revision=self._revision,
                 points=points,
-                options={
-                    "return_point": {
-                        "x": return_point.x,
-                        "y": return_point.y,
-                        "z": return_point.z,
-                        "yaw": return_point.yaw,
-                        "takePhoto": return_point.take_photo,
-                    }
-                },
+                options={"return_point": return_point.to_dict()},
             )
+            self._launch_locked(run_id, snapshot, return_point)
+            return run_id
 
-            self._abort_event.clear()
-            self._active_snapshot = snapshot
-            self._active_run = MissionRun(run_id=run_id)
-            self._active_run.start(
-                total_points=len(snapshot.points) + 1,
-                snapshot_revision=snapshot.revision,
-            )
+    def resume(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Re-fly an interrupted run from its first incomplete waypoint.
+
+        Uses ``payload["run_id"]`` (default: the latest run), its snapshot and
+        ``completed_points``; the active run is used directly, older ones are
+        loaded from the mission store.
+        """
+
+        payload = payload or {}
+        self._validate_runtime_ready()
+        with self._lock:
+            if self._is_running_locked():
+                raise RuntimeError("Mission already running.")
+            source_id = payload.get("run_id") or self._active_run.run_id or None
+            if source_id and source_id == self._active_run.run_id:
+                run = self._active_run.to_dict()
+                snapshot = self._active_snapshot
+            else:
+                source_id = source_id or self._store.latest_run_id()
+                loaded = self._store.load_snapshot(source_id) if source_id else None
+                if loaded is None:
+                    raise ValueError(f"No resumable mission run: {source_id}")
+                run, snapshot = loaded
+            if snapshot is None:
+                raise ValueError(f"Mission run {source_id} has no snapshot.")
+            if run.get("phase") not in {MissionPhase.FAILED.value, MissionPhase.ABORTED.value}:
+                raise ValueError(f"Mission run {source_id} was not interrupted.")
+            start_index = int(run.get("completed_points") or 0)
+            if start_index >= len(snapshot.points):
+                raise ValueError("All waypoints were completed; nothing to resume.")
+            if isinstance(payload.get("return_point"), dict):
+                return_point = self._resolve_return_point(payload)
+            else:
+                return_point = self._resolve_return_point(snapshot.options)
 
-            self._worker = threading.Thread(
-                target=self._run_worker,
-                args=(snapshot, return_point),
-                name=f"mission-executor-{run_id}",
-                daemon=True,
+            run_id = uuid.uuid4().hex[:12]
+            self._launch_locked(
+                run_id, snapshot, return_point, start_index=start_index, resumed_from=source_id
             )
-            self._worker.start()
-            return run_id
+            return {"run_id": run_id, "resumed_from": source_id, "start_index": start_index}
+
+    def _launch_locked(
+        self,
+        run_id: str,
+        snapshot: MissionSnapshot,
+        return_point: ReturnPoint,
+        *,
+        start_index: int = 0,
+        resumed_from: str | None = None,
+    ) -> None:
+        self._abort_event.clear()
+        self._active_snapshot = snapshot
+        self._active_run = MissionRun(run_id=run_id)
+        self._active_run.start(
+            total_points=len(snapshot.points) + 1,
+            snapshot_revision=snapshot.revision,
+            start_index=start_index,
+            resumed_from=resumed_from,
+            battery=self._battery_percent(),
+        )
+        self._arrivals = []
+        self._phases = [(self._active_run.phase.value, time.time())]
+        self._changed_locked()
+
+        self._worker = threading.Thread(
+            target=self._run_worker,
+            args=(run_id, snapshot, return_point, start_index),
+            name=f"mission-executor-{run_id}",
+            daemon=True,
+        )
+        self._worker.start()
 
     def abort(self) -> None:
         with self._lock:
@@ -148,23 +254,105 @@ class MissionExecutor:
                 return
             self._active_run.phase = MissionPhase.ABORTING
             self._active_run.aborted = True
+            self._phases.append((MissionPhase.ABORTING.value, time.time()))
+            self._changed_locked()
         self._abort_event.set()
 
     def status(self) -> dict[str, Any]:
+        """Current run, snapshot and draft summary.
+
+        The dict is cached until the next draft/run change and shared between
+        callers, so polling is O(1); treat it as read-only.
+        """
+
         with self._lock:
-            return {
+            cached = self._status_cache
+            if cached is not None and cached[0] == self._state_version:
+                return cached[1]
+            payload = {
                 "run": self._active_run.to_dict(),
                 "snapshot": self._active_snapshot.to_dict() if self._active_snapshot else None,
-                "draft": {
-                    "revision": self._revision,
-                    "points": len(self._draft_points),
-                    "meta": dict(self._draft_meta),
-                },
+                "draft": self._draft.summary,
             }
+            self._status_cache = (self._state_version, payload)
+            return payload
+
+    def history(
+        self, limit: int = 20, before: str | None = None, phase: str | None = None
+    ) -> dict[str, Any]:
+        """A page of finished runs, newest first (see `MissionStore.page`)."""
+
+        return self._store.page(limit, before, phase)
+
+    def run_detail(self, run_id: str) -> dict[str, Any] | None:
+        return self._store.get(run_id)
+
+    def estimate(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Predicted per-leg and total duration plus battery use for a draft.
+
+        Uses ``payload["points"]`` (default: the current draft), ``start``
+        (default: the return point) and ``return_point``; the profile is
+        calibrated from the last ``MISSION_EST_CALIBRATION_RUNS`` stored runs.
+        """
+
+        points, start, end = self._route_request(payload or {})
+        return estimate_mission(
+            self._estimator_profile(),
+            points,
+            (start.x, start.y, start.z, start.yaw),
+            (end.x, end.y, end.z, end.yaw, end.take_photo),
+            battery_pct=self._battery_percent(),
+            reserve_pct=float(self._config.get("MISSION_EST_BATTERY_RESERVE_PCT", 25.0)),
+        )
+
+    def optimize(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Photo waypoints reordered for a shorter flight (see `optimize_route`).
+
+        Takes the same ``points`` / ``start`` / ``return_point`` as `estimate`;
+        the draft is not changed.
+        """
+
+        points, start, end = self._route_request(payload or {})
+        result = optimize_route(
+            points,
+            (start.x, start.y, start.z, start.yaw),
+            (end.x, end.y, end.z, end.yaw),
+            RouteCostModel.from_config(self._config),
+            time_budget_s=float(self._config.get("MISSION_OPTIMIZE_TIME_BUDGET", 2.0)),
+            max_group_points=int(self._config.get("MISSION_OPTIMIZE_MAX_POINTS", 2000)),
+        )
+        return result.to_dict()
+
+    def _route_request(
+        self, payload: dict[str, Any]
+    ) -> tuple[WaypointArray, ReturnPoint, ReturnPoint]:
+        """Waypoints (payload or draft), start and return point of a planning request."""
 
-    def history(self) -> list[dict[str, Any]]:
-        with self._lock:
-            return list(self._history)
+        points_raw = payload.get("points")
+        if points_raw is None:
+            with self._lock:
+                points_raw = self._draft.points
+        if not isinstance(points_raw, (list, WaypointArray)) or len(points_raw) == 0:
+            raise ValueError("No mission waypoints available.")
+        points = parse_mission_waypoints(points_raw, self._bounds)
+        end = self._resolve_return_point(payload)
+        start = parse_return_point(payload["start"]) if "start" in payload else end
+        return points, start, end
+
+    def _estimator_profile(self) -> EstimatorProfile:
+        from apps.control import config as control_cfg
+
+        with self._estimator_lock:
+            latest = self._store.latest_run_id()
+            cached = self._estimator
+            if cached is not None and cached[0] == latest:
+                return cached[1]
+            profile = EstimatorProfile.nominal(self._config, control_cfg)
+            limit = int(self._config.get("MISSION_EST_CALIBRATION_RUNS", 20))
+            if latest is not None and limit > 0:
+                profile = calibrate(profile, self._store.recent(limit))
+            self._estimator = (latest, profile)
+            return profile
 
     def shutdown(self) -> None:
         self.abort()
@@ -173,24 +361,36 @@ class MissionExecutor:
             worker = self._worker
         if worker and worker.is_alive():
             worker.join(timeout=6.0)
+        self._store.close()
 
-    def _resolve_return_point(self, payload: dict[str, Any]) -> ReturnPoint:
-        raw = payload.get("return_point")
-        if not isinstance(raw, dict):
-            return ReturnPoint()
+    def _battery_percent(self) -> float | None:
+        telemetry = getattr(self._hub.drone, "telemetry", None)
+        if telemetry is None:
+            return None
         try:
-            return ReturnPoint(
-                x=float(raw.get("x", 0.0)),
-                y=float(raw.get("y", 0.0)),
-                z=float(raw.get("z", 1.0)),
-                yaw=float(raw.get("yaw", 0.0)),
-                take_photo=bool(raw.get("takePhoto", False)),
-            )
-        except (TypeError, ValueError) as exc:
-            raise ValueError("Invalid return_point payload.") from exc
+            percent = telemetry.latest().battery.percent
+        except Exception:  # noqa: BLE001
+            return None
+        return None if percent is None else float(percent)
+
+    def _resolve_return_point(self, payload: dict[str, Any]) -> ReturnPoint:
+        return parse_return_point(payload.get("return_point"))
+
+    def _run_worker(
+        self,
+        run_id: str,
+        snapshot: MissionSnapshot,
+        return_point: ReturnPoint,
+        start_index: int = 0,
+    ) -> None:
+        # Control stack (pydjimqtt, rich, typer) loads on the first mission run.
+        from apps.control.main_takeoff import (
+            TakeoffState,
+            _arm_drone,
+            _land,
+            _run_takeoff,
+        )
 
-    def _run_worker(self, snapshot: MissionSnapshot, return_point: ReturnPoint) -> None:
-        run_id = snapshot.run_id
         state = TakeoffState()
         mqtt = None
         try:
@@ -204,7 +404,7 @@ class MissionExecutor:
 
             pose_feed = RuntimeHubPoseFeed(self._hub)
             datasource = RuntimeHubDataSource(self._hub)
-            spec = to_control_spec(snapshot, return_point)
+            spec = to_control_spec(snapshot, return_point, start_index)
 
             self._set_phase(run_id, MissionPhase.ARMING)
             _arm_drone(mqtt, self._console)
@@ -224,16 +424,7 @@ class MissionExecutor:
 
             self._set_phase(run_id, MissionPhase.ALIGNING_TO_FIRST)
             self._set_phase(run_id, MissionPhase.RUNNING_WAYPOINTS)
-            run_complex_mission(
-                mqtt=mqtt,
-                datasource=datasource,
-                console=self._console,
-                spec=spec,
-                should_abort=self._abort_requested,
-                on_progress=lambda idx, total: self._set_progress(
-                    run_id, idx, total
-                ),
-            )
+            self._run_waypoints(run_id, mqtt, datasource, spec, start_index)
             self._raise_if_abort_requested()
 
             self._set_phase(run_id, MissionPhase.RETURNING_HOME)
@@ -250,6 +441,7 @@ class MissionExecutor:
             with self._lock:
                 if self._active_run.run_id == run_id:
                     self._active_run.error = str(exc)
+                    self._changed_locked()
             try:
                 if mqtt is not None:
                     self._set_phase(run_id, MissionPhase.LANDING)
@@ -263,16 +455,97 @@ class MissionExecutor:
                 self._logger.warning("[mission] failure landing failed: %s", landing_exc)
             self._set_phase(run_id, MissionPhase.FAILED)
         finally:
+            record = None
+            battery = self._battery_percent()
             with self._lock:
                 if self._active_run.run_id == run_id:
-                    record = {
-                        "run": self._active_run.to_dict(),
-                        "snapshot": self._active_snapshot.to_dict()
-                        if self._active_snapshot
-                        else None,
-                    }
-                    self._history.appendleft(record)
+                    self._active_run.battery_end = battery
+                    record = (
+                        self._active_run.to_dict(),
+                        self._active_snapshot,
+                        self._arrivals,
+                        self._phases,
+                    )
                     self._worker = None
+            if record is not None:
+                try:
+                    self._store.record(*record)
+                except Exception:  # noqa: BLE001
+                    self._logger.exception("[mission] failed to store run %s", run_id)
+
+    def _mission_mode(self) -> str:
+        mode = str(self._config.get("MISSION_PROCESS_MODE", MISSION_MODE_THREAD)).lower()
+        if mode == MISSION_MODE_PROCESS and getattr(self._hub, "sim", None):
+            # The simulated broker lives in this process; a child cannot reach it.
+            self._logger.warning("[mission] process mode unavailable in sim; using thread")
+            return MISSION_MODE_THREAD
+        return MISSION_MODE_PROCESS if mode == MISSION_MODE_PROCESS else MISSION_MODE_THREAD
+
+    def _run_waypoints(
+        self,
+        run_id: str,
+        mqtt: Any,
+        datasource: Any,
+        spec: MissionSpec,
+        start_index: int = 0,
+    ) -> None:
+        from apps.control import config as control_cfg
+
+        mode = self._mission_mode()
+        ticks = _TickRecorder(mode, 1.0 / control_cfg.CONTROL_FREQUENCY)
+
+        def on_progress(idx: int, total: int) -> None:
+            # The spec starts at `start_index`; report snapshot-relative indexes.
+            self._set_progress(run_id, idx + start_index, total + start_index)
+
+        if mode == MISSION_MODE_THREAD:
+            from apps.control.core.mission_runner import run_complex_mission
+
+            run_complex_mission(
+                mqtt=mqtt,
+                datasource=datasource,
+                console=self._console,
+                spec=spec,
+                should_abort=self._abort_requested,
+                on_progress=on_progress,
+                on_tick=ticks,
+            )
+            return
+
+        from apps.control.core.mission_process import (
+            MissionProcessRequest,
+            run_mission_in_process,
+        )
+        from apps.control.core.pose_shm import PoseBlock
+
+        pose_service = self._hub.slam.pose
+        if pose_service is None:
+            raise RuntimeError("SLAM runtime is not connected.")
+        drone_config = self._hub.get_drone_config()
+        block = PoseBlock.create()
+        pose_service.attach_shared_block(block)
+        try:
+            run_mission_in_process(
+                MissionProcessRequest(
+                    spec=spec,
+                    pose_block=block.name,
+                    gateway_sn=str(drone_config.get("GATEWAY_SN", "")),
+                    mqtt_config={
+                        "host": drone_config.get("MQTT_HOST", ""),
+                        "port": int(drone_config.get("MQTT_PORT", 0) or 0),
+                        "username": drone_config.get("MQTT_USERNAME", ""),
+                        "password": drone_config.get("MQTT_PASSWORD", ""),
+                    },
+                ),
+                should_abort=self._abort_requested,
+                on_progress=on_progress,
+                on_tick=ticks.observe,
+                name=f"mission-process-{run_id}",
+            )
+        finally:
+            pose_service.detach_shared_block(block)
+            block.close()
+            block.unlink()
 
     def _validate_runtime_ready(self) -> None:
         if not self._hub.slam.connected or not self._hub.slam.pose:
@@ -298,19 +571,34 @@ class MissionExecutor:
         with self._lock:
             if self._active_run.run_id != run_id:
                 return
+            if phase != self._active_run.phase:
+                self._phases.append((phase.value, time.time()))
             self._active_run.phase = phase
             if phase in {MissionPhase.COMPLETED, MissionPhase.FAILED, MissionPhase.ABORTED}:
                 self._active_run.finish(phase)
+            if phase == MissionPhase.COMPLETED and self._active_snapshot is not None:
+                self._active_run.completed_points = len(self._active_snapshot.points)
+            self._changed_locked()
 
     def _set_progress(self, run_id: str, current_index: int, total_points: int) -> None:
         with self._lock:
             if self._active_run.run_id != run_id:
                 return
-            self._active_run.current_index = current_index
+            if current_index == self._active_run.current_index and (
+                total_points <= 0 or total_points == self._active_run.total_points
+            ):
+                return
+            if current_index != self._active_run.current_index:
+                self._arrivals.append((current_index, time.time()))
+            snapshot = self._active_snapshot
+            self._active_run.advance(current_index, len(snapshot.points) if snapshot else 0)
             if total_points > 0:
                 self._active_run.total_points = total_points
+            self._changed_locked()
 
     def _handle_abort(self, run_id: str, mqtt: Any, state: TakeoffState) -> None:
+        from apps.control.main_takeoff import _land
+
         self._set_phase(run_id, MissionPhase.ABORTING)
         try:
             if mqtt is not None:
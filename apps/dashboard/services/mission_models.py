@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from .waypoints import WaypointArray
 
 
 class MissionPhase(str, Enum):
@@ -32,32 +36,55 @@ class MissionWaypoint:
     take_photo: bool = True
 
 
+@dataclass(frozen=True)
+class MissionDraft:
+    """One immutable draft revision; serialized forms are built once."""
+
+    revision: int
+    points: WaypointArray
+    meta: Mapping[str, Any] = field(default_factory=dict)
+
+    @cached_property
+    def summary(self) -> dict[str, Any]:
+        return {"revision": self.revision, "points": len(self.points), "meta": dict(self.meta)}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Cached JSON-ready form; shared between callers, do not mutate."""
+
+        return self._dict
+
+    @cached_property
+    def _dict(self) -> dict[str, Any]:
+        return {
+            "revision": self.revision,
+            "points": self.points.to_points(),
+            "meta": dict(self.meta),
+        }
+
+
 @dataclass(frozen=True)
 class MissionSnapshot:
     run_id: str
     revision: int
     created_at: float
-    points: list[MissionWaypoint]
+    points: WaypointArray
     source: str = "dashboard"
     options: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
+        """Cached JSON-ready form; shared between callers, do not mutate."""
+
+        return self._dict
+
+    @cached_property
+    def _dict(self) -> dict[str, Any]:
         return {
             "run_id": self.run_id,
             "revision": self.revision,
             "created_at": self.created_at,
             "source": self.source,
             "options": dict(self.options),
-            "points": [
-                {
-                    "x": point.x,
-                    "y": point.y,
-                    "z": point.z,
-                    "yaw": point.yaw,
-                    "takePhoto": point.take_photo,
-                }
-                for point in self.points
-            ],
+            "points": self.points.to_points(),
         }
 
 
@@ -73,18 +100,45 @@ class MissionRun:
     aborted: bool = False
     snapshot_revision: int | None = None
     snapshot_size: int = 0
+    # Snapshot waypoints [0, completed_points) are done; indexes are snapshot-relative.
+    start_index: int = 0
+    completed_points: int = 0
+    resumed_from: str | None = None
+    # Telemetry battery percent at launch / when the run ended (None if unknown).
+    battery_start: float | None = None
+    battery_end: float | None = None
 
-    def start(self, total_points: int, snapshot_revision: int) -> None:
+    def start(
+        self,
+        total_points: int,
+        snapshot_revision: int,
+        start_index: int = 0,
+        resumed_from: str | None = None,
+        battery: float | None = None,
+    ) -> None:
         self.started_at = time.time()
         self.phase = MissionPhase.VALIDATING
         self.current_index = -1
         self.total_points = total_points
         self.snapshot_revision = snapshot_revision
         self.snapshot_size = total_points
+        self.start_index = start_index
+        self.completed_points = start_index
+        self.resumed_from = resumed_from
+        self.battery_start = battery
+        self.battery_end = None
         self.error = None
         self.aborted = False
         self.ended_at = None
 
+    def advance(self, current_index: int, waypoint_count: int) -> None:
+        """Reaching index ``i`` means every waypoint before it finished its task."""
+
+        self.current_index = current_index
+        self.completed_points = max(
+            self.completed_points, min(current_index, waypoint_count)
+        )
+
     def finish(self, phase: MissionPhase) -> None:
         self.phase = phase
         self.ended_at = time.time()
@@ -101,6 +155,11 @@ class MissionRun:
             "aborted": self.aborted,
             "snapshot_revision": self.snapshot_revision,
             "snapshot_size": self.snapshot_size,
+            "start_index": self.start_index,
+            "completed_points": self.completed_points,
+            "resumed_from": self.resumed_from,
+            "battery_start": self.battery_start,
+            "battery_end": self.battery_end,
             "running": self.phase
             not in {MissionPhase.IDLE, MissionPhase.COMPLETED, MissionPhase.FAILED, MissionPhase.ABORTED},
         }
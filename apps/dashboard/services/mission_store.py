@@ -0,0 +1,307 @@
+"""SQLite store of finished mission runs.
+
+One row per run in ``mission_runs``: the run summary and KPIs as columns /
+JSON, the snapshot's waypoints as the raw `WAYPOINT_DTYPE` bytes, and the
+per-waypoint arrival log as a packed ``(index, at)`` array. The file is
+opened in WAL mode so history reads never block the executor's insert, and
+``(started_at, run_id)`` / ``(phase, started_at)`` indexes back the
+keyset-paginated `MissionStore.page` queries. Rows are written once, from
+the mission worker after the run ends, so the status path never touches
+the database.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from .mission_models import MissionSnapshot
+from .waypoints import WAYPOINT_DTYPE, WaypointArray
+
+SCHEMA_VERSION = 1
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+ARRIVAL_DTYPE = np.dtype([("index", "<i8"), ("at", "<f8")])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mission_runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    phase TEXT NOT NULL,
+    aborted INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    snapshot_revision INTEGER,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    reached_points INTEGER NOT NULL DEFAULT 0,
+    run_json TEXT NOT NULL,
+    kpis_json TEXT NOT NULL,
+    snapshot_json TEXT,
+    points BLOB,
+    arrivals BLOB,
+    phases_json TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_mission_runs_started
+    ON mission_runs (started_at DESC, run_id DESC);
+CREATE INDEX IF NOT EXISTS idx_mission_runs_phase
+    ON mission_runs (phase, started_at DESC, run_id DESC);
+"""
+
+_SUMMARY_COLUMNS = "run_id, started_at, run_json, kpis_json"
+
+
+def mission_kpis(
+    run: dict[str, Any],
+    points: WaypointArray | None,
+    arrivals: Sequence[tuple[int, float]],
+) -> dict[str, Any]:
+    """Duration, waypoints reached, leg times and flown path length of one run."""
+
+    started_at = run.get("started_at")
+    ended_at = run.get("ended_at")
+    log = np.array(list(arrivals), dtype=ARRIVAL_DTYPE)
+    total = int(run.get("total_points") or 0)
+    # An arrival of index i means waypoints < i were reached.
+    reached = total if run.get("phase") == "COMPLETED" else int(log["index"].max(initial=0))
+    legs = np.diff(log["at"]) if len(log) > 1 else np.empty(0)
+    path_length = 0.0
+    if points is not None and len(points) > 1 and reached > 0:
+        # Resumed runs only fly from their start_index.
+        data = points.data[int(run.get("start_index") or 0) : min(reached, len(points))]
+        xyz = np.column_stack((data["x"], data["y"], data["z"]))
+        path_length = float(np.linalg.norm(np.diff(xyz, axis=0), axis=1).sum())
+    return {
+        "duration_s": (
+            None if started_at is None or ended_at is None else ended_at - started_at
+        ),
+        "waypoints_total": total,
+        "waypoints_reached": reached,
+        "flight_s": float(log["at"][-1] - log["at"][0]) if len(log) > 1 else None,
+        "mean_leg_s": float(legs.mean()) if len(legs) else None,
+        "max_leg_s": float(legs.max()) if len(legs) else None,
+        "path_length_m": path_length,
+    }
+
+
+class MissionStore:
+    """Persistent mission run history (``":memory:"`` keeps it per process)."""
+
+    def __init__(self, path: str, *, max_runs: int = 10000) -> None:
+        self.path = path
+        self.max_runs = max(int(max_runs), 1)
+        if path != ":memory:":
+            Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            path = str(Path(path).expanduser())
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def record(
+        self,
+        run: dict[str, Any],
+        snapshot: MissionSnapshot | None,
+        arrivals: Sequence[tuple[int, float]] = (),
+        phases: Sequence[tuple[str, float]] = (),
+    ) -> dict[str, Any]:
+        """Insert (or replace) one finished run; returns its KPIs."""
+
+        points = snapshot.points if snapshot is not None else None
+        kpis = mission_kpis(run, points, arrivals)
+        snapshot_meta = None
+        if snapshot is not None:
+            snapshot_meta = {
+                key: value for key, value in snapshot.to_dict().items() if key != "points"
+            }
+        row = (
+            run["run_id"],
+            run.get("started_at") or 0.0,
+            run.get("ended_at"),
+            run.get("phase"),
+            int(bool(run.get("aborted"))),
+            run.get("error"),
+            run.get("snapshot_revision"),
+            kpis["waypoints_total"],
+            kpis["waypoints_reached"],
+            json.dumps(run),
+            json.dumps(kpis),
+            json.dumps(snapshot_meta) if snapshot_meta is not None else None,
+            points.data.tobytes() if points is not None else None,
+            np.array(list(arrivals), dtype=ARRIVAL_DTYPE).tobytes(),
+            json.dumps([[phase, at] for phase, at in phases]),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mission_runs VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.execute(
+                "DELETE FROM mission_runs WHERE run_id IN ("
+                "SELECT run_id FROM mission_runs "
+                "ORDER BY started_at DESC, run_id DESC LIMIT -1 OFFSET ?)",
+                (self.max_runs,),
+            )
+        return kpis
+
+    def page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+        phase: str | None = None,
+    ) -> dict[str, Any]:
+        """Newest-first run summaries; pass ``next_before`` back for the next page."""
+
+        limit = min(max(int(limit), 1), MAX_PAGE_SIZE)
+        clauses: list[str] = []
+        params: list[Any] = []
+        if phase:
+            clauses.append("phase = ?")
+            params.append(phase.upper())
+        if before:
+            started_at, run_id = _parse_cursor(before)
+            clauses.append("(started_at, run_id) < (?, ?)")
+            params.extend((started_at, run_id))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            f"SELECT {_SUMMARY_COLUMNS} FROM mission_runs {where} "
+            "ORDER BY started_at DESC, run_id DESC LIMIT ?"
+        )
+        params.append(limit + 1)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        items = [
+            {"run": json.loads(row["run_json"]), "kpis": json.loads(row["kpis_json"])}
+            for row in rows[:limit]
+        ]
+        next_before = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_before = f"{last['started_at']!r}:{last['run_id']}"
+        return {"items": items, "next_before": next_before}
+
+    def get(self, run_id: str) -> dict[str, Any] | None:
+        """Full record: run, KPIs, snapshot with points, arrivals and phase log."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM mission_runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        snapshot = None
+        if row["snapshot_json"] is not None:
+            snapshot = json.loads(row["snapshot_json"])
+            data = np.frombuffer(row["points"] or b"", dtype=WAYPOINT_DTYPE)
+            snapshot["points"] = WaypointArray(data).to_points()
+        log = np.frombuffer(row["arrivals"] or b"", dtype=ARRIVAL_DTYPE)
+        at = log["at"].tolist()
+        waypoints = [
+            {
+                "index": index,
+                "arrived_at": at[pos],
+                "leg_s": at[pos + 1] - at[pos] if pos + 1 < len(at) else None,
+            }
+            for pos, index in enumerate(log["index"].tolist())
+        ]
+        return {
+            "run": json.loads(row["run_json"]),
+            "kpis": json.loads(row["kpis_json"]),
+            "snapshot": snapshot,
+            "waypoints": waypoints,
+            "phases": [
+                {"phase": phase, "at": at} for phase, at in json.loads(row["phases_json"] or "[]")
+            ],
+        }
+
+    def latest_run_id(self) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id FROM mission_runs ORDER BY started_at DESC, run_id DESC LIMIT 1"
+            ).fetchone()
+        return None if row is None else row["run_id"]
+
+    def load_snapshot(self, run_id: str) -> tuple[dict[str, Any], MissionSnapshot] | None:
+        """Run summary and its snapshot, points straight from the stored array."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_json, snapshot_json, points FROM mission_runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        if row is None or row["snapshot_json"] is None:
+            return None
+        return json.loads(row["run_json"]), _snapshot_from_row(row)
+
+    def recent(
+        self, limit: int
+    ) -> list[tuple[dict[str, Any], MissionSnapshot | None, np.ndarray, list[tuple[str, float]]]]:
+        """Newest runs as ``(run, snapshot, arrivals, phases)``, for calibration."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_json, snapshot_json, points, arrivals, phases_json "
+                "FROM mission_runs ORDER BY started_at DESC, run_id DESC LIMIT ?",
+                (max(int(limit), 0),),
+            ).fetchall()
+        return [
+            (
+                json.loads(row["run_json"]),
+                _snapshot_from_row(row) if row["snapshot_json"] is not None else None,
+                np.frombuffer(row["arrivals"] or b"", dtype=ARRIVAL_DTYPE),
+                [(phase, at) for phase, at in json.loads(row["phases_json"] or "[]")],
+            )
+            for row in rows
+        ]
+
+
+def open_mission_store(path: str, *, max_runs: int, fallback_runs: int) -> MissionStore:
+    """File store at ``path``; an in-memory one when unset or unusable."""
+
+    if path:
+        try:
+            return MissionStore(path, max_runs=max_runs)
+        except (OSError, sqlite3.Error) as exc:
+            logging.getLogger("dashboard").warning(
+                "[mission] history db %s unavailable (%s); keeping history in memory",
+                path,
+                exc,
+            )
+    return MissionStore(":memory:", max_runs=fallback_runs)
+
+
+def _snapshot_from_row(row: sqlite3.Row) -> MissionSnapshot:
+    meta = json.loads(row["snapshot_json"])
+    return MissionSnapshot(
+        run_id=meta["run_id"],
+        revision=meta["revision"],
+        created_at=meta["created_at"],
+        # frombuffer over the row's bytes is already read-only.
+        points=WaypointArray(np.frombuffer(row["points"] or b"", dtype=WAYPOINT_DTYPE)),
+        source=meta.get("source", "dashboard"),
+        options=meta.get("options") or {},
+    )
+
+
+def _parse_cursor(raw: str) -> tuple[float, str]:
+    started_at, sep, run_id = raw.rpartition(":")
+    try:
+        if not sep:
+            raise ValueError
+        return float(started_at), run_id
+    except ValueError as exc:
+        raise ValueError(f"Invalid history cursor: {raw!r}") from exc
@@ -0,0 +1,519 @@
+"""Shared MQTT connections keyed by broker, with topic-routed subscriptions.
+
+`SlamRuntime` and `DroneRuntime` used to open one `MQTTClient` each even
+when both point at the same broker. `MqttConnectionPool.acquire` hands out
+ref-counted `MqttLease` handles instead; leases for the same
+``(host, port, username, password)`` share one TCP session.
+
+Two kinds of lease:
+
+- gateway leases (``gateway_sn`` set, the drone runtime) need an
+  `MQTTClient` bound to that gateway: its OSD parsing, service caller and
+  DRC handlers chain onto the client's ``on_message`` as before;
+- gateway-agnostic leases (``gateway_sn=None``, SLAM pose) only subscribe
+  topics, through the connection's `TopicRouter`.
+
+Agnostic leases ride on whatever connection the broker has. When a gateway
+lease arrives at a connection opened for agnostic leases, the pool opens
+the gateway client and moves the router (and its subscriptions) over; when
+the gateway lease is released, the router moves to a fresh connection so
+the gateway's chained handlers go away with its client. A lease forwards
+attribute access to the entry's current client, so holders never see the
+swap.
+
+Routes added through a lease are tagged with the lease's source, so the
+flight recorder files each routed message under the runtime that
+subscribed it (SLAM pose stays "slam" on a connection the drone opened);
+other messages go under the source of the connection's client.
+
+The router also keeps a ledger of every filter subscribed on its client
+(the client's own OSD/reply topics included), so `TopicRouter.resubscribe`
+can restore the session after a transport reconnect.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from dashboard.metrics import attach_mqtt_metrics
+
+if TYPE_CHECKING:
+    from .flight_recorder import FlightRecorder
+
+MessageHandler = Callable[[str, bytes], None]
+ClientFactory = Callable[[str, dict[str, Any]], Any]
+ConnectHook = Callable[[Any, str, "TopicRouter"], None]
+
+DEFAULT_PLACEHOLDER_SN = "__mqtt_pool__"
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """MQTT filter match with ``+`` and ``#`` wildcards."""
+
+    pattern_parts = pattern.split("/")
+    topic_parts = topic.split("/")
+    for index, part in enumerate(pattern_parts):
+        if part == "#":
+            return True
+        if index >= len(topic_parts):
+            return False
+        if part != "+" and part != topic_parts[index]:
+            return False
+    return len(pattern_parts) == len(topic_parts)
+
+
+def broker_key(mqtt_config: Mapping[str, Any]) -> tuple[str, int, str, str]:
+    return (
+        str(mqtt_config.get("host", "") or "").strip(),
+        int(mqtt_config.get("port", 0) or 0),
+        str(mqtt_config.get("username", "") or ""),
+        str(mqtt_config.get("password", "") or ""),
+    )
+
+
+def instrumentation_hook(recorder: FlightRecorder | None = None) -> ConnectHook:
+    """Metrics tap (and flight recorder) for every connection the pool opens."""
+
+    def _instrument(client: Any, source: str, router: TopicRouter) -> None:
+        attach_mqtt_metrics(client, source)
+        if recorder:
+            recorder.attach(client, source, resolve=router.owner)
+
+    return _instrument
+
+
+class TopicRouter:
+    """One ``on_message`` entry per connection, dispatching by topic.
+
+    Each filter is subscribed once, however many handlers it has, and is
+    unsubscribed when its last handler goes. Messages are passed on to the
+    handler that was installed before the router (the client's own).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._exact: dict[str, tuple[MessageHandler, ...]] = {}
+        self._wildcard: dict[str, tuple[MessageHandler, ...]] = {}
+        self._qos: dict[str, int] = {}
+        self._raw: Any = None
+        self._downstream: Any = None
+        self._tracked: Any = None
+        self._ledger: dict[str, int] = {}
+        self._owners: dict[str, tuple[tuple[MessageHandler, str], ...]] = {}
+
+    def track(self, raw_client: Any) -> None:
+        """Record every (un)subscribe made on ``raw_client`` from now on."""
+
+        if self._tracked is raw_client:
+            return
+        subscribe = raw_client.subscribe
+        unsubscribe = raw_client.unsubscribe
+        ledger: dict[str, int] = {}
+
+        def _subscribe(topic: Any, qos: int = 0, *args: Any, **kwargs: Any) -> Any:
+            if isinstance(topic, str):
+                ledger[topic] = qos
+            elif isinstance(topic, tuple):
+                ledger[topic[0]] = topic[1]
+            elif isinstance(topic, list):
+                ledger.update(dict(topic))
+            return subscribe(topic, qos, *args, **kwargs)
+
+        def _unsubscribe(topic: Any, *args: Any, **kwargs: Any) -> Any:
+            for name in [topic] if isinstance(topic, str) else list(topic):
+                ledger.pop(name, None)
+            return unsubscribe(topic, *args, **kwargs)
+
+        raw_client.subscribe = _subscribe
+        raw_client.unsubscribe = _unsubscribe
+        with self._lock:
+            self._tracked = raw_client
+            self._ledger = ledger
+
+    def resubscribe(self) -> int:
+        """Re-issue every filter of the bound client (after a reconnect)."""
+
+        with self._lock:
+            raw = self._raw
+            filters = dict(self._ledger) if raw is self._tracked else dict(self._qos)
+        if raw is None:
+            return 0
+        for pattern, qos in filters.items():
+            raw.subscribe(pattern, qos=qos)
+        return len(filters)
+
+    def bind(self, raw_client: Any) -> None:
+        """Install on ``raw_client`` and (re)subscribe every routed filter."""
+
+        self.track(raw_client)
+        with self._lock:
+            self._raw = raw_client
+            self._downstream = raw_client.on_message
+            raw_client.on_message = self._dispatch
+            filters = dict(self._qos)
+        for pattern, qos in filters.items():
+            raw_client.subscribe(pattern, qos=qos)
+
+    def unbind(self) -> None:
+        with self._lock:
+            raw, downstream = self._raw, self._downstream
+            self._raw = None
+            self._downstream = None
+        if raw is not None and raw.on_message is self._dispatch:
+            raw.on_message = downstream
+
+    def add(
+        self,
+        pattern: str,
+        handler: MessageHandler,
+        qos: int = 0,
+        owner: str | None = None,
+    ) -> None:
+        wildcard = "+" in pattern or "#" in pattern
+        with self._lock:
+            if owner is not None:
+                owners = dict(self._owners)
+                owners[pattern] = owners.get(pattern, ()) + ((handler, owner),)
+                self._owners = owners
+            # Copy-on-write: `_dispatch` reads the tables without the lock.
+            table = dict(self._wildcard if wildcard else self._exact)
+            handlers = table.get(pattern, ())
+            table[pattern] = handlers + (handler,)
+            if wildcard:
+                self._wildcard = table
+            else:
+                self._exact = table
+            subscribe = not handlers or qos > self._qos.get(pattern, 0)
+            self._qos[pattern] = max(qos, self._qos.get(pattern, 0))
+            raw = self._raw
+        if subscribe and raw is not None:
+            raw.subscribe(pattern, qos=qos)
+
+    def remove(self, pattern: str, handler: MessageHandler) -> None:
+        wildcard = "+" in pattern or "#" in pattern
+        with self._lock:
+            if pattern in self._owners:
+                owners = dict(self._owners)
+                tagged = tuple(o for o in owners[pattern] if o[0] is not handler)
+                if tagged:
+                    owners[pattern] = tagged
+                else:
+                    del owners[pattern]
+                self._owners = owners
+            table = dict(self._wildcard if wildcard else self._exact)
+            handlers = tuple(h for h in table.get(pattern, ()) if h is not handler)
+            if handlers:
+                table[pattern] = handlers
+            else:
+                table.pop(pattern, None)
+            if wildcard:
+                self._wildcard = table
+            else:
+                self._exact = table
+            if handlers or pattern not in self._qos:
+                return
+            del self._qos[pattern]
+            raw = self._raw
+        if raw is not None:
+            raw.unsubscribe(pattern)
+
+    def topics(self) -> list[str]:
+        with self._lock:
+            return sorted(self._qos)
+
+    def owner(self, topic: str) -> str | None:
+        """Source of the lease whose route matches ``topic``, if any."""
+
+        owners = self._owners
+        tagged = owners.get(topic)
+        if tagged:
+            return tagged[0][1]
+        for pattern, tagged in owners.items():
+            if ("+" in pattern or "#" in pattern) and topic_matches(pattern, topic):
+                return tagged[0][1]
+        return None
+
+    def _dispatch(self, client: Any, userdata: Any, msg: Any) -> None:
+        topic = msg.topic
+        handlers = self._exact.get(topic, ())
+        for pattern, routed in self._wildcard.items():
+            if topic_matches(pattern, topic):
+                handlers += routed
+        for handler in handlers:
+            try:
+                handler(topic, msg.payload)
+            except Exception as exc:  # noqa: BLE001
+                logging.getLogger("dashboard").warning(
+                    "[mqtt] handler for %s failed: %s", topic, exc
+                )
+        downstream = self._downstream
+        if downstream:
+            downstream(client, userdata, msg)
+
+
+class LeaseRouter:
+    """A connection's `TopicRouter` as seen by one lease.
+
+    Routes added here are tagged with the lease's source.
+    """
+
+    def __init__(self, router: TopicRouter, source: str) -> None:
+        self._router = router
+        self._source = source
+
+    def add(self, pattern: str, handler: MessageHandler, qos: int = 0) -> None:
+        self._router.add(pattern, handler, qos, owner=self._source)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._router, name)
+
+
+@dataclass
+class _Entry:
+    key: tuple[str, int, str, str]
+    client: Any
+    gateway_sn: str | None
+    mqtt_config: dict[str, Any]
+    factory: ClientFactory
+    placeholder_sn: str
+    router: TopicRouter = field(default_factory=TopicRouter)
+    leases: set[MqttLease] = field(default_factory=set)
+
+
+class MqttLease:
+    """Ref-counted handle on a pooled `MQTTClient`.
+
+    Attribute access is forwarded to the entry's current client, so a lease
+    can be passed wherever an `MQTTClient` is expected. ``disconnect()``
+    releases the lease; the connection closes with its last lease.
+    """
+
+    def __init__(
+        self, pool: MqttConnectionPool, entry: _Entry, gateway_sn: str | None, source: str
+    ) -> None:
+        self._pool = pool
+        self._entry = entry
+        self.gateway_sn_requested = gateway_sn
+        self.source = source
+        self._released = False
+
+    @property
+    def router(self) -> LeaseRouter:
+        return LeaseRouter(self._entry.router, self.source)
+
+    @property
+    def target(self) -> Any:
+        """The `MQTTClient` currently backing this lease."""
+
+        return self._entry.client
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._entry.client, name)
+
+    def connect(self) -> None:
+        """No-op: the pool connects clients when it opens them."""
+
+    def reconnect(self) -> None:
+        """Re-open the shared transport; subscriptions are not restored here."""
+
+        self._entry.client.client.reconnect()
+
+    def disconnect(self) -> None:
+        self._pool.release(self)
+
+
+class MqttConnectionPool:
+    """Hands out shared, ref-counted MQTT connections keyed by broker."""
+
+    def __init__(
+        self,
+        client_factory: ClientFactory | None = None,
+        on_connect: ConnectHook | None = None,
+    ) -> None:
+        self._client_factory = client_factory
+        self._on_connect = on_connect
+        self._lock = threading.RLock()
+        self._entries: dict[tuple[str, int, str, str], _Entry] = {}
+        self._dedicated: list[_Entry] = []
+
+    def acquire(
+        self,
+        mqtt_config: Mapping[str, Any],
+        *,
+        source: str,
+        gateway_sn: str | None = None,
+        placeholder_sn: str = DEFAULT_PLACEHOLDER_SN,
+        client_factory: ClientFactory | None = None,
+    ) -> MqttLease:
+        key = broker_key(mqtt_config)
+        factory = client_factory or self._factory()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._open(
+                    key, mqtt_config, factory, gateway_sn, placeholder_sn, source
+                )
+                self._entries[key] = entry
+            elif gateway_sn is not None and entry.gateway_sn != gateway_sn:
+                if entry.gateway_sn is None:
+                    self._move(entry, gateway_sn, factory, source)
+                else:
+                    # A second gateway on the same broker gets its own session.
+                    entry = self._open(
+                        key, mqtt_config, factory, gateway_sn, placeholder_sn, source
+                    )
+                    self._dedicated.append(entry)
+            lease = MqttLease(self, entry, gateway_sn, source)
+            entry.leases.add(lease)
+        logging.getLogger("dashboard").info(
+            "[mqtt] lease source=%s broker=%s:%s shared_by=%d",
+            source,
+            key[0],
+            key[1],
+            len(entry.leases),
+        )
+        return lease
+
+    def release(self, lease: MqttLease) -> None:
+        with self._lock:
+            if lease._released:
+                return
+            lease._released = True
+            entry = lease._entry
+            entry.leases.discard(lease)
+            if not entry.leases:
+                self._close(entry)
+                if self._entries.get(entry.key) is entry:
+                    del self._entries[entry.key]
+                if entry in self._dedicated:
+                    self._dedicated.remove(entry)
+                return
+            gateway_left = entry.gateway_sn is not None and not any(
+                other.gateway_sn_requested == entry.gateway_sn for other in entry.leases
+            )
+            if not gateway_left:
+                return
+            # Agnostic leases remain: move them off the gateway's client so its
+            # service caller / DRC handlers are dropped with it.
+            try:
+                self._move(entry, None, entry.factory, next(iter(entry.leases)).source)
+            except Exception as exc:  # noqa: BLE001
+                logging.getLogger("dashboard").warning(
+                    "[mqtt] could not reopen shared connection: %s", exc
+                )
+
+    def stats(self) -> list[dict[str, Any]]:
+        with self._lock:
+            entries = list(self._entries.values()) + list(self._dedicated)
+            return [
+                {
+                    "broker": f"{entry.key[0]}:{entry.key[1]}",
+                    "gateway_sn": entry.gateway_sn,
+                    "leases": sorted(lease.source for lease in entry.leases),
+                    "routed_topics": entry.router.topics(),
+                }
+                for entry in entries
+            ]
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values()) + list(self._dedicated)
+            self._entries.clear()
+            self._dedicated.clear()
+        for entry in entries:
+            for lease in list(entry.leases):
+                lease._released = True
+            entry.leases.clear()
+            self._close(entry)
+
+    def _factory(self) -> ClientFactory:
+        if self._client_factory is not None:
+            return self._client_factory
+        from pydjimqtt.core import MQTTClient
+
+        return MQTTClient
+
+    @staticmethod
+    def _connect(
+        factory: ClientFactory,
+        gateway_sn: str,
+        mqtt_config: Mapping[str, Any],
+        router: TopicRouter,
+    ) -> Any:
+        client = factory(gateway_sn, dict(mqtt_config))
+        if getattr(client, "client", None) is not None:
+            # Catch the client's own connect-time subscriptions in the ledger.
+            router.track(client.client)
+        client.connect()
+        return client
+
+    def _open(
+        self,
+        key: tuple[str, int, str, str],
+        mqtt_config: Mapping[str, Any],
+        factory: ClientFactory,
+        gateway_sn: str | None,
+        placeholder_sn: str,
+        source: str,
+    ) -> _Entry:
+        router = TopicRouter()
+        client = self._connect(
+            factory, gateway_sn or placeholder_sn, mqtt_config, router
+        )
+        entry = _Entry(
+            key=key,
+            client=client,
+            gateway_sn=gateway_sn,
+            mqtt_config=dict(mqtt_config),
+            factory=factory,
+            placeholder_sn=placeholder_sn,
+            router=router,
+        )
+        router.bind(client.client)
+        self._instrument(client, source, router)
+        return entry
+
+    def _move(
+        self, entry: _Entry, gateway_sn: str | None, factory: ClientFactory, source: str
+    ) -> None:
+        old = entry.client
+        client = self._connect(
+            factory, gateway_sn or entry.placeholder_sn, entry.mqtt_config, entry.router
+        )
+        entry.router.unbind()
+        entry.router.bind(client.client)
+        entry.client = client
+        entry.gateway_sn = gateway_sn
+        entry.factory = factory
+        self._instrument(client, source, entry.router)
+        self._disconnect(old)
+        logging.getLogger("dashboard").info(
+            "[mqtt] shared connection %s:%s now gateway=%s",
+            entry.key[0],
+            entry.key[1],
+            gateway_sn or entry.placeholder_sn,
+        )
+
+    def _instrument(self, client: Any, source: str, router: TopicRouter) -> None:
+        if self._on_connect:
+            self._on_connect(client, source, router)
+
+    def _close(self, entry: _Entry) -> None:
+        entry.router.unbind()
+        self._disconnect(entry.client)
+
+    @staticmethod
+    def _disconnect(client: Any) -> None:
+        try:
+            client.disconnect()
+        except Exception:  # noqa: BLE001
+            pass
@@ -6,9 +6,17 @@ import json
 import logging
 import time
 import threading
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from pydjimqtt.core.mqtt_client import MQTTClient
+from dashboard.metrics import POSE_HANDLE_SECONDS
+
+if TYPE_CHECKING:
+    from pydjimqtt.core.mqtt_client import MQTTClient
+
+    from apps.control.core.pose_bus import PoseBusWriter
+    from apps.control.core.pose_shm import PoseBlock
+
+    from .mqtt_pool import LeaseRouter
 
 
 class PoseService:
@@ -44,7 +52,10 @@ class PoseService:
         self._status: Optional[str] = None
         self._last_pose_at = 0.0
         self._last_yaw_at = 0.0
+        self._received_at: Optional[float] = None
+        self._shared_blocks: list[PoseBlock | PoseBusWriter] = []
         self._original_on_message = None
+        self._routes: list[tuple[str, Any]] = []
         if (
             self.pose_topic
             or self.yaw_topic
@@ -56,14 +67,20 @@ class PoseService:
     def _attach_listener(self) -> None:
         if not self.client.client:
             return
+        router = getattr(self.client, "router", None)
+        if router is not None:
+            self._attach_routes(router)
+            return
         logger = logging.getLogger("dashboard")
         self._original_on_message = self.client.client.on_message
 
         def on_message(client, userdata, msg):
             if self.pose_topic and msg.topic == self.pose_topic:
-                self._handle_pose(msg.payload)
+                with POSE_HANDLE_SECONDS.time(topic="pose"):
+                    self._handle_pose(msg.payload)
             if self.yaw_topic and msg.topic == self.yaw_topic:
-                self._handle_yaw(msg.payload)
+                with POSE_HANDLE_SECONDS.time(topic="yaw"):
+                    self._handle_yaw(msg.payload)
             if self.status_topic and msg.topic == self.status_topic:
                 self._handle_status(msg.payload)
             if self.frequency_topic and msg.topic == self.frequency_topic:
@@ -85,6 +102,63 @@ class PoseService:
             self.client.client.subscribe(self.frequency_topic, qos=0)
             logger.info("[slam] subscribed frequency topic: %s", self.frequency_topic)
 
+    def _attach_routes(self, router: LeaseRouter) -> None:
+        """Register on a pooled connection's router instead of its on_message."""
+
+        def timed(handler, label):
+            def _handle(_topic: str, payload: bytes) -> None:
+                with POSE_HANDLE_SECONDS.time(topic=label):
+                    handler(payload)
+
+            return _handle
+
+        routes = (
+            (self.pose_topic, "pose", timed(self._handle_pose, "pose")),
+            (self.yaw_topic, "yaw", timed(self._handle_yaw, "yaw")),
+            (self.status_topic, "status", lambda _t, p: self._handle_status(p)),
+            (self.frequency_topic, "frequency", lambda _t, p: self._handle_frequency(p)),
+        )
+        logger = logging.getLogger("dashboard")
+        for topic, label, handler in routes:
+            if not topic:
+                continue
+            router.add(topic, handler)
+            self._routes.append((topic, handler))
+            logger.info("[slam] subscribed %s topic: %s", label, topic)
+
+    def detach(self) -> None:
+        """Drop router subscriptions (the pooled connection may outlive us)."""
+
+        router = getattr(self.client, "router", None)
+        routes, self._routes = self._routes, []
+        if router is None:
+            return
+        for topic, handler in routes:
+            router.remove(topic, handler)
+
+    def attach_shared_block(self, block: PoseBlock | PoseBusWriter) -> None:
+        """Mirror every pose/yaw update into ``block`` (read by other processes)."""
+
+        with self._lock:
+            self._shared_blocks.append(block)
+            self._write_shared_locked()
+
+    def detach_shared_block(self, block: PoseBlock | PoseBusWriter) -> None:
+        with self._lock:
+            if block in self._shared_blocks:
+                self._shared_blocks.remove(block)
+
+    def _write_shared_locked(self) -> None:
+        updated_at = max(self._last_pose_at, self._last_yaw_at)
+        for block in self._shared_blocks:
+            block.write(
+                self._pose["x"],
+                self._pose["y"],
+                self._pose["z"],
+                self._pose["yaw"],
+                updated_at=updated_at,
+            )
+
     def _handle_pose(self, raw_payload: bytes) -> None:
         try:
             payload = json.loads(raw_payload.decode())
@@ -99,6 +173,8 @@ class PoseService:
             self._pose["y"] = _to_float(y)
             self._pose["z"] = _to_float(z)
             self._last_pose_at = time.monotonic()
+            self._received_at = time.time()
+            self._write_shared_locked()
 
     def _handle_yaw(self, raw_payload: bytes) -> None:
         try:
@@ -110,6 +186,7 @@ class PoseService:
         with self._lock:
             self._pose["yaw"] = _to_float(yaw)
             self._last_yaw_at = time.monotonic()
+            self._write_shared_locked()
 
     def _handle_status(self, raw_payload: bytes) -> None:
         try:
@@ -155,8 +232,11 @@ class PoseService:
                 payload["z"] = None
                 payload["yaw"] = None
                 payload["status"] = "stale"
+                payload["received_at"] = None
             else:
                 payload["status"] = self._status
+                # Wall-clock arrival of the pose sample, for end-to-end latency.
+                payload["received_at"] = self._received_at
             payload["frequency"] = dict(self._frequency)
             return payload
 
@@ -0,0 +1,126 @@
+"""Wall-clock sampling profiler over every thread of the running process."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+MAX_SECONDS = 60.0
+MAX_HZ = 1000.0
+
+
+class StackSampler:
+    """Periodically snapshot ``sys._current_frames()`` into collapsed stacks.
+
+    Each sample is keyed ``thread-name;outer;...;inner`` so the output can be
+    fed to ``flamegraph.pl`` or speedscope directly. Samples are wall-clock:
+    threads blocked in ``sleep``/``wait`` show up too, which is what we want
+    when looking for loops that hold the GIL or stall.
+    """
+
+    def __init__(self, hz: float = 100.0) -> None:
+        self.hz = min(max(hz, 1.0), MAX_HZ)
+        self.samples: Counter[str] = Counter()
+        self.sample_count = 0
+
+    def run(self, seconds: float) -> Counter[str]:
+        seconds = min(max(seconds, 0.1), MAX_SECONDS)
+        interval = 1.0 / self.hz
+        own_ident = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        next_at = time.monotonic()
+        while time.monotonic() < deadline:
+            self._sample(own_ident)
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (GIL contention); don't burst to catch up.
+                next_at = time.monotonic()
+        return self.samples
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+    def summary(self, top: int = 20) -> dict[str, Any]:
+        threads: Counter[str] = Counter()
+        leaves: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            parts = stack.split(";")
+            threads[parts[0]] += count
+            leaves[parts[-1]] += count
+        return {
+            "hz": self.hz,
+            "samples": self.sample_count,
+            "threads": dict(threads.most_common()),
+            "top_frames": [
+                {"frame": frame, "samples": count}
+                for frame, count in leaves.most_common(top)
+            ],
+        }
+
+    def _sample(self, own_ident: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        for ident, frame in frames.items():
+            if ident == own_ident:
+                continue
+            name = names.get(ident, f"thread-{ident}")
+            stack = ";".join([name.replace(";", ":")] + _frame_labels(frame))
+            self.samples[stack] += 1
+        self.sample_count += 1
+
+
+_profile_lock = threading.Lock()
+
+
+def profile_process(seconds: float, hz: float = 100.0) -> StackSampler:
+    """Sample all threads for ``seconds``; only one profile runs at a time."""
+
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("A profile is already running.")
+    try:
+        sampler = StackSampler(hz)
+        sampler.run(seconds)
+        return sampler
+    finally:
+        _profile_lock.release()
+
+
+def _frame_labels(frame: FrameType | None) -> list[str]:
+    labels: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        location = f"{_short_path(code.co_filename)}:{code.co_firstlineno}"
+        labels.append(f"{code.co_name} ({location})")
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+_path_cache: dict[str, str] = {}
+
+
+def _short_path(filename: str) -> str:
+    cached = _path_cache.get(filename)
+    if cached is not None:
+        return cached
+    path = Path(filename)
+    try:
+        short = str(path.resolve().relative_to(PROJECT_ROOT))
+    except (ValueError, OSError):
+        parts = path.parts
+        short = "/".join(parts[-2:]) if len(parts) >= 2 else filename
+    short = short.replace(";", ":")
+    _path_cache[filename] = short
+    return short
@@ -0,0 +1,265 @@
+"""Waypoint order optimization for mission drafts.
+
+The cost of flying waypoint ``i`` -> ``j`` follows what `step_complex` does
+on every leg: turn to face ``j`` (align), fly the XY distance (move), fix
+the height (vertical) and, for a photo waypoint, turn to its task yaw.
+`RouteCostModel` turns those into seconds; constant per-leg holds do not
+change the best order and are left to the estimator.
+
+`optimize_route` keeps non-photo waypoints in place as fixed anchors and
+reorders the photo waypoints between each pair of anchors (the start
+position and the return point are the outer anchors). Each group is solved
+over a precomputed NumPy cost matrix: nearest-neighbour construction, then
+2-opt and Or-opt moves evaluated for one position against all others at
+once. Costs are asymmetric (yaw), so 2-opt prices the reversed segment from
+a prefix sum of reversed legs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Any, Mapping
+
+import numpy as np
+
+from .waypoints import WAYPOINT_DTYPE, WaypointArray
+
+DEFAULT_TIME_BUDGET_S = 2.0
+DEFAULT_MAX_GROUP_POINTS = 2000
+_MIN_LEG_M = 1e-6
+_IMPROVEMENT_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class RouteCostModel:
+    """Nominal flight rates used to price a leg (m/s, m/s, deg/s)."""
+
+    speed_xy: float = 0.8
+    speed_z: float = 0.5
+    yaw_rate: float = 45.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> RouteCostModel:
+        return cls(
+            speed_xy=float(config.get("MISSION_ROUTE_SPEED_XY", cls.speed_xy)),
+            speed_z=float(config.get("MISSION_ROUTE_SPEED_Z", cls.speed_z)),
+            yaw_rate=float(config.get("MISSION_ROUTE_YAW_RATE", cls.yaw_rate)),
+        )
+
+
+def _turn_deg(delta: np.ndarray) -> np.ndarray:
+    return np.abs((delta + 180.0) % 360.0 - 180.0)
+
+
+def leg_components(
+    model: RouteCostModel,
+    src: np.ndarray,
+    dst: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Seconds of align / move / vertical / task for legs ``src`` -> ``dst``.
+
+    ``src`` and ``dst`` are `WAYPOINT_DTYPE` arrays that broadcast against
+    each other (``a[:, None]`` / ``a[None, :]`` gives the full matrix). A leg
+    leaves with the source's yaw and only photo destinations pay the task turn.
+    """
+
+    dx = dst["x"] - src["x"]
+    dy = dst["y"] - src["y"]
+    distance = np.hypot(dx, dy)
+    moving = distance > _MIN_LEG_M
+    heading = np.degrees(np.arctan2(dy, dx))
+    # No translation: no align turn, the task turn starts from the source yaw.
+    heading = np.where(moving, heading, src["yaw"])
+    yaw_rate = max(model.yaw_rate, 1e-6)
+    return {
+        "align": np.where(moving, _turn_deg(heading - src["yaw"]), 0.0) / yaw_rate,
+        "move": distance / max(model.speed_xy, 1e-6),
+        "vertical": np.abs(dst["z"] - src["z"]) / max(model.speed_z, 1e-6),
+        "task": np.where(dst["take_photo"], _turn_deg(dst["yaw"] - heading), 0.0) / yaw_rate,
+    }
+
+
+def leg_seconds(model: RouteCostModel, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    parts = leg_components(model, src, dst)
+    return parts["align"] + parts["move"] + parts["vertical"] + parts["task"]
+
+
+def _nearest_neighbour(cost: np.ndarray) -> np.ndarray:
+    """Open path from node 0 to node ``n - 1`` through every node."""
+
+    count = len(cost)
+    path = np.empty(count, dtype=np.int64)
+    path[0], path[-1] = 0, count - 1
+    unvisited = np.ones(count, dtype=bool)
+    unvisited[[0, count - 1]] = False
+    current = 0
+    for position in range(1, count - 1):
+        row = np.where(unvisited, cost[current], np.inf)
+        current = int(np.argmin(row))
+        path[position] = current
+        unvisited[current] = False
+    return path
+
+
+def _two_opt_pass(cost: np.ndarray, path: np.ndarray, deadline: float) -> bool:
+    """Apply every improving segment reversal found in one sweep."""
+
+    improved = False
+    last = len(path) - 1
+    stale = True
+    for i in range(last - 2):
+        if time.monotonic() >= deadline:
+            break
+        if stale:
+            legs = cost[path[:-1], path[1:]]
+            forward_sum = np.concatenate(([0.0], np.cumsum(legs)))
+            reverse_sum = np.concatenate(([0.0], np.cumsum(cost[path[1:], path[:-1]])))
+            stale = False
+        # Reverse path[i+1 .. j] for every j in (i+1, last).
+        j = np.arange(i + 2, last)
+        old = legs[i] + (forward_sum[j] - forward_sum[i + 1]) + legs[j]
+        new = (
+            cost[path[i], path[j]]
+            + (reverse_sum[j] - reverse_sum[i + 1])
+            + cost[path[i + 1], path[j + 1]]
+        )
+        delta = new - old
+        best = int(np.argmin(delta))
+        if delta[best] < -_IMPROVEMENT_EPS:
+            end = int(j[best])
+            path[i + 1 : end + 1] = path[i + 1 : end + 1][::-1].copy()
+            improved = stale = True
+    return improved
+
+
+def _or_opt_pass(
+    cost: np.ndarray, path: np.ndarray, deadline: float, max_segment: int = 3
+) -> bool:
+    """Move runs of 1..``max_segment`` nodes to their cheapest other slot."""
+
+    improved = False
+    for length in range(1, max_segment + 1):
+        i = 1
+        while i + length < len(path) and time.monotonic() < deadline:
+            head, tail = path[i], path[i + length - 1]
+            before, after = path[i - 1], path[i + length]
+            gain = cost[before, head] + cost[tail, after] - cost[before, after]
+            rest = np.concatenate((path[:i], path[i + length :]))
+            # Insert between rest[k] and rest[k + 1].
+            insert = cost[rest[:-1], head] + cost[tail, rest[1:]] - cost[rest[:-1], rest[1:]]
+            k = int(np.argmin(insert))
+            if insert[k] - gain < -_IMPROVEMENT_EPS:
+                segment = path[i : i + length].copy()
+                path[:] = np.concatenate((rest[: k + 1], segment, rest[k + 1 :]))
+                improved = True
+            i += 1
+    return improved
+
+
+def _path_cost(cost: np.ndarray, path: np.ndarray) -> float:
+    return float(cost[path[:-1], path[1:]].sum())
+
+
+def solve_open_path(cost: np.ndarray, deadline: float) -> np.ndarray:
+    """Cheap open path 0 -> n-1 over ``cost``; improves until no move or ``deadline``.
+
+    The search starts from the cheaper of nearest-neighbour and the input
+    order and only applies improving moves, so it never returns a path
+    costlier than ``0, 1, ..., n-1``.
+    """
+
+    count = len(cost)
+    if count <= 3:
+        return np.arange(count)
+    path = _nearest_neighbour(cost)
+    identity = np.arange(count)
+    if _path_cost(cost, identity) <= _path_cost(cost, path):
+        path = identity
+    while time.monotonic() < deadline:
+        improved = _two_opt_pass(cost, path, deadline)
+        improved = _or_opt_pass(cost, path, deadline) or improved
+        if not improved:
+            break
+    return path
+
+
+@dataclass(frozen=True)
+class RouteResult:
+    order: np.ndarray
+    points: WaypointArray
+    cost_before_s: float
+    cost_after_s: float
+    groups: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "order": self.order.tolist(),
+            "points": self.points.to_points(),
+            "cost_before_s": self.cost_before_s,
+            "cost_after_s": self.cost_after_s,
+            "saved_s": self.cost_before_s - self.cost_after_s,
+            "groups": self.groups,
+        }
+
+
+def _node(x: float, y: float, z: float, yaw: float) -> np.ndarray:
+    return np.array([(x, y, z, yaw, False)], dtype=WAYPOINT_DTYPE)
+
+
+def route_cost(model: RouteCostModel, nodes: np.ndarray) -> float:
+    """Sum of leg costs along ``nodes`` in order."""
+
+    if len(nodes) < 2:
+        return 0.0
+    return float(leg_seconds(model, nodes[:-1], nodes[1:]).sum())
+
+
+def optimize_route(
+    points: WaypointArray,
+    start: tuple[float, float, float, float],
+    end: tuple[float, float, float, float],
+    model: RouteCostModel,
+    *,
+    time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+    max_group_points: int = DEFAULT_MAX_GROUP_POINTS,
+) -> RouteResult:
+    """Reorder photo waypoints between fixed anchors to cut estimated flight time."""
+
+    data = points.data
+    photo = data["take_photo"]
+    anchors = np.flatnonzero(~photo)
+    # Node indices into `nodes`: 0 = start, 1..n = waypoints, n + 1 = end.
+    nodes = np.concatenate((_node(*start), data, _node(*end)))
+    bounds = [0, *(anchors + 1).tolist(), len(nodes) - 1]
+    largest = max((b - a - 1 for a, b in zip(bounds[:-1], bounds[1:])), default=0)
+    if largest > max_group_points:
+        raise ValueError(
+            f"Too many photo waypoints between fixed points ({largest} > {max_group_points})."
+        )
+
+    deadline = time.monotonic() + max(float(time_budget_s), 0.0)
+    order: list[int] = [0]
+    groups = 0
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        group = np.arange(first, last + 1)
+        if len(group) > 3:
+            groups += 1
+            sub = nodes[group]
+            cost = leg_seconds(model, sub[:, None], sub[None, :])
+            group = group[solve_open_path(cost, deadline)]
+        order.extend(group[1:].tolist())
+
+    cost_before = route_cost(model, nodes)
+    cost_after = route_cost(model, nodes[np.asarray(order)])
+    if cost_after > cost_before:
+        # Only float noise can get here; never hand back a slower route.
+        order, cost_after = list(range(len(nodes))), cost_before
+    waypoint_order = np.asarray(order[1:-1], dtype=np.int64) - 1
+    return RouteResult(
+        order=waypoint_order,
+        points=WaypointArray(data[waypoint_order]),
+        cost_before_s=cost_before,
+        cost_after_s=cost_after,
+        groups=groups,
+    )
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
 
 from .drone_runtime import DroneRuntime
+from .flight_recorder import FlightRecorder
+from .mqtt_pool import MqttConnectionPool, instrumentation_hook
+from .scheduler import PeriodicScheduler, shared_scheduler
 from .slam_runtime import SlamRuntime
 
+if TYPE_CHECKING:
+    from dashboard.sim import SimEnvironment
+
 
 class RuntimeHub:
     """Owns SLAM runtime and drone runtime lifecycles separately."""
@@ -16,8 +22,42 @@ class RuntimeHub:
     def __init__(self, app_config: Mapping[str, Any]):
         self._app_config = app_config
         self._lock = threading.Lock()
+        self.scheduler: PeriodicScheduler = shared_scheduler()
+
+        record_dir = str(app_config.get("MQTT_RECORD_DIR", "") or "").strip()
+        self.recorder: FlightRecorder | None = None
+        if record_dir:
+            segment_mb = int(app_config.get("MQTT_RECORD_SEGMENT_MB", 256))
+            self.recorder = FlightRecorder(
+                record_dir, max_segment_bytes=segment_mb * 1024 * 1024
+            )
+
+        # SLAM and drone runtimes share one session when their brokers match.
+        self.mqtt_pool = MqttConnectionPool(on_connect=instrumentation_hook(self.recorder))
+
+        self.sim: SimEnvironment | None = None
+        slam_factories: dict[str, Any] = {}
+        drone_factories: dict[str, Any] = {}
+        if app_config.get("SIM_MODE"):
+            from dashboard import sim
+
+            self.sim = sim.SimEnvironment(app_config)
+            self.sim.start()
+            slam_factories = {"client_factory": self.sim.client_factory}
+            drone_factories = {
+                "client_factory": self.sim.client_factory,
+                "caller_factory": self.sim.caller_factory,
+            }
+            logging.getLogger("dashboard").info(
+                "[sim] offline simulation enabled gateway=%s", self.sim.gateway_sn
+            )
 
-        self.slam = SlamRuntime(app_config)
+        self.slam = SlamRuntime(
+            app_config,
+            recorder=self.recorder,
+            mqtt_pool=self.mqtt_pool,
+            **slam_factories,
+        )
         self.drone_active_config: dict[str, Any] = {
             "GATEWAY_SN": "",
             "MQTT_HOST": "",
@@ -27,16 +67,61 @@ class RuntimeHub:
             "DRC_USER_ID": "",
             "DRC_USER_CALLSIGN": "",
         }
-        self.drone = DroneRuntime(app_config, self.drone_active_config)
+        if self.sim:
+            self.drone_active_config.update(
+                {
+                    "GATEWAY_SN": self.sim.gateway_sn,
+                    "MQTT_HOST": "sim",
+                    "MQTT_PORT": 1883,
+                    "DRC_USER_ID": "sim",
+                    "DRC_USER_CALLSIGN": "sim",
+                }
+            )
+        self.drone = DroneRuntime(
+            app_config,
+            self.drone_active_config,
+            recorder=self.recorder,
+            scheduler=self.scheduler,
+            mqtt_pool=self.mqtt_pool,
+            **drone_factories,
+        )
 
     def start_slam(self) -> None:
         if self.slam.connected:
             return
         self.slam.start()
 
+    def schedule_slam_auto_connect(self, interval: float = 2.0) -> None:
+        """Retry `start_slam` on the scheduler until it succeeds."""
+
+        attempts = 0
+        logger = logging.getLogger("dashboard")
+
+        def _auto_connect() -> bool:
+            nonlocal attempts
+            attempts += 1
+            try:
+                logger.info("[slam] auto-connect attempt %d", attempts)
+                self.start_slam()
+            except Exception as exc:
+                self.slam.stop()
+                logger.warning("[slam] auto-connect failed: %s", exc)
+                return True
+            logger.info("[slam] auto-connect succeeded")
+            return False
+
+        # Offloaded: the MQTT connect may block for its timeout.
+        self.scheduler.add_job("slam-auto-connect", _auto_connect, interval, offload=True)
+
     def stop_all(self) -> None:
         self.drone.disconnect()
         self.slam.stop()
+        self.mqtt_pool.close_all()
+        if self.recorder:
+            self.recorder.close()
+        if self.sim:
+            self.sim.stop()
+        self.scheduler.stop()
 
     def get_drone_config(self) -> dict[str, Any]:
         with self._lock:
@@ -0,0 +1,390 @@
+"""Runtime daemon IPC: state snapshots over shared memory, commands over a socket.
+
+With ``RUNTIME_ROLE=daemon`` one process owns the `RuntimeHub`, the
+`MissionExecutor` and every MQTT client. `RuntimeServer` publishes a JSON
+snapshot of the read-side state (pose, telemetry, runtime status, mission
+status, drone config) into a `SnapshotBlock` every
+``RUNTIME_SNAPSHOT_INTERVAL`` seconds, and executes whitelisted commands
+received on ``RUNTIME_ADDRESS`` (`multiprocessing.connection`, HMAC
+authenticated with ``RUNTIME_AUTHKEY``). After every state-changing command
+the snapshot is republished before the reply is sent, so a worker that
+forwarded a command reads its own write.
+
+Web workers (``RUNTIME_ROLE=web``, see `runtime_remote`) read snapshots
+without a round trip and only forward commands.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from dataclasses import asdict
+from multiprocessing import AuthenticationError, shared_memory
+from multiprocessing.connection import Client, Listener
+from typing import TYPE_CHECKING, Any, Mapping
+
+from apps.control.core.pose_shm import attach_shared_memory
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from .mission_executor import MissionExecutor
+    from .runtime_hub import RuntimeHub
+    from .scheduler import Job
+
+DEFAULT_ADDRESS = "/tmp/drone3plot-runtime.sock"
+DEFAULT_SNAPSHOT_NAME = "drone3plot_runtime"
+SNAPSHOT_CAPACITY = 1024 * 1024
+READ_RETRIES = 100
+
+DRONE_SERVICES = ("camera", "control", "streaming", "trajectory", "drc")
+
+# Commands a web worker may forward; everything else is read from snapshots.
+RUNTIME_COMMANDS = frozenset(
+    {
+        "hub.start_slam",
+        "hub.update_drone_config",
+        "hub.connect_drone",
+        "hub.disconnect_drone",
+        "drone.telemetry.history.query",
+        "drone.camera.set_zoom",
+        "drone.camera.select_lens",
+        "drone.camera.take_photo",
+        "drone.camera.current_lens",
+        "drone.control.send_stick_command",
+        "drone.streaming.start",
+        "drone.streaming.stop",
+        "drone.streaming.change_quality",
+        "drone.trajectory.set_http_payload",
+        "drone.trajectory.latest",
+        "drone.drc.request_control",
+        "drone.drc.confirm_control",
+        "mission.start",
+        "mission.resume",
+        "mission.abort",
+        "mission.update_draft",
+        "mission.get_draft",
+        "mission.history",
+        "mission.run_detail",
+        "mission.estimate",
+        "mission.optimize",
+    }
+)
+READ_ONLY_COMMANDS = frozenset(
+    {
+        "drone.telemetry.history.query",
+        "drone.camera.current_lens",
+        "drone.trajectory.latest",
+        "mission.get_draft",
+        "mission.history",
+        "mission.run_detail",
+        "mission.estimate",
+        "mission.optimize",
+    }
+)
+
+_HEADER = struct.Struct("<QId")
+
+
+def parse_address(raw: str) -> str | tuple[str, int]:
+    """``host:port`` for TCP, anything else is a Unix socket path."""
+
+    raw = (raw or DEFAULT_ADDRESS).strip()
+    host, sep, port = raw.rpartition(":")
+    if sep and port.isdigit() and "/" not in raw:
+        return (host or "127.0.0.1", int(port))
+    return raw
+
+
+def resolve_authkey(address: str | tuple[str, int], raw: str) -> bytes | None:
+    if raw:
+        return raw.encode()
+    if isinstance(address, tuple):
+        # Commands are pickled; never accept them unauthenticated over TCP.
+        raise RuntimeError("RUNTIME_AUTHKEY is required for a TCP RUNTIME_ADDRESS.")
+    return None
+
+
+class SnapshotBlock:
+    """Seqlock-protected variable-length document in shared memory.
+
+    Layout: ``u64 seq | u32 length | f64 published_at`` followed by up to
+    ``capacity`` bytes. Same protocol as `PoseBlock`: ``seq`` is odd while a
+    write is in progress; ``published_at`` is ``time.monotonic()``.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self._owner = owner
+        self.capacity = shm.size - _HEADER.size
+        self._seq = _HEADER.unpack_from(self._buf, 0)[0]
+
+    @classmethod
+    def create(cls, name: str, capacity: int = SNAPSHOT_CAPACITY) -> "SnapshotBlock":
+        size = _HEADER.size + capacity
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a daemon that did not exit cleanly.
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[: _HEADER.size] = bytes(_HEADER.size)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SnapshotBlock":
+        return cls(attach_shared_memory(name), owner=False)
+
+    def write(self, data: bytes, published_at: float | None = None) -> int:
+        if len(data) > self.capacity:
+            raise ValueError(
+                f"Snapshot is {len(data)} bytes, block holds {self.capacity}."
+            )
+        stamp = time.monotonic() if published_at is None else published_at
+        seq = self._seq + 1 if self._seq % 2 == 0 else self._seq
+        _HEADER.pack_into(self._buf, 0, seq, 0, stamp)
+        self._buf[_HEADER.size : _HEADER.size + len(data)] = data
+        self._seq = seq + 1
+        _HEADER.pack_into(self._buf, 0, self._seq, len(data), stamp)
+        return self._seq
+
+    def read(self) -> tuple[int, bytes, float] | None:
+        """``(seq, data, published_at)``; None if empty or kept busy too long."""
+
+        buf = self._buf
+        for _ in range(READ_RETRIES):
+            seq, length, published_at = _HEADER.unpack_from(buf, 0)
+            if seq % 2:
+                continue
+            if seq == 0:
+                return None
+            data = bytes(buf[_HEADER.size : _HEADER.size + length])
+            if _HEADER.unpack_from(buf, 0)[0] == seq:
+                return seq, data, published_at
+        return None
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def build_runtime_snapshot(hub: RuntimeHub, executor: MissionExecutor) -> dict[str, Any]:
+    """Everything the read-only endpoints and socket pushes need."""
+
+    slam = hub.slam.status()
+    drone = hub.drone
+    return {
+        "slam": {
+            "connected": slam.connected,
+            "host": slam.host,
+            "port": slam.port,
+            "topics": slam.topics,
+            "pose": hub.slam.pose.latest() if hub.slam.pose else None,
+        },
+        "drone": {
+            "connected": drone.connected,
+            "status": asdict(drone.status()),
+            "telemetry": drone.telemetry.latest_dict() if drone.telemetry else None,
+            "services": [name for name in DRONE_SERVICES if getattr(drone, name)],
+            "video_id": drone.streaming.video_id if drone.streaming else None,
+        },
+        "mission": {"status": executor.status(), "running": executor.is_running()},
+        "drone_config": hub.get_drone_config(),
+    }
+
+
+class RuntimeServer:
+    """Serve `RUNTIME_COMMANDS` and publish snapshots for web workers."""
+
+    def __init__(
+        self,
+        hub: RuntimeHub,
+        executor: MissionExecutor,
+        address: str | tuple[str, int] = DEFAULT_ADDRESS,
+        authkey: bytes | None = None,
+        snapshot_name: str = DEFAULT_SNAPSHOT_NAME,
+        snapshot_interval: float = 0.05,
+    ) -> None:
+        self.hub = hub
+        self.executor = executor
+        self.address = address
+        self.authkey = authkey
+        self.snapshot_name = snapshot_name
+        self.snapshot_interval = snapshot_interval
+        self._logger = logging.getLogger("dashboard")
+        self._publish_lock = threading.Lock()
+        self._block: SnapshotBlock | None = None
+        self._listener: Listener | None = None
+        self._job: Job | None = None
+        self._stopped = threading.Event()
+
+    @classmethod
+    def from_config(
+        cls, hub: RuntimeHub, executor: MissionExecutor, config: Mapping[str, Any]
+    ) -> "RuntimeServer":
+        address = parse_address(str(config.get("RUNTIME_ADDRESS", "") or ""))
+        return cls(
+            hub,
+            executor,
+            address=address,
+            authkey=resolve_authkey(address, str(config.get("RUNTIME_AUTHKEY", "") or "")),
+            snapshot_name=str(
+                config.get("RUNTIME_SNAPSHOT_NAME", "") or DEFAULT_SNAPSHOT_NAME
+            ),
+            snapshot_interval=float(config.get("RUNTIME_SNAPSHOT_INTERVAL", 0.05)),
+        )
+
+    def start(self) -> None:
+        self._block = SnapshotBlock.create(self.snapshot_name)
+        self.publish()
+        self._listener = self._listen()
+        threading.Thread(
+            target=self._accept_loop, name="runtime-ipc-accept", daemon=True
+        ).start()
+        self._job = self.hub.scheduler.add_job(
+            "runtime-snapshot", self.publish, self.snapshot_interval
+        )
+        self._logger.info(
+            "[runtime] daemon serving %s snapshot=%s", self.address, self.snapshot_name
+        )
+
+    def _bind(self) -> Listener:
+        if not isinstance(self.address, str):
+            return Listener(self.address, authkey=self.authkey)
+        # Create the socket file owner-only: a chmod after bind leaves a window
+        # in which anyone could connect (there may be no authkey to stop them).
+        previous = os.umask(0o177)
+        try:
+            return Listener(self.address, authkey=self.authkey)
+        finally:
+            os.umask(previous)
+
+    def _listen(self) -> Listener:
+        try:
+            listener = self._bind()
+        except OSError:
+            if not isinstance(self.address, str) or not os.path.exists(self.address):
+                raise
+            try:
+                Client(self.address, authkey=self.authkey).close()
+            except (ConnectionRefusedError, AuthenticationError):
+                # Socket file left behind by a daemon that crashed.
+                os.unlink(self.address)
+                listener = self._bind()
+            else:
+                raise RuntimeError(
+                    f"Runtime daemon already running at {self.address}."
+                ) from None
+        if isinstance(self.address, str):
+            os.chmod(self.address, 0o600)
+        return listener
+
+    def publish(self) -> None:
+        block = self._block
+        if block is None:
+            return
+        snapshot = build_runtime_snapshot(self.hub, self.executor)
+        data = json.dumps(snapshot, separators=(",", ":"), default=str).encode()
+        with self._publish_lock:
+            try:
+                block.write(data)
+            except ValueError as exc:
+                self._logger.warning("[runtime] snapshot skipped: %s", exc)
+
+    def stop(self) -> None:
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._job:
+            self.hub.scheduler.remove_job(self._job)
+            self._job = None
+        if self._listener is not None:
+            try:
+                # Wake the blocking accept() so the thread sees the stop flag.
+                Client(self.address, authkey=self.authkey).close()
+            except (OSError, AuthenticationError):
+                pass
+            self._listener.close()
+            self._listener = None
+        with self._publish_lock:
+            if self._block is not None:
+                self._block.close()
+                self._block.unlink()
+                self._block = None
+
+    def _accept_loop(self) -> None:
+        while not self._stopped.is_set():
+            listener = self._listener
+            if listener is None:
+                return
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                self._logger.warning("[runtime] rejected unauthenticated client")
+                continue
+            except OSError:
+                if self._stopped.is_set():
+                    return
+                continue
+            threading.Thread(
+                target=self._serve, args=(conn,), name="runtime-ipc-conn", daemon=True
+            ).start()
+
+    def _serve(self, conn: Connection) -> None:
+        with conn:
+            while not self._stopped.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if self._stopped.is_set():
+                    return
+                try:
+                    conn.send(self._dispatch(request))
+                except (OSError, ValueError):
+                    return
+
+    def _dispatch(self, request: Any) -> tuple:
+        try:
+            name, args, kwargs = request
+        except (TypeError, ValueError):
+            return ("error", "ValueError", "Malformed runtime request.")
+        if name not in RUNTIME_COMMANDS:
+            return ("error", "ValueError", f"Unknown runtime command: {name}")
+        try:
+            result = self._resolve(name)(*args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            return ("error", type(exc).__name__, str(exc))
+        finally:
+            if name not in READ_ONLY_COMMANDS:
+                self.publish()
+        return ("ok", result)
+
+    def _resolve(self, name: str) -> Any:
+        root, *path, method = name.split(".")
+        roots = {
+            "hub": self.hub,
+            "slam": self.hub.slam,
+            "drone": self.hub.drone,
+            "mission": self.executor,
+        }
+        target = roots[root]
+        for attr in path:
+            target = getattr(target, attr)
+            if target is None:
+                raise RuntimeError("Drone runtime not connected.")
+        return getattr(target, method)
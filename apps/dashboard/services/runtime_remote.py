@@ -0,0 +1,425 @@
+"""Web-worker side of the runtime daemon (``RUNTIME_ROLE=web``).
+
+`RemoteRuntimeHub` and `RemoteMissionExecutor` expose the subset of the
+`RuntimeHub` / `MissionExecutor` interface the blueprints and socket jobs
+use. Reads come from the daemon's `SnapshotBlock`; commands go through
+`RuntimeClient`, one connection per request thread.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from .drone_runtime import DroneRuntimeStatus
+from .mission_models import MissionRun
+from .runtime_ipc import (
+    DEFAULT_SNAPSHOT_NAME,
+    RUNTIME_COMMANDS,
+    SnapshotBlock,
+    parse_address,
+    resolve_authkey,
+)
+from .scheduler import PeriodicScheduler, shared_scheduler
+from .slam_runtime import SlamStatus
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from dashboard.domain.models import TelemetrySnapshot
+
+# A daemon that stopped publishing for this long is treated as gone.
+SNAPSHOT_STALE_AFTER = 2.0
+REATTACH_INTERVAL = 1.0
+
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "ValueError": ValueError,
+    "TimeoutError": TimeoutError,
+}
+
+
+def _empty_snapshot() -> dict[str, Any]:
+    return {
+        "slam": {"connected": False, "host": "", "port": 0, "topics": {}, "pose": None},
+        "drone": {
+            "connected": False,
+            "status": {
+                "state": "DISCONNECTED",
+                "connected": False,
+                "gateway_sn": "",
+                "host": "",
+                "port": 0,
+                "drc_state": None,
+                "drc_error": None,
+            },
+            "telemetry": None,
+            "services": [],
+            "video_id": None,
+        },
+        "mission": {
+            "status": {
+                "run": MissionRun(run_id="").to_dict(),
+                "snapshot": None,
+                "draft": {"revision": 0, "points": 0, "meta": {}},
+            },
+            "running": False,
+        },
+        "drone_config": {},
+    }
+
+
+class RuntimeClient:
+    """Forward `RUNTIME_COMMANDS` to the daemon and re-raise its errors."""
+
+    def __init__(
+        self,
+        address: str | tuple[str, int],
+        authkey: bytes | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.address = address
+        self.authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: set[Connection] = set()
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        if name not in RUNTIME_COMMANDS:
+            raise ValueError(f"Unknown runtime command: {name}")
+        try:
+            conn = self._connection()
+            conn.send((name, args, kwargs))
+            if not conn.poll(self.timeout):
+                raise TimeoutError(f"{name} timed out after {self.timeout:g}s")
+            status, *rest = conn.recv()
+        except (OSError, EOFError, AuthenticationError) as exc:
+            # TimeoutError is an OSError: the late reply would be read by the
+            # next call, so the connection is dropped in every case.
+            self._drop()
+            reason = str(exc) or type(exc).__name__
+            raise RuntimeError(f"Runtime daemon unavailable: {reason}") from exc
+        if status == "ok":
+            return rest[0]
+        error_type, message = rest
+        raise _REMOTE_ERRORS.get(error_type, RuntimeError)(message)
+
+    def _connection(self) -> Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = Client(self.address, authkey=self.authkey)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.add(conn)
+        return conn
+
+    def _drop(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            with self._lock:
+                self._connections.discard(conn)
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+
+class SnapshotReader:
+    """Parse the daemon's snapshot once per published sequence number."""
+
+    def __init__(self, name: str = DEFAULT_SNAPSHOT_NAME) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._block: SnapshotBlock | None = None
+        self._attached_at = 0.0
+        self._seq = 0
+        self._snapshot: dict[str, Any] | None = None
+
+    def get(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            if self._block is None and not self._attach(now):
+                return _empty_snapshot()
+            assert self._block is not None
+            result = self._block.read()
+            if result is None:
+                return self._snapshot or _empty_snapshot()
+            seq, data, published_at = result
+            if now - published_at > SNAPSHOT_STALE_AFTER:
+                # The daemon may have restarted under a fresh segment.
+                if now - self._attached_at > REATTACH_INTERVAL:
+                    self._block.close()
+                    self._block = None
+                    self._attach(now)
+                return _empty_snapshot()
+            if seq != self._seq or self._snapshot is None:
+                self._snapshot = json.loads(data)
+                self._seq = seq
+            return self._snapshot
+
+    def _attach(self, now: float) -> bool:
+        if now - self._attached_at < REATTACH_INTERVAL and self._attached_at:
+            return False
+        self._attached_at = now
+        try:
+            self._block = SnapshotBlock.attach(self.name)
+        except FileNotFoundError:
+            return False
+        self._seq = 0
+        self._snapshot = None
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._block is not None:
+                self._block.close()
+                self._block = None
+
+
+class _RemoteService:
+    """Forward method calls on ``drone.<service>`` to the daemon."""
+
+    def __init__(self, hub: RemoteRuntimeHub, path: str) -> None:
+        self._hub = hub
+        self._path = path
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        command = f"{self._path}.{name}"
+        if command not in RUNTIME_COMMANDS:
+            raise AttributeError(name)
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            return self._hub.client.call(command, *args, **kwargs)
+
+        return _call
+
+
+class _RemoteStreaming(_RemoteService):
+    @property
+    def video_id(self) -> str | None:
+        return self._hub.snapshot()["drone"]["video_id"]
+
+
+class _RemoteTelemetry:
+    def __init__(self, drone: RemoteDroneRuntime) -> None:
+        self._drone = drone
+        self.history = _RemoteService(drone._hub, "drone.telemetry.history")
+
+    def latest(self) -> TelemetrySnapshot:
+        return self._drone._telemetry_model()
+
+    def latest_dict(self) -> dict:
+        return self._drone._hub.snapshot()["drone"]["telemetry"] or {}
+
+
+class _SnapshotPose:
+    def __init__(self, hub: RemoteRuntimeHub) -> None:
+        self._hub = hub
+
+    def latest(self) -> dict[str, Any]:
+        pose = self._hub.snapshot()["slam"]["pose"]
+        return dict(pose) if pose else {"x": None, "y": None, "z": None, "yaw": None}
+
+
+class RemoteSlamRuntime:
+    def __init__(self, hub: RemoteRuntimeHub) -> None:
+        self._hub = hub
+
+    @property
+    def connected(self) -> bool:
+        return bool(self._hub.snapshot()["slam"]["connected"])
+
+    @property
+    def pose(self) -> _SnapshotPose | None:
+        if self._hub.snapshot()["slam"]["pose"] is None:
+            return None
+        return _SnapshotPose(self._hub)
+
+    def status(self) -> SlamStatus:
+        slam = self._hub.snapshot()["slam"]
+        return SlamStatus(
+            connected=slam["connected"],
+            host=slam["host"],
+            port=slam["port"],
+            topics=dict(slam["topics"]),
+        )
+
+
+class RemoteDroneRuntime:
+    def __init__(self, hub: RemoteRuntimeHub) -> None:
+        self._hub = hub
+        self._telemetry_lock = threading.Lock()
+        self._telemetry_cache: tuple[dict | None, TelemetrySnapshot | None] = (None, None)
+
+    @property
+    def connected(self) -> bool:
+        return bool(self._hub.snapshot()["drone"]["connected"])
+
+    def status(self) -> DroneRuntimeStatus:
+        return DroneRuntimeStatus(**self._hub.snapshot()["drone"]["status"])
+
+    @property
+    def telemetry(self) -> _RemoteTelemetry | None:
+        if self._hub.snapshot()["drone"]["telemetry"] is None:
+            return None
+        return _RemoteTelemetry(self)
+
+    def _telemetry_model(self) -> TelemetrySnapshot:
+        from dashboard.domain.models import TelemetrySnapshot
+
+        payload = self._hub.snapshot()["drone"]["telemetry"]
+        with self._telemetry_lock:
+            cached_payload, model = self._telemetry_cache
+            if payload is None or payload is not cached_payload or model is None:
+                model = TelemetrySnapshot.model_validate(payload or {})
+                self._telemetry_cache = (payload, model)
+            return model
+
+    def _service(self, name: str, factory: type[_RemoteService] = _RemoteService) -> Any:
+        if name not in self._hub.snapshot()["drone"]["services"]:
+            return None
+        return factory(self._hub, f"drone.{name}")
+
+    @property
+    def camera(self) -> _RemoteService | None:
+        return self._service("camera")
+
+    @property
+    def control(self) -> _RemoteService | None:
+        return self._service("control")
+
+    @property
+    def streaming(self) -> _RemoteStreaming | None:
+        return self._service("streaming", _RemoteStreaming)
+
+    @property
+    def trajectory(self) -> _RemoteService | None:
+        return self._service("trajectory")
+
+    @property
+    def drc(self) -> _RemoteService | None:
+        return self._service("drc")
+
+
+class RemoteRuntimeHub:
+    """`RuntimeHub` stand-in for a stateless web worker."""
+
+    def __init__(
+        self,
+        app_config: Mapping[str, Any],
+        client: RuntimeClient,
+        snapshots: SnapshotReader,
+    ) -> None:
+        self._app_config = app_config
+        self.client = client
+        self.snapshots = snapshots
+        # Local scheduler for this worker's socket push jobs.
+        self.scheduler: PeriodicScheduler = shared_scheduler()
+        self.slam = RemoteSlamRuntime(self)
+        self.drone = RemoteDroneRuntime(self)
+
+    def snapshot(self) -> dict[str, Any]:
+        return self.snapshots.get()
+
+    def start_slam(self) -> None:
+        self.client.call("hub.start_slam")
+
+    def stop_all(self) -> None:
+        # The daemon owns the connections; only release this worker's handles.
+        self.client.close()
+        self.snapshots.close()
+        self.scheduler.stop()
+
+    def get_drone_config(self) -> dict[str, Any]:
+        return dict(self.snapshot()["drone_config"])
+
+    def update_drone_config(self, payload: Mapping[str, Any]) -> tuple[bool, str | None]:
+        try:
+            changed, error = self.client.call("hub.update_drone_config", dict(payload))
+        except RuntimeError as exc:
+            return False, str(exc)
+        return changed, error
+
+    def connect_drone(self) -> tuple[bool, str | None]:
+        try:
+            ok, error = self.client.call("hub.connect_drone")
+        except RuntimeError as exc:
+            return False, str(exc)
+        return ok, error
+
+    def disconnect_drone(self) -> tuple[bool, str | None]:
+        try:
+            ok, error = self.client.call("hub.disconnect_drone")
+        except RuntimeError as exc:
+            return False, str(exc)
+        return ok, error
+
+
+class RemoteMissionExecutor:
+    """`MissionExecutor` stand-in; the mission itself runs in the daemon."""
+
+    def __init__(self, hub: RemoteRuntimeHub) -> None:
+        self._hub = hub
+
+    def status(self) -> dict[str, Any]:
+        return self._hub.snapshot()["mission"]["status"]
+
+    def is_running(self) -> bool:
+        return bool(self._hub.snapshot()["mission"]["running"])
+
+    def start(self, payload: dict[str, Any] | None = None) -> str:
+        return self._hub.client.call("mission.start", payload or {})
+
+    def resume(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        return self._hub.client.call("mission.resume", payload or {})
+
+    def abort(self) -> None:
+        self._hub.client.call("mission.abort")
+
+    def update_draft(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return self._hub.client.call("mission.update_draft", payload)
+
+    def get_draft(self) -> dict[str, Any]:
+        return self._hub.client.call("mission.get_draft")
+
+    def history(
+        self, limit: int = 20, before: str | None = None, phase: str | None = None
+    ) -> dict[str, Any]:
+        return self._hub.client.call("mission.history", limit, before, phase)
+
+    def run_detail(self, run_id: str) -> dict[str, Any] | None:
+        return self._hub.client.call("mission.run_detail", run_id)
+
+    def estimate(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        return self._hub.client.call("mission.estimate", payload or {})
+
+    def optimize(self, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        return self._hub.client.call("mission.optimize", payload or {})
+
+    def shutdown(self) -> None:
+        pass
+
+
+def connect_remote_runtime(
+    app_config: Mapping[str, Any],
+) -> tuple[RemoteRuntimeHub, RemoteMissionExecutor]:
+    address = parse_address(str(app_config.get("RUNTIME_ADDRESS", "") or ""))
+    client = RuntimeClient(
+        address,
+        authkey=resolve_authkey(address, str(app_config.get("RUNTIME_AUTHKEY", "") or "")),
+        timeout=float(app_config.get("RUNTIME_RPC_TIMEOUT", 30.0)),
+    )
+    snapshots = SnapshotReader(
+        str(app_config.get("RUNTIME_SNAPSHOT_NAME", "") or DEFAULT_SNAPSHOT_NAME)
+    )
+    hub = RemoteRuntimeHub(app_config, client, snapshots)
+    return hub, RemoteMissionExecutor(hub)
@@ -0,0 +1,252 @@
+"""Single-thread periodic job scheduler shared by dashboard services.
+
+Services register jobs instead of owning sleeper threads, so the process
+runs one timer thread (plus the mission control loop) rather than one per
+loop. Jobs are kept in a heap keyed by their next deadline and run at a
+fixed rate; a job that falls more than one interval behind skips the missed
+ticks instead of bursting.
+
+Job callbacks must be short. Work that may block (network connects) should
+be registered with ``offload=True``: it then runs on a one-shot helper
+thread and never overlaps with its previous run.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# A job returning ``False`` is cancelled (e.g. retry loops that succeeded).
+JobCallback = Callable[[], Any]
+Interval = float | Callable[[], float]
+
+MIN_INTERVAL = 0.001
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    errors: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    max_lateness: float = 0.0
+    last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "last_ms": self.last_duration * 1000.0,
+            "max_ms": self.max_duration * 1000.0,
+            "avg_ms": (self.total_duration / self.runs * 1000.0) if self.runs else 0.0,
+            "max_lateness_ms": self.max_lateness * 1000.0,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass(eq=False)
+class Job:
+    name: str
+    callback: JobCallback
+    interval: Interval
+    deadline: float | None = None
+    offload: bool = False
+    next_at: float = 0.0
+    cancelled: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+    _running: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def current_interval(self) -> float:
+        value = self.interval() if callable(self.interval) else self.interval
+        return max(float(value), MIN_INTERVAL)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class PeriodicScheduler:
+    """Run registered jobs on one daemon thread; started on first ``add_job``."""
+
+    def __init__(self, name: str = "dashboard-scheduler") -> None:
+        self.name = name
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, Job]] = []
+        self._jobs: dict[str, Job] = {}
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def add_job(
+        self,
+        name: str,
+        callback: JobCallback,
+        interval: Interval,
+        *,
+        deadline: float | None = None,
+        delay: float = 0.0,
+        offload: bool = False,
+    ) -> Job:
+        """Register ``callback`` every ``interval`` seconds (replaces ``name``).
+
+        ``interval`` may be a callable so config changes apply without
+        re-registering. ``deadline`` (default: the interval) is the run time
+        above which the run counts as an overrun in the stats.
+        """
+
+        job = Job(name, callback, interval, deadline=deadline, offload=offload)
+        job.next_at = time.monotonic() + delay
+        with self._cond:
+            previous = self._jobs.get(name)
+            if previous is not None:
+                previous.cancel()
+            self._jobs[name] = job
+            heapq.heappush(self._heap, (job.next_at, next(self._seq), job))
+            self._ensure_thread()
+            self._cond.notify()
+        return job
+
+    def remove_job(self, job: Job | str) -> None:
+        """Cancel a job; a ``Job`` handle only removes that exact registration."""
+
+        with self._cond:
+            name = job if isinstance(job, str) else job.name
+            current = self._jobs.get(name)
+            if current is not None and (isinstance(job, str) or current is job):
+                del self._jobs[name]
+                current.cancel()
+            if isinstance(job, Job):
+                job.cancel()
+            self._cond.notify()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._cond:
+            jobs = list(self._jobs.values())
+        return {
+            job.name: {"interval_s": job.current_interval(), **job.stats.as_dict()}
+            for job in jobs
+        }
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._stopped = True
+            for job in self._jobs.values():
+                job.cancel()
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _ensure_thread(self) -> None:
+        self._stopped = False
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_due()
+                if job is None:
+                    return
+            self._dispatch(job)
+
+    def _next_due(self) -> Job | None:
+        """Wait for the earliest live job and pop it (caller holds the lock)."""
+
+        while not self._stopped:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                self._cond.wait()
+                continue
+            due_at, _, job = self._heap[0]
+            wait = due_at - time.monotonic()
+            if wait > 0:
+                self._cond.wait(wait)
+                continue
+            heapq.heappop(self._heap)
+            return job
+        return None
+
+    def _dispatch(self, job: Job) -> None:
+        started = time.monotonic()
+        lateness = started - job.next_at
+        job.stats.max_lateness = max(job.stats.max_lateness, lateness)
+        if job.offload:
+            if job._running.is_set():
+                job.stats.skipped += 1
+            else:
+                job._running.set()
+                threading.Thread(
+                    target=self._execute,
+                    args=(job,),
+                    name=f"{self.name}:{job.name}",
+                    daemon=True,
+                ).start()
+        else:
+            self._execute(job)
+
+        interval = job.current_interval()
+        job.next_at += interval
+        now = time.monotonic()
+        if job.next_at <= now:
+            missed = int((now - job.next_at) // interval) + 1
+            job.stats.skipped += missed
+            job.next_at += missed * interval
+        with self._cond:
+            if not job.cancelled and self._jobs.get(job.name) is job:
+                heapq.heappush(self._heap, (job.next_at, next(self._seq), job))
+
+    def _execute(self, job: Job) -> None:
+        started = time.perf_counter()
+        result = None
+        try:
+            result = job.callback()
+        except Exception as exc:  # noqa: BLE001
+            job.stats.errors += 1
+            job.stats.last_error = str(exc)
+            logging.getLogger("dashboard").warning(
+                "[scheduler] job %s failed: %s", job.name, exc
+            )
+        finally:
+            duration = time.perf_counter() - started
+            stats = job.stats
+            stats.runs += 1
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
+            stats.total_duration += duration
+            if duration > (job.deadline or job.current_interval()):
+                stats.overruns += 1
+            job._running.clear()
+        if result is False:
+            job.cancel()
+            with self._cond:
+                if self._jobs.get(job.name) is job:
+                    del self._jobs[job.name]
+
+
+_shared: PeriodicScheduler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> PeriodicScheduler:
+    """Process-wide scheduler used by services that are not handed one."""
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = PeriodicScheduler()
+        return _shared
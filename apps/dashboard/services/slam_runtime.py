@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Mapping
-
-from pydjimqtt.core import MQTTClient
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
+from .mqtt_pool import MqttConnectionPool, instrumentation_hook
 from .pose import PoseService
 
+if TYPE_CHECKING:
+    from pydjimqtt.core import MQTTClient
+
+    from apps.control.core.pose_bus import PoseBusWriter
+
+    from .flight_recorder import FlightRecorder
+
 
 @dataclass(frozen=True)
 class SlamStatus:
@@ -24,10 +30,22 @@ class SlamRuntime:
 
     GATEWAY_SN = "__pose_slam_local__"
 
-    def __init__(self, app_config: Mapping[str, Any]) -> None:
+    def __init__(
+        self,
+        app_config: Mapping[str, Any],
+        recorder: FlightRecorder | None = None,
+        client_factory: Callable[[str, dict[str, Any]], MQTTClient] | None = None,
+        mqtt_pool: MqttConnectionPool | None = None,
+    ) -> None:
         self._config = app_config
+        self._recorder = recorder
+        self._client_factory = client_factory
+        self._pool = mqtt_pool or MqttConnectionPool(
+            on_connect=instrumentation_hook(recorder)
+        )
         self.client: MQTTClient | None = None
         self.pose: PoseService | None = None
+        self.pose_bus: PoseBusWriter | None = None
         self._connected = False
 
     def start(self) -> None:
@@ -48,8 +66,13 @@ class SlamRuntime:
             "password": self._config.get("SLAM_MQTT_PASSWORD", ""),
         }
 
-        client = MQTTClient(self.GATEWAY_SN, mqtt_config)
-        client.connect()
+        # Shares the drone runtime's session when both use the same broker.
+        client = self._pool.acquire(
+            mqtt_config,
+            source="slam",
+            placeholder_sn=self.GATEWAY_SN,
+            client_factory=self._client_factory,
+        )
 
         pose_topic = str(self._config.get("SLAM_POSE_TOPIC", "") or "").strip()
         yaw_topic = str(self._config.get("SLAM_YAW_TOPIC", "") or "").strip()
@@ -77,16 +100,34 @@ class SlamRuntime:
             status_topic,
             frequency_topic,
         )
+        bus_name = str(self._config.get("POSE_BUS_NAME", "") or "").strip()
+        if bus_name:
+            from apps.control.core.pose_bus import PoseBusWriter
+
+            try:
+                self.pose_bus = PoseBusWriter(bus_name)
+            except RuntimeError:
+                self.stop()
+                raise
+            self.pose.attach_shared_block(self.pose_bus)
+            logger.info("[slam] publishing pose bus: %s", bus_name)
         self._connected = True
 
     def stop(self) -> None:
+        if self.pose:
+            self.pose.detach()
         if self.client:
             try:
                 self.client.disconnect()
             except Exception:
                 pass
+        if self.pose_bus:
+            if self.pose:
+                self.pose.detach_shared_block(self.pose_bus)
+            self.pose_bus.close()
         self.client = None
         self.pose = None
+        self.pose_bus = None
         self._connected = False
 
     @property
@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 import threading
-import time
-from typing import Callable, List
-
-from pydjimqtt.core.mqtt_client import MQTTClient
+from typing import TYPE_CHECKING, Callable, List
 
 from dashboard.domain.models import (
     CameraState,
@@ -17,6 +14,13 @@ from dashboard.domain.models import (
     Speed,
     TelemetrySnapshot,
 )
+from dashboard.metrics import TELEMETRY_COLLECT_SECONDS
+
+from .scheduler import Job, PeriodicScheduler, shared_scheduler
+from .telemetry_history import TelemetryHistory
+
+if TYPE_CHECKING:
+    from pydjimqtt.core.mqtt_client import MQTTClient
 
 TelemetryCallback = Callable[[TelemetrySnapshot], None]
 
@@ -28,29 +32,30 @@ class TelemetryService:
         self,
         client: MQTTClient,
         poll_hz: float = 2.0,
+        history_seconds: float = 3600.0,
+        scheduler: PeriodicScheduler | None = None,
     ) -> None:
         self.client = client
         self.poll_hz = max(poll_hz, 0.1)
         self.poll_interval = 1.0 / self.poll_hz
+        self.history = TelemetryHistory(int(history_seconds * self.poll_hz))
         self._snapshot = TelemetrySnapshot()
         self._lock = threading.Lock()
         self._callbacks: List[TelemetryCallback] = []
-        self._stop_event = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._scheduler = scheduler or shared_scheduler()
+        self._job: Job | None = None
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if self._job and not self._job.cancelled:
             return
-        self._stop_event.clear()
-        self._thread = threading.Thread(
-            target=self._run, name="telemetry-loop", daemon=True
+        self._job = self._scheduler.add_job(
+            "telemetry-poll", self._poll, self.poll_interval
         )
-        self._thread.start()
 
     def stop(self) -> None:
-        self._stop_event.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+        if self._job:
+            self._scheduler.remove_job(self._job)
+            self._job = None
 
     def subscribe(self, callback: TelemetryCallback) -> None:
         self._callbacks.append(callback)
@@ -62,18 +67,18 @@ class TelemetryService:
     def latest_dict(self) -> dict:
         return self.latest().model_dump()
 
-    def _run(self) -> None:
-        while not self._stop_event.is_set():
+    def _poll(self) -> None:
+        with TELEMETRY_COLLECT_SECONDS.time():
             snapshot = self._collect_snapshot()
-            with self._lock:
-                self._snapshot = snapshot
-            for callback in list(self._callbacks):
-                try:
-                    callback(snapshot)
-                except Exception:
-                    # Avoid crashing the loop because of subscriber errors.
-                    continue
-            time.sleep(self.poll_interval)
+        with self._lock:
+            self._snapshot = snapshot
+        self.history.append(snapshot)
+        for callback in list(self._callbacks):
+            try:
+                callback(snapshot)
+            except Exception:
+                # Avoid failing the job because of subscriber errors.
+                continue
 
     def _collect_snapshot(self) -> TelemetrySnapshot:
         lat = self.client.get_latitude()
@@ -0,0 +1,212 @@
+"""Columnar in-memory time series for numeric telemetry fields."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from typing import Any, Callable, Iterable, Sequence
+
+from dashboard.domain.models import TelemetrySnapshot
+
+FieldGetter = Callable[[TelemetrySnapshot], Any]
+
+HISTORY_FIELDS: dict[str, FieldGetter] = {
+    "height": lambda s: s.position.altitude,
+    "relative_height": lambda s: s.position.relative_altitude,
+    "speed_horizontal": lambda s: s.speed.horizontal,
+    "speed_x": lambda s: s.speed.x,
+    "speed_y": lambda s: s.speed.y,
+    "speed_z": lambda s: s.speed.z,
+    "battery": lambda s: s.battery.percent,
+    "gimbal_pitch": lambda s: s.camera.gimbal.pitch,
+    "gimbal_roll": lambda s: s.camera.gimbal.roll,
+    "gimbal_yaw": lambda s: s.camera.gimbal.yaw,
+    "osd_frequency": lambda s: s.connection.osd_frequency,
+}
+
+MAX_BUCKETS = 2000
+DEFAULT_BUCKETS = 300
+
+
+class TelemetryHistory:
+    """Fixed-capacity ring buffers (one column per field) with bucketed rollups."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(int(capacity), 1)
+        self._lock = threading.Lock()
+        self._times = array("d", bytes(8 * self.capacity))
+        self._columns = {
+            name: array("d", [math.nan]) * self.capacity for name in HISTORY_FIELDS
+        }
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
+
+    def append(self, snapshot: TelemetrySnapshot, at: float | None = None) -> None:
+        at = time.time() if at is None else at
+        values = [
+            (name, _to_float(getter(snapshot)))
+            for name, getter in HISTORY_FIELDS.items()
+        ]
+        with self._lock:
+            if self._size and at < self._times[self._physical(self._size - 1)]:
+                # Keep the ring sorted so range lookups can bisect.
+                at = self._times[self._physical(self._size - 1)]
+            if self._size < self.capacity:
+                slot = self._physical(self._size)
+            else:
+                slot = self._head
+            self._times[slot] = at
+            for name, value in values:
+                self._columns[name][slot] = value
+            if self._size < self.capacity:
+                self._size += 1
+            else:
+                self._head = (self._head + 1) % self.capacity
+
+    def query(
+        self,
+        fields: Sequence[str] | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        step: float | None = None,
+    ) -> dict[str, Any]:
+        """Return min/max/mean per time bucket for each requested field.
+
+        ``start``/``end`` are unix seconds; non-positive values are relative to
+        now (``start=-600`` is "the last ten minutes"). Without ``step`` the
+        range is split into about ``DEFAULT_BUCKETS`` buckets.
+        """
+
+        names = list(fields) if fields else list(HISTORY_FIELDS)
+        unknown = [name for name in names if name not in HISTORY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown telemetry fields: {', '.join(unknown)}")
+
+        now = time.time()
+        with self._lock:
+            if self._size == 0:
+                return _empty_result(names, start, end, step)
+            first_at = self._times[self._physical(0)]
+            last_at = self._times[self._physical(self._size - 1)]
+            range_start = _resolve_time(start, now, first_at)
+            range_end = _resolve_time(end, now, last_at)
+            if range_end < range_start:
+                raise ValueError("'to' must not be earlier than 'from'.")
+            bucket_step = _resolve_step(step, range_start, range_end)
+            lo = self._bisect(range_start)
+            hi = self._bisect(range_end, right=True)
+            times = [self._times[self._physical(i)] for i in range(lo, hi)]
+            columns = {
+                name: [self._columns[name][self._physical(i)] for i in range(lo, hi)]
+                for name in names
+            }
+
+        span = range_end - range_start
+        bucket_count = max(1, math.ceil(span / bucket_step - 1e-9))
+        last_bucket = bucket_count - 1
+        bucket_ids = [
+            min(int((at - range_start) // bucket_step), last_bucket) for at in times
+        ]
+        result_fields = {
+            name: _rollup(bucket_ids, columns[name], bucket_count) for name in names
+        }
+        return {
+            "from": range_start,
+            "to": range_end,
+            "step": bucket_step,
+            "t": [range_start + i * bucket_step for i in range(bucket_count)],
+            "count": _counts(bucket_ids, bucket_count),
+            "fields": result_fields,
+        }
+
+    def _physical(self, logical: int) -> int:
+        return (self._head + logical) % self.capacity
+
+    def _bisect(self, at: float, right: bool = False) -> int:
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._times[self._physical(mid)]
+            if value < at or (right and value == at):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def parse_fields(raw: str | None) -> list[str] | None:
+    if not raw:
+        return None
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def _rollup(
+    bucket_ids: Iterable[int], values: Sequence[float], bucket_count: int
+) -> dict[str, list[float | None]]:
+    mins: list[float | None] = [None] * bucket_count
+    maxs: list[float | None] = [None] * bucket_count
+    sums = [0.0] * bucket_count
+    counts = [0] * bucket_count
+    for bucket, value in zip(bucket_ids, values):
+        if math.isnan(value):
+            continue
+        current_min = mins[bucket]
+        current_max = maxs[bucket]
+        if current_min is None or value < current_min:
+            mins[bucket] = value
+        if current_max is None or value > current_max:
+            maxs[bucket] = value
+        sums[bucket] += value
+        counts[bucket] += 1
+    means = [sums[i] / counts[i] if counts[i] else None for i in range(bucket_count)]
+    return {"min": mins, "max": maxs, "mean": means}
+
+
+def _counts(bucket_ids: Iterable[int], bucket_count: int) -> list[int]:
+    counts = [0] * bucket_count
+    for bucket in bucket_ids:
+        counts[bucket] += 1
+    return counts
+
+
+def _resolve_time(value: float | None, now: float, default: float) -> float:
+    if value is None:
+        return default
+    if value <= 0:
+        return now + value
+    return value
+
+
+def _resolve_step(step: float | None, start: float, end: float) -> float:
+    span = max(end - start, 1e-3)
+    if step is None or step <= 0:
+        return span / DEFAULT_BUCKETS
+    return max(step, span / MAX_BUCKETS)
+
+
+def _empty_result(
+    names: Sequence[str], start: float | None, end: float | None, step: float | None
+) -> dict[str, Any]:
+    return {
+        "from": start,
+        "to": end,
+        "step": step,
+        "t": [],
+        "count": [],
+        "fields": {name: {"min": [], "max": [], "mean": []} for name in names},
+    }
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
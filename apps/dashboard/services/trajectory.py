@@ -5,27 +5,65 @@ from __future__ import annotations
 import json
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from pydjimqtt.core.mqtt_client import MQTTClient
+from .scheduler import Job, PeriodicScheduler, shared_scheduler
+from .trajectory_codec import (
+    TrajectoryAssembler,
+    TrajectoryTransfer,
+    content_digest,
+    encode_transfer,
+    point_rows,
+)
+
+if TYPE_CHECKING:
+    from pydjimqtt.core.mqtt_client import MQTTClient
 
 
 class TrajectoryService:
-    """Keeps latest trajectory received from MQTT and relays HTTP payloads to MQTT."""
+    """Keeps latest trajectory received from MQTT and relays HTTP payloads to MQTT.
+
+    Each changed HTTP payload is simplified, quantized and published as a
+    chunked transfer (see `trajectory_codec`): retained chunks on
+    ``<topic>/chunk/<seq>``, then a retained manifest with
+    ``trajectory_version`` / ``trajectory_hash`` on ``<topic>``. An
+    unchanged payload (same content hash) is not re-encoded or republished;
+    the cached manifest is re-sent every ``keepalive`` seconds.
+    """
+
+    VOLATILE_KEYS = ("trajectory_version", "trajectory_hash", "updated_at", "points")
 
     def __init__(
-        self, client: MQTTClient, topic: str, publish_rate: float = 1.0
+        self,
+        client: MQTTClient,
+        topic: str,
+        keepalive: float = 30.0,
+        scheduler: PeriodicScheduler | None = None,
+        *,
+        simplify_tolerance_m: float = 0.02,
+        simplify_tolerance_yaw_deg: float = 1.0,
+        chunk_points: int = 500,
     ) -> None:
         self.client = client
         self.topic = (topic or "uav/trajectory").strip()
-        self.publish_interval = 1.0 / max(publish_rate, 0.1)
+        self.chunk_topic = f"{self.topic}/chunk"
+        self.keepalive = max(keepalive, 1.0)
+        self.simplify_tolerance_m = max(simplify_tolerance_m, 0.0)
+        self.simplify_tolerance_yaw_deg = max(simplify_tolerance_yaw_deg, 0.0)
+        self.chunk_points = max(int(chunk_points), 1)
         self._lock = threading.Lock()
-        self._http_payload: Optional[Dict[str, Any]] = None
+        self._version = 0
+        self._digest: Optional[str] = None
+        self._transfer: Optional[TrajectoryTransfer] = None
+        self._published: Optional[Dict[str, Any]] = None
+        self._published_at = 0.0
+        self._assembler = TrajectoryAssembler()
+        self._last_is_own = False
         self._last_mqtt_payload: Optional[Dict[str, Any]] = None
         self._last_mqtt_at: Optional[float] = None
         self._original_on_message = None
-        self._stop_event = threading.Event()
-        self._publisher_thread: Optional[threading.Thread] = None
+        self._scheduler = scheduler or shared_scheduler()
+        self._publisher_job: Optional[Job] = None
 
         if self.topic:
             self._attach_listener()
@@ -37,68 +75,156 @@ class TrajectoryService:
             return
 
         self._original_on_message = mqtt_client.on_message
+        chunk_prefix = f"{self.chunk_topic}/"
 
         def _wrapped(client, userdata, msg):
             if msg.topic == self.topic:
-                self._handle_payload(msg.payload)
+                self._handle_manifest(msg.payload)
+            elif msg.topic.startswith(chunk_prefix):
+                self._handle_chunk(msg.topic[len(chunk_prefix) :], msg.payload)
             if self._original_on_message:
                 self._original_on_message(client, userdata, msg)
 
         mqtt_client.on_message = _wrapped
         mqtt_client.subscribe(self.topic, qos=0)
+        mqtt_client.subscribe(f"{self.chunk_topic}/+", qos=0)
 
-    def _handle_payload(self, raw_payload: bytes) -> None:
+    def _handle_manifest(self, raw_payload: bytes) -> None:
+        with self._lock:
+            transfer = self._transfer
+            # Our own retained echo: reuse the dict instead of reassembling it.
+            if transfer is not None and raw_payload == transfer.manifest_bytes:
+                self._last_is_own = True
+                self._last_mqtt_at = time.time()
+                return
         try:
             payload = json.loads(raw_payload.decode())
         except Exception:
             return
+        if not isinstance(payload, dict) or "chunk_count" not in payload:
+            # Unchunked payload from an older publisher.
+            self._store_received(payload)
+            return
+        with self._lock:
+            assembled = self._assembler.add_manifest(payload)
+        if assembled is not None:
+            self._store_received(assembled)
+
+    def _handle_chunk(self, seq: str, raw_payload: bytes) -> None:
+        if not raw_payload:
+            return
+        with self._lock:
+            transfer = self._transfer
+        if transfer is not None and seq.isdigit() and int(seq) < len(transfer.chunks):
+            if raw_payload == transfer.chunks[int(seq)]:
+                return
+        try:
+            chunk = json.loads(raw_payload.decode())
+        except Exception:
+            return
+        with self._lock:
+            assembled = self._assembler.add_chunk(chunk)
+        if assembled is not None:
+            self._store_received(assembled)
+
+    def _store_received(self, payload: Dict[str, Any]) -> None:
         with self._lock:
             self._last_mqtt_payload = payload
+            self._last_is_own = False
             self._last_mqtt_at = time.time()
 
     def _start_publisher(self) -> None:
-        if self._publisher_thread and self._publisher_thread.is_alive():
+        if self._publisher_job and not self._publisher_job.cancelled:
             return
-
-        self._stop_event.clear()
-        self._publisher_thread = threading.Thread(
-            target=self._publisher_loop, name="trajectory-publisher", daemon=True
+        self._publisher_job = self._scheduler.add_job(
+            "trajectory-keepalive", self._keepalive, self.keepalive
         )
-        self._publisher_thread.start()
-
-    def _publisher_loop(self) -> None:
-        while not self._stop_event.is_set():
-            payload = None
-            with self._lock:
-                if self._http_payload:
-                    payload = dict(self._http_payload)
-            if payload:
-                self.publish(payload)
-            time.sleep(self.publish_interval)
-
-    def set_http_payload(self, payload: Dict[str, Any]) -> None:
+
+    def _keepalive(self) -> None:
         with self._lock:
-            self._http_payload = payload
-        self.publish(payload)
+            transfer = self._transfer
+            due = time.monotonic() - self._published_at >= self.keepalive * 0.5
+        if transfer is not None and due:
+            self._send(self.topic, transfer.manifest_bytes)
+
+    def set_http_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Publish ``payload`` if its content changed; returns the transfer summary."""
 
-    def publish(self, payload: Dict[str, Any]) -> None:
+        meta = {key: value for key, value in payload.items() if key not in self.VOLATILE_KEYS}
+        xyz, yaw, photo = point_rows(payload.get("points") or [])
+        digest = content_digest(meta, xyz, yaw, photo)
+        with self._lock:
+            if digest == self._digest and self._transfer is not None:
+                return self._transfer.summary()
+            self._version += 1
+            version = self._version
+        transfer = encode_transfer(
+            meta,
+            xyz,
+            yaw,
+            photo,
+            {
+                "trajectory_version": version,
+                "trajectory_hash": digest,
+                "updated_at": payload.get("updated_at"),
+            },
+            tolerance_m=self.simplify_tolerance_m,
+            tolerance_yaw_deg=self.simplify_tolerance_yaw_deg,
+            chunk_points=self.chunk_points,
+        )
+        with self._lock:
+            if version != self._version:
+                # A newer payload won the race; it publishes itself.
+                return transfer.summary()
+            previous = self._transfer
+            self._digest = digest
+            self._transfer = transfer
+            self._published = None
+        self._publish_transfer(transfer, previous)
+        return transfer.summary()
+
+    def _publish_transfer(
+        self, transfer: TrajectoryTransfer, previous: Optional[TrajectoryTransfer]
+    ) -> None:
+        for seq, chunk in enumerate(transfer.chunks):
+            self._send(f"{self.chunk_topic}/{seq}", chunk)
+        stale = len(previous.chunks) if previous else 0
+        for seq in range(len(transfer.chunks), stale):
+            # Empty retained payload clears the broker's copy.
+            self._send(f"{self.chunk_topic}/{seq}", b"")
+        self._send(self.topic, transfer.manifest_bytes)
+
+    def _send(self, topic: str, body: bytes) -> None:
         if not self.client.client:
             return
         try:
-            self.client.client.publish(
-                self.topic,
-                json.dumps(payload, ensure_ascii=False),
-                qos=0,
-                retain=True,
-            )
+            self.client.client.publish(topic, body, qos=0, retain=True)
         except Exception:
             return
+        with self._lock:
+            self._published_at = time.monotonic()
+
+    def version(self) -> int:
+        with self._lock:
+            return self._version
 
     def latest(self) -> tuple[Optional[Dict[str, Any]], Optional[float]]:
         with self._lock:
-            return self._last_mqtt_payload, self._last_mqtt_at
+            if not self._last_is_own or self._transfer is None:
+                return self._last_mqtt_payload, self._last_mqtt_at
+            if self._published is None:
+                # Decoded once per version, on first read.
+                self._published = _decode_transfer(self._transfer)
+            return self._published, self._last_mqtt_at
 
     def stop(self) -> None:
-        self._stop_event.set()
-        if self._publisher_thread:
-            self._publisher_thread.join(timeout=2)
+        if self._publisher_job:
+            self._scheduler.remove_job(self._publisher_job)
+            self._publisher_job = None
+
+
+def _decode_transfer(transfer: TrajectoryTransfer) -> Dict[str, Any]:
+    assembler = TrajectoryAssembler()
+    for chunk in transfer.chunks:
+        assembler.add_chunk(json.loads(chunk))
+    return assembler.add_manifest(dict(transfer.manifest)) or dict(transfer.manifest)
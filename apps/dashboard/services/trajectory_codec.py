@@ -0,0 +1,262 @@
+"""Trajectory preprocessing and chunked MQTT transfer.
+
+`encode_transfer` turns an HTTP trajectory payload into what
+`TrajectoryService` publishes:
+
+1. Douglas–Peucker simplification over x/y/z + yaw. A point is dropped only
+   if it lies within ``tolerance_m`` of the simplified segment *and* its yaw
+   is within ``tolerance_yaw_deg`` of the yaw interpolated along it. Points
+   where ``takePhoto`` changes are kept, so photo runs keep their bounds.
+2. Quantization: x/y/z to integer millimetres, yaw to centidegrees.
+3. Chunking: rows ``[x_mm, y_mm, z_mm, yaw_cdeg, photo]`` are split into
+   sequence-numbered chunks published retained on ``<topic>/chunk/<seq>``;
+   the manifest (metadata, counts, version, hash) goes to ``<topic>`` last.
+
+Subscribers rebuild the trajectory with `TrajectoryAssembler` once every
+chunk of the manifest's ``trajectory_version`` has arrived. The mission
+draft is not affected: only the relayed copy is simplified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .waypoints import WaypointArray
+
+ENCODING = "chunked/v1"
+FIELDS = ("x_mm", "y_mm", "z_mm", "yaw_cdeg", "photo")
+XYZ_SCALE = 1000.0
+YAW_SCALE = 100.0
+
+
+def _wrap_degrees(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def simplify_indices(
+    xyz: np.ndarray,
+    yaw: np.ndarray,
+    tolerance_m: float,
+    tolerance_yaw_deg: float,
+    anchors: Sequence[int] = (),
+) -> np.ndarray:
+    """Indices kept by Douglas–Peucker; each segment's interior is scored at once."""
+
+    count = len(xyz)
+    if count <= 2:
+        return np.arange(count)
+    tolerance_m = max(float(tolerance_m), 1e-9)
+    tolerance_yaw_deg = max(float(tolerance_yaw_deg), 1e-9)
+
+    keep = np.zeros(count, dtype=bool)
+    fixed = sorted({0, count - 1, *(int(index) for index in anchors if 0 <= index < count)})
+    keep[fixed] = True
+    stack = list(zip(fixed[:-1], fixed[1:]))
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        interior = xyz[start + 1 : end]
+        origin = xyz[start]
+        direction = xyz[end] - origin
+        length_sq = float(direction @ direction)
+        if length_sq > 0.0:
+            t = np.clip((interior - origin) @ direction / length_sq, 0.0, 1.0)
+        else:
+            # Hover segment (e.g. yaw-only turn): progress by index instead.
+            t = np.arange(1, end - start) / (end - start)
+        offsets = interior - (origin + t[:, None] * direction)
+        distance = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+        yaw_span = _wrap_degrees(yaw[end] - yaw[start])
+        yaw_error = np.abs(_wrap_degrees(yaw[start + 1 : end] - (yaw[start] + t * yaw_span)))
+        score = np.maximum(distance / tolerance_m, yaw_error / tolerance_yaw_deg)
+        worst = int(np.argmax(score))
+        if score[worst] <= 1.0:
+            continue
+        split = start + 1 + worst
+        keep[split] = True
+        stack.append((start, split))
+        stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+@dataclass
+class TrajectoryTransfer:
+    """Encoded manifest + chunks for one trajectory version."""
+
+    manifest: Dict[str, Any]
+    manifest_bytes: bytes
+    chunks: List[bytes]
+    source_points: int
+    points: int
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.manifest_bytes) + sum(len(chunk) for chunk in self.chunks)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "trajectory_version": self.manifest["trajectory_version"],
+            "source_points": self.source_points,
+            "points": self.points,
+            "chunks": len(self.chunks),
+            "bytes": self.size_bytes,
+        }
+
+
+def point_rows(points: Sequence[Mapping[str, Any]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(xyz, yaw, photo)`` arrays from ``{"x", "y", "z", "yaw", "takePhoto"}`` dicts."""
+
+    if isinstance(points, WaypointArray):
+        # Already validated columns; copy into the layout the encoder expects.
+        data = points.data
+        xyz = np.column_stack((data["x"], data["y"], data["z"]))
+        return xyz, data["yaw"].copy(), data["take_photo"].astype(np.int8)
+    count = len(points)
+    xyz = np.empty((count, 3), dtype=np.float64)
+    yaw = np.empty(count, dtype=np.float64)
+    photo = np.empty(count, dtype=np.int8)
+    for index, point in enumerate(points):
+        xyz[index] = (point["x"], point["y"], point["z"])
+        yaw[index] = point["yaw"]
+        photo[index] = 1 if point.get("takePhoto", True) else 0
+    return xyz, yaw, photo
+
+
+def content_digest(
+    meta: Mapping[str, Any], xyz: np.ndarray, yaw: np.ndarray, photo: np.ndarray
+) -> str:
+    """Hash of metadata + raw point arrays (no JSON encoding of the points)."""
+
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(json.dumps(meta, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for array in (xyz, yaw, photo):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def encode_transfer(
+    meta: Mapping[str, Any],
+    xyz: np.ndarray,
+    yaw: np.ndarray,
+    photo: np.ndarray,
+    header: Mapping[str, Any],
+    *,
+    tolerance_m: float,
+    tolerance_yaw_deg: float,
+    chunk_points: int,
+) -> TrajectoryTransfer:
+    """Simplify, quantize and chunk the points from `point_rows`.
+
+    ``meta`` (trajectory_id, name, ...) and ``header`` (version, hash,
+    updated_at) make up the manifest; every chunk carries the version.
+    A zero tolerance disables simplification.
+    """
+
+    count = len(xyz)
+    if count > 2 and tolerance_m > 0 and tolerance_yaw_deg > 0:
+        changes = np.flatnonzero(np.diff(photo)) + 1
+        anchors = np.concatenate((changes - 1, changes))
+        kept = simplify_indices(xyz, yaw, tolerance_m, tolerance_yaw_deg, anchors)
+    else:
+        kept = np.arange(count)
+
+    rows = np.empty((len(kept), len(FIELDS)), dtype=np.int64)
+    if len(kept):
+        rows[:, :3] = np.rint(xyz[kept] * XYZ_SCALE)
+        rows[:, 3] = np.rint(_wrap_degrees(yaw[kept]) * YAW_SCALE)
+        rows[:, 4] = photo[kept]
+
+    version = header["trajectory_version"]
+    chunk_points = max(int(chunk_points), 1)
+    chunks = [
+        json.dumps(
+            {
+                "trajectory_version": version,
+                "seq": seq,
+                "offset": offset,
+                "rows": rows[offset : offset + chunk_points].tolist(),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        for seq, offset in enumerate(range(0, len(rows), chunk_points))
+    ]
+
+    manifest = dict(meta)
+    manifest.update(header)
+    manifest.update(
+        {
+            "encoding": ENCODING,
+            "fields": list(FIELDS),
+            "source_point_count": count,
+            "point_count": len(rows),
+            "chunk_points": chunk_points,
+            "chunk_count": len(chunks),
+        }
+    )
+    return TrajectoryTransfer(
+        manifest=manifest,
+        manifest_bytes=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
+        chunks=chunks,
+        source_points=count,
+        points=len(rows),
+    )
+
+
+def decode_rows(rows: Sequence[Sequence[int]]) -> List[Dict[str, Any]]:
+    """Quantized rows back to the ``points`` dicts of the HTTP payload."""
+
+    return [
+        {
+            "x": x / XYZ_SCALE,
+            "y": y / XYZ_SCALE,
+            "z": z / XYZ_SCALE,
+            "yaw": yaw / YAW_SCALE,
+            "takePhoto": bool(photo),
+        }
+        for x, y, z, yaw, photo in rows
+    ]
+
+
+@dataclass
+class TrajectoryAssembler:
+    """Rebuild a chunked trajectory from manifest + chunk messages (any order)."""
+
+    manifest: Optional[Dict[str, Any]] = None
+    _chunks: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    def add_manifest(self, manifest: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        version = manifest.get("trajectory_version")
+        self.manifest = manifest
+        self._chunks = {
+            seq: chunk
+            for seq, chunk in self._chunks.items()
+            if chunk.get("trajectory_version") == version
+        }
+        return self._complete()
+
+    def add_chunk(self, chunk: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Per-topic ordering means a later chunk for a seq always supersedes.
+        self._chunks[int(chunk.get("seq", 0))] = chunk
+        return self._complete()
+
+    def _complete(self) -> Optional[Dict[str, Any]]:
+        manifest = self.manifest
+        if manifest is None:
+            return None
+        version = manifest.get("trajectory_version")
+        count = int(manifest.get("chunk_count", 0))
+        chunks = [self._chunks.get(seq) for seq in range(count)]
+        if any(chunk is None or chunk.get("trajectory_version") != version for chunk in chunks):
+            return None
+        rows: List[Sequence[int]] = []
+        for chunk in chunks:
+            rows.extend(chunk["rows"])  # type: ignore[index]
+        payload = {key: value for key, value in manifest.items() if key not in ("fields",)}
+        payload["points"] = decode_rows(rows)
+        return payload
@@ -0,0 +1,209 @@
+"""Columnar waypoint storage for mission drafts, snapshots and control specs.
+
+`WaypointArray` wraps a read-only NumPy structured array
+(``x``/``y``/``z``/``yaw`` float64, ``take_photo`` bool). The HTTP payload is
+converted in a single `np.fromiter` pass and validated per column (finite
+values, mission bounds), so a 100k-point draft costs one array instead of
+100k dicts plus a deep copy. Because the array is immutable, the draft, the
+run snapshot and the control spec share it without copying; indexing yields
+`MissionWaypoint` (or the control layer's `MissionPoint`, see
+`with_point_type`) objects on demand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping, Sequence, overload
+
+import numpy as np
+
+from .mission_models import MissionWaypoint
+
+WAYPOINT_DTYPE = np.dtype(
+    [
+        ("x", np.float64),
+        ("y", np.float64),
+        ("z", np.float64),
+        ("yaw", np.float64),
+        ("take_photo", np.bool_),
+    ]
+)
+COORDINATE_FIELDS = ("x", "y", "z", "yaw")
+
+
+@dataclass(frozen=True)
+class WaypointBounds:
+    """Accepted waypoint box in the SLAM frame (metres)."""
+
+    max_abs_xy: float = 5000.0
+    min_z: float = -50.0
+    max_z: float = 500.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> WaypointBounds:
+        return cls(
+            max_abs_xy=float(config.get("MISSION_MAX_ABS_XY", cls.max_abs_xy)),
+            min_z=float(config.get("MISSION_MIN_Z", cls.min_z)),
+            max_z=float(config.get("MISSION_MAX_Z", cls.max_z)),
+        )
+
+
+def _row(entry: Any) -> tuple[Any, Any, Any, Any, bool]:
+    return (
+        entry["x"],
+        entry["y"],
+        entry["z"],
+        entry["yaw"],
+        bool(entry.get("takePhoto", True)),
+    )
+
+
+def _first_invalid_entry(points_raw: Sequence[Any]) -> ValueError:
+    # Slow path, only taken once the vectorized conversion has failed.
+    for idx, entry in enumerate(points_raw):
+        if not isinstance(entry, dict):
+            return ValueError(f"Point[{idx}] must be an object.")
+        try:
+            for key in COORDINATE_FIELDS:
+                float(entry[key])
+        except (KeyError, TypeError, ValueError):
+            return ValueError(f"Invalid point[{idx}] fields.")
+    return ValueError("Invalid point payload.")
+
+
+class WaypointArray(Sequence[Any]):
+    """Immutable sequence of waypoints backed by a structured array."""
+
+    __slots__ = ("_data", "_point_type")
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        point_type: Callable[..., Any] = MissionWaypoint,
+    ) -> None:
+        if data.dtype != WAYPOINT_DTYPE or data.ndim != 1:
+            raise ValueError("WaypointArray needs a 1-D array of WAYPOINT_DTYPE.")
+        if data.flags.writeable:
+            data = data.view()
+            data.flags.writeable = False
+        self._data = data
+        self._point_type = point_type
+
+    @classmethod
+    def empty(cls) -> WaypointArray:
+        return cls(np.empty(0, dtype=WAYPOINT_DTYPE))
+
+    @classmethod
+    def from_payload(
+        cls,
+        points_raw: Sequence[Any],
+        bounds: WaypointBounds | None = None,
+    ) -> WaypointArray:
+        """Convert and validate ``{"x", "y", "z", "yaw", "takePhoto"}`` dicts."""
+
+        if isinstance(points_raw, WaypointArray):
+            points = points_raw.with_point_type(MissionWaypoint)
+        else:
+            try:
+                data = np.fromiter(
+                    map(_row, points_raw), dtype=WAYPOINT_DTYPE, count=len(points_raw)
+                )
+            except (KeyError, TypeError, ValueError, AttributeError) as exc:
+                raise _first_invalid_entry(points_raw) from exc
+            points = cls(data)
+        points.validate(bounds)
+        return points
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Sequence[Any]) -> WaypointArray:
+        """Build from objects with ``x``/``y``/``z``/``yaw``/``take_photo`` attributes."""
+
+        data = np.fromiter(
+            ((p.x, p.y, p.z, p.yaw, bool(p.take_photo)) for p in waypoints),
+            dtype=WAYPOINT_DTYPE,
+            count=len(waypoints),
+        )
+        return cls(data)
+
+    def validate(self, bounds: WaypointBounds | None = None) -> None:
+        """Raise ValueError naming the first non-finite or out-of-bounds point."""
+
+        data = self._data
+        for key in COORDINATE_FIELDS:
+            bad = ~np.isfinite(data[key])
+            if bad.any():
+                idx = int(np.argmax(bad))
+                raise ValueError(f"Point[{idx}] field '{key}' must be a finite number.")
+        if bounds is None or not len(data):
+            return
+        outside = (
+            (np.abs(data["x"]) > bounds.max_abs_xy)
+            | (np.abs(data["y"]) > bounds.max_abs_xy)
+            | (data["z"] < bounds.min_z)
+            | (data["z"] > bounds.max_z)
+        )
+        if outside.any():
+            idx = int(np.argmax(outside))
+            raise ValueError(
+                f"Point[{idx}] is outside the mission bounds "
+                f"(|x|,|y| <= {bounds.max_abs_xy:g}, "
+                f"{bounds.min_z:g} <= z <= {bounds.max_z:g})."
+            )
+
+    @property
+    def data(self) -> np.ndarray:
+        """The read-only structured array (shared, never copied)."""
+
+        return self._data
+
+    def column(self, key: str) -> np.ndarray:
+        return self._data[key]
+
+    def with_point_type(self, point_type: Callable[..., Any]) -> WaypointArray:
+        """Same storage, items built as ``point_type(x, y, z, yaw, take_photo)``."""
+
+        if point_type is self._point_type:
+            return self
+        return WaypointArray(self._data, point_type)
+
+    def to_points(self) -> list[dict[str, Any]]:
+        """JSON-ready ``points`` list, in the HTTP payload's field names."""
+
+        data = self._data
+        # Per-column tolist() is markedly faster than tolist() on the records.
+        return [
+            {"x": x, "y": y, "z": z, "yaw": yaw, "takePhoto": take_photo}
+            for x, y, z, yaw, take_photo in zip(
+                data["x"].tolist(),
+                data["y"].tolist(),
+                data["z"].tolist(),
+                data["yaw"].tolist(),
+                data["take_photo"].tolist(),
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> WaypointArray: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return WaypointArray(self._data[index], self._point_type)
+        return self._point_type(*self._data[index].item())
+
+    def __iter__(self) -> Iterator[Any]:
+        point_type = self._point_type
+        for row in self._data.tolist():
+            yield point_type(*row)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Unpickled arrays come back writeable; the constructor re-freezes them.
+        return (WaypointArray, (self._data, self._point_type))
+
+    def __repr__(self) -> str:
+        return f"WaypointArray({len(self._data)} points)"
@@ -0,0 +1,66 @@
+"""Offline simulation: fake MQTT broker, pydjimqtt clients and DJI gateway.
+
+Enable with ``DASHBOARD_SIM=1``; ``RuntimeHub`` then builds its SLAM and drone
+clients through ``SimEnvironment`` instead of ``pydjimqtt``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from .broker import FakeBroker, FakeMessage, FakePahoClient, topic_matches
+from .client import FakeMQTTClient, FakeServiceCaller
+from .gateway import FakeGateway, SlamTopics
+
+SIM_GATEWAY_SN = "SIM-GATEWAY-0001"
+
+
+class SimEnvironment:
+    """One broker + gateway shared by every client the dashboard creates."""
+
+    def __init__(self, app_config: Mapping[str, Any]) -> None:
+        self.broker = FakeBroker()
+        self.gateway_sn = str(app_config.get("SIM_GATEWAY_SN") or SIM_GATEWAY_SN)
+        self.gateway = FakeGateway(
+            self.broker,
+            self.gateway_sn,
+            slam_topics=SlamTopics(
+                pose=str(app_config.get("SLAM_POSE_TOPIC", "slam/position")),
+                yaw=str(app_config.get("SLAM_YAW_TOPIC", "slam/yaw")),
+                status=str(app_config.get("SLAM_STATUS_TOPIC", "slam/status")),
+                frequency=str(app_config.get("SLAM_FREQUENCY_TOPIC", "slam/frequency")),
+            ),
+            osd_hz=float(app_config.get("SIM_OSD_HZ", 30.0)),
+            pose_hz=float(app_config.get("SIM_POSE_HZ", 30.0)),
+        )
+
+    def start(self) -> None:
+        self.gateway.start()
+
+    def stop(self) -> None:
+        self.gateway.stop()
+
+    def link_outage(self, seconds: float) -> None:
+        """Cut every dashboard client off the broker for ``seconds``."""
+
+        self.broker.outage(seconds, exclude=(self.gateway.client,))
+
+    def client_factory(self, gateway_sn: str, mqtt_config: Mapping[str, Any]) -> FakeMQTTClient:
+        return FakeMQTTClient(gateway_sn, mqtt_config, broker=self.broker)
+
+    def caller_factory(self, client: FakeMQTTClient) -> FakeServiceCaller:
+        return FakeServiceCaller(client)
+
+
+__all__ = [
+    "FakeBroker",
+    "FakeGateway",
+    "FakeMQTTClient",
+    "FakeMessage",
+    "FakePahoClient",
+    "FakeServiceCaller",
+    "SIM_GATEWAY_SN",
+    "SimEnvironment",
+    "SlamTopics",
+    "topic_matches",
+]
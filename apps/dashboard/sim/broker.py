@@ -0,0 +1,212 @@
+"""In-process MQTT broker stand-in and a paho-compatible client for it."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+OnMessage = Callable[[Any, Any, Any], None]
+
+
+@dataclass(frozen=True)
+class FakeMessage:
+    """Subset of ``paho.mqtt.client.MQTTMessage`` read by the services."""
+
+    topic: str
+    payload: bytes
+    qos: int = 0
+    retain: bool = False
+
+
+@dataclass(frozen=True)
+class _PublishInfo:
+    rc: int = 0
+    mid: int = 0
+
+    def wait_for_publish(self, timeout: float | None = None) -> None:
+        return None
+
+    def is_published(self) -> bool:
+        return True
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """MQTT wildcard match (``+`` single level, ``#`` remaining levels)."""
+
+    pattern_parts = pattern.split("/")
+    topic_parts = topic.split("/")
+    for index, part in enumerate(pattern_parts):
+        if part == "#":
+            return True
+        if index >= len(topic_parts):
+            return False
+        if part != "+" and part != topic_parts[index]:
+            return False
+    return len(pattern_parts) == len(topic_parts)
+
+
+class FakeBroker:
+    """Routes publishes to subscribed fake clients; no sockets, no persistence."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: list[FakePahoClient] = []
+        self._mids = itertools.count(1)
+        self._refuse_until = 0.0
+        self.published = 0
+
+    def register(self, client: "FakePahoClient") -> None:
+        with self._lock:
+            if client not in self._clients:
+                self._clients.append(client)
+
+    def unregister(self, client: "FakePahoClient") -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    def outage(self, seconds: float, exclude: tuple["FakePahoClient", ...] = ()) -> None:
+        """Drop every client link (except ``exclude``) and refuse reconnects."""
+
+        with self._lock:
+            self._refuse_until = time.monotonic() + seconds
+            dropped = [client for client in self._clients if client not in exclude]
+        for client in dropped:
+            client.drop_link()
+
+    def accepting(self) -> bool:
+        return time.monotonic() >= self._refuse_until
+
+    def publish(self, topic: str, payload: bytes, qos: int = 0) -> int:
+        message = FakeMessage(topic, payload, qos)
+        with self._lock:
+            targets = [client for client in self._clients if client.wants(topic)]
+            self.published += 1
+            mid = next(self._mids)
+        for client in targets:
+            client.deliver(message)
+        return mid
+
+
+class FakePahoClient:
+    """Quacks like ``paho.mqtt.client.Client`` for the calls the dashboard makes.
+
+    Each client has its own delivery thread so ``on_message`` runs off the
+    publisher's thread, like paho's network loop.
+    """
+
+    def __init__(self, broker: FakeBroker, client_id: str = "") -> None:
+        self.broker = broker
+        self.client_id = client_id
+        self.on_message: OnMessage | None = None
+        self.on_connect: Callable[..., None] | None = None
+        self.on_disconnect: Callable[..., None] | None = None
+        self._subscriptions: set[str] = set()
+        self._lock = threading.Lock()
+        self._inbox: queue.SimpleQueue[FakeMessage | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._connected = False
+
+    def connect(self, *args: Any, **kwargs: Any) -> int:
+        self.broker.register(self)
+        self._connected = True
+        self.loop_start()
+        if self.on_connect:
+            self.on_connect(self, None, {}, 0)
+        return 0
+
+    def disconnect(self) -> int:
+        self._connected = False
+        self.broker.unregister(self)
+        self.loop_stop()
+        if self.on_disconnect:
+            self.on_disconnect(self, None, 0)
+        return 0
+
+    def reconnect(self) -> int:
+        if not self.broker.accepting():
+            raise ConnectionRefusedError("fake broker unavailable")
+        self.broker.register(self)
+        self._connected = True
+        if self.on_connect:
+            self.on_connect(self, None, {}, 0)
+        return 0
+
+    def drop_link(self) -> None:
+        """Lose the connection like a network blip: clean session, no auto-reconnect."""
+
+        self._connected = False
+        self.broker.unregister(self)
+        with self._lock:
+            self._subscriptions.clear()
+        if self.on_disconnect:
+            self.on_disconnect(self, None, 7)
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def loop_start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name=f"fake-mqtt-{self.client_id}", daemon=True
+        )
+        self._thread.start()
+
+    def loop_stop(self) -> None:
+        if self._thread and self._thread.is_alive():
+            self._inbox.put(None)
+            if threading.current_thread() is not self._thread:
+                self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def subscribe(self, topic: str, qos: int = 0) -> tuple[int, int]:
+        with self._lock:
+            self._subscriptions.add(topic)
+        return 0, 0
+
+    def unsubscribe(self, topic: str) -> tuple[int, int]:
+        with self._lock:
+            self._subscriptions.discard(topic)
+        return 0, 0
+
+    def publish(
+        self, topic: str, payload: Any = None, qos: int = 0, retain: bool = False
+    ) -> _PublishInfo:
+        if payload is None:
+            body = b""
+        elif isinstance(payload, (bytes, bytearray)):
+            body = bytes(payload)
+        else:
+            body = str(payload).encode("utf-8")
+        mid = self.broker.publish(topic, body, qos)
+        return _PublishInfo(0, mid)
+
+    def wants(self, topic: str) -> bool:
+        if not self._connected:
+            return False
+        with self._lock:
+            return any(topic_matches(pattern, topic) for pattern in self._subscriptions)
+
+    def deliver(self, message: FakeMessage) -> None:
+        self._inbox.put(message)
+
+    def _loop(self) -> None:
+        while True:
+            message = self._inbox.get()
+            if message is None:
+                return
+            handler = self.on_message
+            if not handler:
+                continue
+            try:
+                handler(self, None, message)
+            except Exception as exc:  # noqa: BLE001
+                logging.getLogger("dashboard").warning(
+                    "[sim] on_message failed topic=%s: %s", message.topic, exc
+                )
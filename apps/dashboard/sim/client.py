@@ -0,0 +1,220 @@
+"""Fake ``pydjimqtt`` client and service caller backed by ``FakeBroker``."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from typing import Any, Mapping
+
+from .broker import FakeBroker, FakePahoClient
+
+FLIGHT_MODE_NAMES = {
+    0: "待机",
+    1: "起飞准备",
+    2: "起飞准备完毕",
+    3: "手动飞行",
+    4: "自动起飞",
+    5: "航线飞行",
+    9: "自动返航",
+    10: "自动降落",
+    14: "未连接",
+    17: "虚拟摇杆",
+}
+
+
+def osd_topic(gateway_sn: str) -> str:
+    return f"thing/product/{gateway_sn}/osd"
+
+
+def services_topic(gateway_sn: str) -> str:
+    return f"thing/product/{gateway_sn}/services"
+
+
+def services_reply_topic(gateway_sn: str) -> str:
+    return f"thing/product/{gateway_sn}/services_reply"
+
+
+def drc_up_topic(gateway_sn: str) -> str:
+    return f"thing/product/{gateway_sn}/drc/up"
+
+
+def drc_down_topic(gateway_sn: str) -> str:
+    return f"thing/product/{gateway_sn}/drc/down"
+
+
+class FakeMQTTClient:
+    """Stand-in for ``pydjimqtt.core.MQTTClient`` (same constructor shape).
+
+    Parses the fake gateway's OSD into the getters ``TelemetryService``,
+    ``CameraService`` and friends call.
+    """
+
+    OFFLINE_AFTER_SEC = 3.0
+
+    def __init__(
+        self, gateway_sn: str, mqtt_config: Mapping[str, Any], *, broker: FakeBroker
+    ) -> None:
+        self.gateway_sn = gateway_sn
+        self.mqtt_config = dict(mqtt_config)
+        self.client = FakePahoClient(broker, client_id=f"sim-{gateway_sn}")
+        self._lock = threading.Lock()
+        self._osd: dict[str, Any] = {}
+        self._last_osd_at = 0.0
+        self._osd_frequency = 0.0
+
+    def connect(self) -> None:
+        self.client.on_message = self._on_message
+        self.client.connect(self.mqtt_config.get("host"), self.mqtt_config.get("port"))
+        self.client.subscribe(osd_topic(self.gateway_sn), qos=0)
+        self.client.subscribe(drc_up_topic(self.gateway_sn), qos=0)
+        self.client.subscribe(services_reply_topic(self.gateway_sn), qos=0)
+
+    def disconnect(self) -> None:
+        self.client.disconnect()
+
+    def publish(self, topic: str, payload: Any, qos: int = 0) -> None:
+        body = payload if isinstance(payload, (bytes, str)) else json.dumps(payload)
+        self.client.publish(topic, body, qos=qos)
+
+    def _on_message(self, client: Any, userdata: Any, msg: Any) -> None:
+        if msg.topic != osd_topic(self.gateway_sn):
+            return
+        try:
+            data = json.loads(msg.payload.decode()).get("data", {})
+        except Exception:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._last_osd_at:
+                interval = now - self._last_osd_at
+                if interval > 0:
+                    rate = 1.0 / interval
+                    if self._osd_frequency:
+                        rate = 0.9 * self._osd_frequency + 0.1 * rate
+                    self._osd_frequency = rate
+            self._last_osd_at = now
+            self._osd = data
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            return self._osd.get(key)
+
+    def get_latitude(self) -> float | None:
+        return self._get("latitude")
+
+    def get_longitude(self) -> float | None:
+        return self._get("longitude")
+
+    def get_height(self) -> float | None:
+        return self._get("height")
+
+    def get_relative_height(self) -> float | None:
+        return self._get("elevation")
+
+    def get_speed(self) -> tuple[float | None, float | None, float | None, float | None]:
+        with self._lock:
+            return (
+                self._osd.get("horizontal_speed"),
+                self._osd.get("speed_x"),
+                self._osd.get("speed_y"),
+                self._osd.get("vertical_speed"),
+            )
+
+    def get_battery_percent(self) -> int | None:
+        battery = self._get("battery") or {}
+        return battery.get("capacity_percent")
+
+    def get_osd_frequency(self) -> float:
+        with self._lock:
+            if time.monotonic() - self._last_osd_at > self.OFFLINE_AFTER_SEC:
+                return 0.0
+            return round(self._osd_frequency, 1)
+
+    def is_online(self) -> bool:
+        with self._lock:
+            return bool(self._last_osd_at) and (
+                time.monotonic() - self._last_osd_at <= self.OFFLINE_AFTER_SEC
+            )
+
+    def get_flight_mode(self) -> int | None:
+        return self._get("mode_code")
+
+    def get_flight_mode_name(self) -> str:
+        code = self.get_flight_mode()
+        if code is None:
+            return "未知"
+        return FLIGHT_MODE_NAMES.get(int(code), f"模式 {code}")
+
+    def get_camera_osd_data(self) -> dict[str, Any]:
+        cameras = self._get("cameras") or []
+        return dict(cameras[0]) if cameras else {}
+
+    def get_payload_index(self) -> str | None:
+        return self.get_camera_osd_data().get("payload_index")
+
+
+class FakeServiceCaller:
+    """Stand-in for ``pydjimqtt.core.ServiceCaller`` (services request/reply)."""
+
+    def __init__(self, client: FakeMQTTClient, timeout: float = 5.0) -> None:
+        self.client = client
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._events: dict[str, threading.Event] = {}
+        self._reply_topic = services_reply_topic(client.gateway_sn)
+        mqtt_client = client.client
+        original = mqtt_client.on_message
+
+        def _wrapped(raw_client, userdata, msg):
+            if msg.topic == self._reply_topic:
+                self._handle_reply(msg.payload)
+            if original:
+                original(raw_client, userdata, msg)
+
+        mqtt_client.on_message = _wrapped
+
+    def call(
+        self, method: str, data: Mapping[str, Any] | None = None, timeout: float | None = None
+    ) -> dict[str, Any]:
+        tid = str(uuid.uuid4())
+        event = threading.Event()
+        with self._lock:
+            self._events[tid] = event
+        payload = {
+            "tid": tid,
+            "bid": str(uuid.uuid4()),
+            "timestamp": int(time.time() * 1000),
+            "method": method,
+            "data": dict(data or {}),
+        }
+        topic = services_topic(self.client.gateway_sn)
+        self.client.client.publish(topic, json.dumps(payload))
+        try:
+            if not event.wait(self.timeout if timeout is None else timeout):
+                raise TimeoutError(f"Service call '{method}' timed out.")
+            with self._lock:
+                reply = self._pending.pop(tid, {})
+        finally:
+            with self._lock:
+                self._events.pop(tid, None)
+                self._pending.pop(tid, None)
+        result = reply.get("data", {}).get("result", 0)
+        if result != 0:
+            raise RuntimeError(f"Service call '{method}' failed with result {result}.")
+        return reply.get("data", {})
+
+    def _handle_reply(self, raw_payload: bytes) -> None:
+        try:
+            reply = json.loads(raw_payload.decode())
+        except Exception:
+            return
+        tid = reply.get("tid")
+        with self._lock:
+            event = self._events.get(tid)
+            if event is None:
+                return
+            self._pending[tid] = reply
+        event.set()
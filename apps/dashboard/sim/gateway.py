@@ -0,0 +1,227 @@
+"""Synthetic DJI gateway + SLAM publisher driven by DRC stick input."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from .broker import FakeBroker, FakePahoClient
+from .client import (
+    drc_down_topic,
+    drc_up_topic,
+    osd_topic,
+    services_reply_topic,
+    services_topic,
+)
+
+STICK_NEUTRAL = 1024
+STICK_RANGE = 660
+METERS_PER_DEG_LAT = 111_320.0
+
+
+@dataclass(frozen=True)
+class SlamTopics:
+    pose: str = "slam/position"
+    yaw: str = "slam/yaw"
+    status: str = "slam/status"
+    frequency: str = "slam/frequency"
+
+
+class FakeGateway:
+    """Simulates an aircraft behind a DJI dock/RC gateway.
+
+    - publishes OSD on ``thing/product/<sn>/osd`` at ``osd_hz``;
+    - answers every ``services`` call with ``result: 0`` (``drc_mode_enter``
+      switches the mode code to virtual stick);
+    - integrates ``stick_control`` from ``drc/down`` into a simple kinematic
+      model (sticks time out to hover after ``STICK_TIMEOUT_SEC``);
+    - publishes the SLAM pose/yaw/status/frequency topics at ``pose_hz``.
+    """
+
+    STICK_TIMEOUT_SEC = 0.5
+    MAX_HORIZONTAL_SPEED = 5.0
+    MAX_VERTICAL_SPEED = 3.0
+    MAX_YAW_RATE = 90.0
+
+    def __init__(
+        self,
+        broker: FakeBroker,
+        gateway_sn: str,
+        *,
+        slam_topics: SlamTopics = SlamTopics(),
+        osd_hz: float = 30.0,
+        pose_hz: float = 30.0,
+        home: tuple[float, float, float] = (22.5431, 113.9589, 50.0),
+    ) -> None:
+        self.gateway_sn = gateway_sn
+        self.slam_topics = slam_topics
+        self.osd_hz = max(osd_hz, 0.1)
+        self.pose_hz = max(pose_hz, 0.1)
+        self.home = home
+        self.client = FakePahoClient(broker, client_id=f"sim-gateway-{gateway_sn}")
+        self.client.on_message = self._on_message
+        self._lock = threading.Lock()
+        self._position = [0.0, 0.0, 0.0]
+        self._velocity = [0.0, 0.0, 0.0]
+        self._yaw = 0.0
+        self._yaw_rate = 0.0
+        self._sticks_at = 0.0
+        self._drc_active = False
+        self._battery = 100.0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.services_handled = 0
+        self.sticks_received = 0
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self.client.connect()
+        self.client.subscribe(services_topic(self.gateway_sn))
+        self.client.subscribe(drc_down_topic(self.gateway_sn))
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="sim-gateway", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self.client.disconnect()
+
+    def pose(self) -> dict[str, float]:
+        with self._lock:
+            x, y, z = self._position
+            return {"x": x, "y": y, "z": z, "yaw": self._yaw}
+
+    def _on_message(self, client: Any, userdata: Any, msg: Any) -> None:
+        try:
+            payload = json.loads(msg.payload.decode())
+        except Exception:
+            return
+        method = payload.get("method")
+        data = payload.get("data") or {}
+        if msg.topic == services_topic(self.gateway_sn):
+            self._handle_service(payload, method)
+        elif msg.topic == drc_down_topic(self.gateway_sn):
+            if method == "stick_control":
+                self._apply_sticks(data)
+            elif method == "heartbeat":
+                reply = {
+                    "method": "heartbeat",
+                    "seq": payload.get("seq"),
+                    "data": {"timestamp": int(time.time() * 1000)},
+                }
+                self.client.publish(drc_up_topic(self.gateway_sn), json.dumps(reply))
+
+    def _handle_service(self, payload: dict[str, Any], method: str | None) -> None:
+        with self._lock:
+            if method == "drc_mode_enter":
+                self._drc_active = True
+            elif method == "drc_mode_exit":
+                self._drc_active = False
+            self.services_handled += 1
+        reply = {
+            "tid": payload.get("tid"),
+            "bid": payload.get("bid"),
+            "timestamp": int(time.time() * 1000),
+            "method": method,
+            "data": {"result": 0},
+        }
+        self.client.publish(services_reply_topic(self.gateway_sn), json.dumps(reply))
+
+    def _apply_sticks(self, data: dict[str, Any]) -> None:
+        def axis(name: str) -> float:
+            try:
+                raw = float(data.get(name, STICK_NEUTRAL))
+            except (TypeError, ValueError):
+                raw = STICK_NEUTRAL
+            return max(-1.0, min(1.0, (raw - STICK_NEUTRAL) / STICK_RANGE))
+
+        forward = axis("pitch") * self.MAX_HORIZONTAL_SPEED
+        right = axis("roll") * self.MAX_HORIZONTAL_SPEED
+        with self._lock:
+            heading = math.radians(self._yaw)
+            self._velocity[0] = forward * math.cos(heading) - right * math.sin(heading)
+            self._velocity[1] = forward * math.sin(heading) + right * math.cos(heading)
+            self._velocity[2] = axis("throttle") * self.MAX_VERTICAL_SPEED
+            self._yaw_rate = axis("yaw") * self.MAX_YAW_RATE
+            self._sticks_at = time.monotonic()
+            self.sticks_received += 1
+
+    def _run(self) -> None:
+        tick = 1.0 / max(self.osd_hz, self.pose_hz)
+        last = time.monotonic()
+        next_osd = next_pose = next_status = last
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            self._integrate(now - last, now)
+            last = now
+            if now >= next_osd:
+                self._publish_osd()
+                next_osd = now + 1.0 / self.osd_hz
+            if now >= next_pose:
+                self._publish_pose()
+                next_pose = now + 1.0 / self.pose_hz
+            if now >= next_status:
+                self._publish_slam_status()
+                next_status = now + 1.0
+            self._stop_event.wait(tick)
+
+    def _integrate(self, dt: float, now: float) -> None:
+        with self._lock:
+            if now - self._sticks_at > self.STICK_TIMEOUT_SEC:
+                self._velocity = [0.0, 0.0, 0.0]
+                self._yaw_rate = 0.0
+            for index in range(3):
+                self._position[index] += self._velocity[index] * dt
+            self._position[2] = max(self._position[2], 0.0)
+            self._yaw = (self._yaw + self._yaw_rate * dt + 180.0) % 360.0 - 180.0
+            self._battery = max(self._battery - dt * 0.01, 0.0)
+
+    def _publish_osd(self) -> None:
+        home_lat, home_lon, home_alt = self.home
+        with self._lock:
+            x, y, z = self._position
+            vx, vy, vz = self._velocity
+            data = {
+                "latitude": home_lat + y / METERS_PER_DEG_LAT,
+                "longitude": home_lon
+                + x / (METERS_PER_DEG_LAT * math.cos(math.radians(home_lat))),
+                "height": home_alt + z,
+                "elevation": z,
+                "horizontal_speed": math.hypot(vx, vy),
+                "speed_x": vx,
+                "speed_y": vy,
+                "vertical_speed": vz,
+                "attitude_head": self._yaw,
+                "mode_code": 17 if self._drc_active else 0,
+                "battery": {"capacity_percent": int(self._battery)},
+                "cameras": [
+                    {
+                        "payload_index": "99-0-0",
+                        "gimbal_pitch": -90.0,
+                        "gimbal_roll": 0.0,
+                        "gimbal_yaw": self._yaw,
+                    }
+                ],
+            }
+        payload = {"timestamp": int(time.time() * 1000), "data": data}
+        self.client.publish(osd_topic(self.gateway_sn), json.dumps(payload))
+
+    def _publish_pose(self) -> None:
+        pose = self.pose()
+        stamp = int(time.time() * 1000)
+        position = {"timestamp": stamp, "x": pose["x"], "y": pose["y"], "z": pose["z"]}
+        self.client.publish(self.slam_topics.pose, json.dumps(position))
+        yaw = {"timestamp": stamp, "yaw": pose["yaw"]}
+        self.client.publish(self.slam_topics.yaw, json.dumps(yaw))
+
+    def _publish_slam_status(self) -> None:
+        self.client.publish(self.slam_topics.status, json.dumps({"status": "running"}))
+        frequency = {"rostopic": self.pose_hz, "mqtt": self.pose_hz, "timestamp": time.time()}
+        self.client.publish(self.slam_topics.frequency, json.dumps(frequency))
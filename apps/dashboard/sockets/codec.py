@@ -0,0 +1,252 @@
+"""Binary frame layouts for the high-rate pose/telemetry Socket.IO streams.
+
+Clients opt in at connect time with ``auth={"encoding": "binary"}`` (or the
+``?encoding=binary`` query string) and then receive ``bytes`` payloads instead
+of JSON objects. All numbers are little-endian; missing values travel as NaN
+(floats) or -1 (integers).
+
+Pose frame (kind=1)::
+
+    u8 version | u8 kind | f64 sent_at
+    f32 x | f32 y | f32 z | f32 yaw
+    f32 freq_rostopic | f32 freq_mqtt | f64 freq_timestamp
+    u8 status_len | status (utf-8)
+
+Telemetry frame (kind=2)::
+
+    u8 version | u8 kind | f64 timestamp
+    f64 latitude | f64 longitude
+    f32 altitude | f32 relative_altitude
+    f32 speed_h | f32 speed_x | f32 speed_y | f32 speed_z
+    f32 battery | f32 gimbal_pitch | f32 gimbal_roll | f32 gimbal_yaw
+    f32 zoom_factor | f32 osd_frequency
+    i16 mode_code | u8 flags (bit0 = is_online)
+    u8 len | mode_label | u8 len | payload_index | u8 len | lens_type
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import time
+from datetime import datetime
+from typing import Any, Mapping, Optional
+
+from dashboard.domain.models import TelemetrySnapshot
+
+ENCODING_JSON = "json"
+ENCODING_BINARY = "binary"
+SUPPORTED_ENCODINGS = (ENCODING_JSON, ENCODING_BINARY)
+
+FRAME_VERSION = 1
+KIND_POSE = 1
+KIND_TELEMETRY = 2
+
+_POSE_HEADER = struct.Struct("<BBd6fd")
+_TELEMETRY_HEADER = struct.Struct("<BBd2d12fhB")
+_NAN = float("nan")
+
+
+def resolve_encoding(auth: Any, query: Mapping[str, Any] | None = None) -> str:
+    """Pick the stream encoding requested by a connecting client."""
+
+    requested = None
+    if isinstance(auth, Mapping):
+        requested = auth.get("encoding")
+    if not requested and query is not None:
+        requested = query.get("encoding")
+    value = str(requested or ENCODING_JSON).strip().lower()
+    if value not in SUPPORTED_ENCODINGS:
+        return ENCODING_JSON
+    return value
+
+
+def room_for(encoding: str) -> str:
+    return f"encoding:{encoding}"
+
+
+def encode_pose_frame(payload: Mapping[str, Any], sent_at: float | None = None) -> bytes:
+    frequency = payload.get("frequency") or {}
+    header = _POSE_HEADER.pack(
+        FRAME_VERSION,
+        KIND_POSE,
+        time.time() if sent_at is None else sent_at,
+        _f(payload.get("x")),
+        _f(payload.get("y")),
+        _f(payload.get("z")),
+        _f(payload.get("yaw")),
+        _f(frequency.get("rostopic")),
+        _f(frequency.get("mqtt")),
+        _f(frequency.get("timestamp")),
+    )
+    return header + _short_str(payload.get("status"))
+
+
+def decode_pose_frame(frame: bytes) -> dict[str, Any]:
+    (
+        version,
+        kind,
+        sent_at,
+        x,
+        y,
+        z,
+        yaw,
+        rostopic,
+        mqtt,
+        freq_timestamp,
+    ) = _POSE_HEADER.unpack_from(frame, 0)
+    _check_header(version, kind, KIND_POSE)
+    status, _ = _read_short_str(frame, _POSE_HEADER.size)
+    return {
+        "x": _opt(x),
+        "y": _opt(y),
+        "z": _opt(z),
+        "yaw": _opt(yaw),
+        "status": status,
+        "frequency": {
+            "rostopic": _opt(rostopic),
+            "mqtt": _opt(mqtt),
+            "timestamp": _opt(freq_timestamp),
+        },
+        "sent_at": sent_at,
+    }
+
+
+def encode_telemetry_frame(snapshot: TelemetrySnapshot) -> bytes:
+    position = snapshot.position
+    speed = snapshot.speed
+    camera = snapshot.camera
+    gimbal = camera.gimbal
+    connection = snapshot.connection
+    mode_code = snapshot.flight.mode_code
+    header = _TELEMETRY_HEADER.pack(
+        FRAME_VERSION,
+        KIND_TELEMETRY,
+        _timestamp(snapshot.timestamp),
+        _f(position.latitude),
+        _f(position.longitude),
+        _f(position.altitude),
+        _f(position.relative_altitude),
+        _f(speed.horizontal),
+        _f(speed.x),
+        _f(speed.y),
+        _f(speed.z),
+        _f(snapshot.battery.percent),
+        _f(gimbal.pitch),
+        _f(gimbal.roll),
+        _f(gimbal.yaw),
+        _f(camera.zoom_factor),
+        _f(connection.osd_frequency),
+        -1 if mode_code is None else int(mode_code),
+        1 if connection.is_online else 0,
+    )
+    return (
+        header
+        + _short_str(snapshot.flight.mode_label)
+        + _short_str(camera.payload_index)
+        + _short_str(camera.lens_type)
+    )
+
+
+def decode_telemetry_frame(frame: bytes) -> dict[str, Any]:
+    (
+        version,
+        kind,
+        timestamp,
+        latitude,
+        longitude,
+        altitude,
+        relative_altitude,
+        speed_h,
+        speed_x,
+        speed_y,
+        speed_z,
+        battery,
+        gimbal_pitch,
+        gimbal_roll,
+        gimbal_yaw,
+        zoom_factor,
+        osd_frequency,
+        mode_code,
+        flags,
+    ) = _TELEMETRY_HEADER.unpack_from(frame, 0)
+    _check_header(version, kind, KIND_TELEMETRY)
+    offset = _TELEMETRY_HEADER.size
+    mode_label, offset = _read_short_str(frame, offset)
+    payload_index, offset = _read_short_str(frame, offset)
+    lens_type, offset = _read_short_str(frame, offset)
+    battery_value = _opt(battery)
+    return {
+        "timestamp": timestamp,
+        "position": {
+            "latitude": _opt(latitude),
+            "longitude": _opt(longitude),
+            "altitude": _opt(altitude),
+            "relative_altitude": _opt(relative_altitude),
+        },
+        "speed": {
+            "horizontal": _opt(speed_h),
+            "x": _opt(speed_x),
+            "y": _opt(speed_y),
+            "z": _opt(speed_z),
+        },
+        "battery": {"percent": None if battery_value is None else int(battery_value)},
+        "camera": {
+            "payload_index": payload_index,
+            "lens_type": lens_type or "zoom",
+            "zoom_factor": _opt(zoom_factor),
+            "gimbal": {
+                "pitch": _opt(gimbal_pitch),
+                "roll": _opt(gimbal_roll),
+                "yaw": _opt(gimbal_yaw),
+            },
+        },
+        "flight": {
+            "mode_code": None if mode_code < 0 else mode_code,
+            "mode_label": mode_label or "未知",
+        },
+        "connection": {
+            "osd_frequency": _opt(osd_frequency),
+            "is_online": bool(flags & 0x01),
+        },
+    }
+
+
+def _check_header(version: int, kind: int, expected_kind: int) -> None:
+    if version != FRAME_VERSION or kind != expected_kind:
+        raise ValueError(f"Unsupported frame version={version} kind={kind}")
+
+
+def _f(value: Any) -> float:
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _opt(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _timestamp(value: datetime | None) -> float:
+    if value is None:
+        return time.time()
+    return value.timestamp()
+
+
+def _short_str(value: Any) -> bytes:
+    if value is None:
+        return b"\x00"
+    raw = str(value).encode("utf-8")[:255]
+    return bytes((len(raw),)) + raw
+
+
+def _read_short_str(frame: bytes, offset: int) -> tuple[Optional[str], int]:
+    length = frame[offset]
+    start = offset + 1
+    end = start + length
+    if length == 0:
+        return None, end
+    return frame[start:end].decode("utf-8", errors="replace"), end
@@ -2,85 +2,168 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import threading
+import time
+from typing import TYPE_CHECKING, Any, cast
 
-from flask import current_app
-from flask_socketio import SocketIO, emit
+from flask import current_app, request
+from flask_socketio import SocketIO, emit, join_room
 
-from dashboard.services.mission_executor import MissionExecutor
-from dashboard.services.runtime_hub import RuntimeHub
+from dashboard.metrics import SOCKET_EMIT_SECONDS, SOCKET_EMITS
+
+from .codec import (
+    ENCODING_BINARY,
+    ENCODING_JSON,
+    encode_pose_frame,
+    encode_telemetry_frame,
+    resolve_encoding,
+    room_for,
+)
+
+if TYPE_CHECKING:
+    from dashboard.services.mission_executor import MissionExecutor
+    from dashboard.services.runtime_hub import RuntimeHub
+    from dashboard.services.scheduler import PeriodicScheduler
 
 TELEMETRY_NAMESPACE = "/telemetry"
 POSE_NAMESPACE = "/pose"
 MISSION_NAMESPACE = "/mission"
 
 
+class EncodingRooms:
+    """Track which stream encodings currently have listeners per namespace."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._members: dict[tuple[str, str], set[str]] = {}
+
+    def join(self, namespace: str, sid: str, encoding: str) -> None:
+        with self._lock:
+            self._members.setdefault((namespace, encoding), set()).add(sid)
+
+    def leave(self, namespace: str, sid: str) -> None:
+        with self._lock:
+            for (member_ns, _), sids in self._members.items():
+                if member_ns == namespace:
+                    sids.discard(sid)
+
+    def has_listeners(self, namespace: str, encoding: str) -> bool:
+        with self._lock:
+            return bool(self._members.get((namespace, encoding)))
+
+
 def register_socketio_events(
-    socketio: SocketIO, runtime_hub: RuntimeHub, mission_executor: MissionExecutor
+    socketio: SocketIO,
+    runtime_hub: RuntimeHub,
+    mission_executor: MissionExecutor,
+    scheduler: PeriodicScheduler,
 ) -> None:
-    """Register namespaces and bootstrap telemetry push events."""
-
-    def _pose_loop():
-        socketio_sleep = cast(Any, socketio.sleep)
-        while True:
-            if runtime_hub.slam.pose:
-                socketio.emit(
-                    "pose", runtime_hub.slam.pose.latest(), namespace=POSE_NAMESPACE
-                )
-            socketio_sleep(runtime_hub._app_config.get("POSE_SOCKET_RATE", 0.2))
-
-    def _telemetry_loop():
-        socketio_sleep = cast(Any, socketio.sleep)
-        while True:
-            if runtime_hub.drone.telemetry:
-                socketio.emit(
-                    "telemetry",
-                    runtime_hub.drone.telemetry.latest_dict(),
-                    namespace=TELEMETRY_NAMESPACE,
-                )
-            socketio_sleep(0.2)
-
-    def _mission_loop():
-        socketio_sleep = cast(Any, socketio.sleep)
-        last_phase = None
-        done_run_id = None
-        while True:
-            payload = mission_executor.status()
-            run = payload.get("run", {})
-            phase = run.get("phase")
-            run_id = run.get("run_id")
-            socketio.emit("mission:update", payload, namespace=MISSION_NAMESPACE)
-            if phase != last_phase:
-                socketio.emit(
-                    "mission:phase",
-                    {"run_id": run_id, "phase": phase},
-                    namespace=MISSION_NAMESPACE,
-                )
-                last_phase = phase
-            if phase in {"COMPLETED", "FAILED", "ABORTED"} and run_id != done_run_id:
-                socketio.emit(
-                    "mission:done",
-                    {"run_id": run_id, "phase": phase, "error": run.get("error")},
-                    namespace=MISSION_NAMESPACE,
-                )
-                done_run_id = run_id
-            socketio_sleep(0.5)
-
-    socketio.start_background_task(_pose_loop)
-    socketio.start_background_task(_telemetry_loop)
-    socketio.start_background_task(_mission_loop)
+    """Register namespaces and schedule the telemetry/pose/mission push jobs."""
+
+    rooms = EncodingRooms()
+    json_room = room_for(ENCODING_JSON)
+    binary_room = room_for(ENCODING_BINARY)
+
+    def _emit(event: str, data: Any, namespace: str, to: str | None = None) -> None:
+        encoding = ENCODING_BINARY if isinstance(data, bytes) else ENCODING_JSON
+        started = time.perf_counter()
+        socketio.emit(event, data, namespace=namespace, to=to)
+        SOCKET_EMIT_SECONDS.observe(
+            time.perf_counter() - started, namespace=namespace, event=event
+        )
+        SOCKET_EMITS.inc(namespace=namespace, event=event, encoding=encoding)
+
+    def _emit_pose() -> None:
+        if not runtime_hub.slam.pose:
+            return
+        payload = runtime_hub.slam.pose.latest()
+        if rooms.has_listeners(POSE_NAMESPACE, ENCODING_JSON):
+            _emit("pose", payload, POSE_NAMESPACE, to=json_room)
+        if rooms.has_listeners(POSE_NAMESPACE, ENCODING_BINARY):
+            _emit("pose", encode_pose_frame(payload), POSE_NAMESPACE, to=binary_room)
+
+    def _emit_telemetry() -> None:
+        if not runtime_hub.drone.telemetry:
+            return
+        snapshot = runtime_hub.drone.telemetry.latest()
+        if rooms.has_listeners(TELEMETRY_NAMESPACE, ENCODING_JSON):
+            _emit("telemetry", snapshot.model_dump(), TELEMETRY_NAMESPACE, to=json_room)
+        if rooms.has_listeners(TELEMETRY_NAMESPACE, ENCODING_BINARY):
+            _emit(
+                "telemetry",
+                encode_telemetry_frame(snapshot),
+                TELEMETRY_NAMESPACE,
+                to=binary_room,
+            )
+
+    mission_state: dict[str, Any] = {"last_phase": None, "done_run_id": None}
+
+    def _emit_mission() -> None:
+        payload = mission_executor.status()
+        run = payload.get("run", {})
+        phase = run.get("phase")
+        run_id = run.get("run_id")
+        _emit("mission:update", payload, MISSION_NAMESPACE)
+        if phase != mission_state["last_phase"]:
+            _emit("mission:phase", {"run_id": run_id, "phase": phase}, MISSION_NAMESPACE)
+            mission_state["last_phase"] = phase
+        if (
+            phase in {"COMPLETED", "FAILED", "ABORTED"}
+            and run_id != mission_state["done_run_id"]
+        ):
+            _emit(
+                "mission:done",
+                {"run_id": run_id, "phase": phase, "error": run.get("error")},
+                MISSION_NAMESPACE,
+            )
+            mission_state["done_run_id"] = run_id
+
+    app_config = runtime_hub._app_config
+    scheduler.add_job(
+        "socket-pose", _emit_pose, lambda: app_config.get("POSE_SOCKET_RATE", 0.2)
+    )
+    scheduler.add_job(
+        "socket-telemetry",
+        _emit_telemetry,
+        lambda: app_config.get("TELEMETRY_SOCKET_INTERVAL", 0.2),
+    )
+    scheduler.add_job("socket-mission", _emit_mission, 0.5)
+
+    def _join_encoding_room(namespace: str, auth: Any) -> str:
+        encoding = resolve_encoding(auth, request.args)
+        join_room(room_for(encoding))
+        rooms.join(namespace, cast(Any, request).sid, encoding)
+        return encoding
 
     @socketio.on("connect", namespace=TELEMETRY_NAMESPACE)
-    def _handle_connect():
+    def _handle_connect(auth=None):
+        encoding = _join_encoding_room(TELEMETRY_NAMESPACE, auth)
         hub = current_app.extensions.get("runtime_hub")
         if hub and hub.drone.telemetry:
-            emit("telemetry", hub.drone.telemetry.latest_dict())
+            snapshot = hub.drone.telemetry.latest()
+            if encoding == ENCODING_BINARY:
+                emit("telemetry", encode_telemetry_frame(snapshot))
+            else:
+                emit("telemetry", snapshot.model_dump())
+
+    @socketio.on("disconnect", namespace=TELEMETRY_NAMESPACE)
+    def _handle_disconnect(*_args):
+        rooms.leave(TELEMETRY_NAMESPACE, cast(Any, request).sid)
 
     @socketio.on("connect", namespace=POSE_NAMESPACE)
-    def _handle_pose_connect():
+    def _handle_pose_connect(auth=None):
+        encoding = _join_encoding_room(POSE_NAMESPACE, auth)
         hub = current_app.extensions.get("runtime_hub")
         if hub and hub.slam.pose:
-            emit("pose", hub.slam.pose.latest())
+            payload = hub.slam.pose.latest()
+            if encoding == ENCODING_BINARY:
+                emit("pose", encode_pose_frame(payload))
+            else:
+                emit("pose", payload)
+
+    @socketio.on("disconnect", namespace=POSE_NAMESPACE)
+    def _handle_pose_disconnect(*_args):
+        rooms.leave(POSE_NAMESPACE, cast(Any, request).sid)
 
     @socketio.on("connect", namespace=MISSION_NAMESPACE)
     def _handle_mission_connect():
@@ -1,5 +1,6 @@
 import { useEffect, useMemo, useRef, useState } from "react";
 import { io } from "socket.io-client";
+import { decodePoseFrame } from "../../../lib/socketFrames";
 
 export type SlamSnapshot = {
 	x: number | null;
@@ -27,8 +28,10 @@ export const useSlamPose = () => {
 	const staleTimerRef = useRef<number | null>(null);
 
 	useEffect(() => {
-		const socket = io("/pose");
-		socket.on("pose", (payload) => {
+		const socket = io("/pose", { auth: { encoding: "binary" } });
+		socket.on("pose", (raw) => {
+			const payload =
+				raw instanceof ArrayBuffer ? decodePoseFrame(raw) : (raw ?? null);
 			if (!payload) return;
 			const { x, y, z, yaw, status } = payload as {
 				x?: number | null;
@@ -0,0 +1,39 @@
+// Decoders for the binary Socket.IO frames (see apps/dashboard/sockets/codec.py).
+
+export type PoseFrame = {
+	x: number | null;
+	y: number | null;
+	z: number | null;
+	yaw: number | null;
+	status: string | null;
+	sentAt: number;
+};
+
+const FRAME_VERSION = 1;
+const KIND_POSE = 1;
+const POSE_HEADER_SIZE = 42;
+
+const toNullable = (value: number) => (Number.isNaN(value) ? null : value);
+
+const readShortString = (view: DataView, offset: number) => {
+	const length = view.getUint8(offset);
+	if (length === 0) return null;
+	const bytes = new Uint8Array(view.buffer, view.byteOffset + offset + 1, length);
+	return new TextDecoder().decode(bytes);
+};
+
+export const decodePoseFrame = (buffer: ArrayBuffer): PoseFrame | null => {
+	if (buffer.byteLength < POSE_HEADER_SIZE + 1) return null;
+	const view = new DataView(buffer);
+	if (view.getUint8(0) !== FRAME_VERSION || view.getUint8(1) !== KIND_POSE) {
+		return null;
+	}
+	return {
+		sentAt: view.getFloat64(2, true),
+		x: toNullable(view.getFloat32(10, true)),
+		y: toNullable(view.getFloat32(14, true)),
+		z: toNullable(view.getFloat32(18, true)),
+		yaw: toNullable(view.getFloat32(22, true)),
+		status: readShortString(view, POSE_HEADER_SIZE),
+	};
+};
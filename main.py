@@ -1,5 +1,6 @@
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -17,11 +18,6 @@ def _ensure_import_paths() -> None:
 
 
 def main() -> None:
-    _ensure_import_paths()
-    from server import create_app
-    from server.config import SERVER_CONFIG
-    from dashboard.extensions import socketio  # type: ignore[import-not-found]
-
     parser = argparse.ArgumentParser(description="Drone3Plot server")
     parser.add_argument(
         "--log-level",
@@ -29,20 +25,46 @@ def main() -> None:
         choices=["debug", "info", "warning", "error"],
         help="Log verbosity for server output",
     )
+    parser.add_argument(
+        "--role",
+        choices=["local", "daemon", "web"],
+        default=None,
+        help=(
+            "local: runtime and web in one process (default); daemon: headless "
+            "runtime; web: stateless worker attached to the daemon"
+        ),
+    )
+    parser.add_argument("--port", type=int, default=None, help="HTTP port override")
     args = parser.parse_args()
 
+    # Before importing the app: config classes read the environment on import.
+    if args.role:
+        os.environ["DASHBOARD_RUNTIME_ROLE"] = args.role
+    role = os.environ.get("DASHBOARD_RUNTIME_ROLE", "local").strip().lower()
+
     log_level = args.log_level.lower()
     logging.basicConfig(level=getattr(logging, log_level.upper(), logging.INFO))
     if log_level != "debug":
         logging.getLogger("werkzeug").setLevel(logging.ERROR)
 
+    _ensure_import_paths()
+    if role == "daemon":
+        from dashboard.daemon import run_runtime_daemon  # type: ignore[import-not-found]
+
+        run_runtime_daemon()
+        return
+
+    from server import create_app
+    from server.config import SERVER_CONFIG
+    from dashboard.extensions import socketio  # type: ignore[import-not-found]
+
     app = create_app()
     if log_level != "debug":
         app.logger.setLevel(logging.WARNING)
     socketio.run(
         app,
         host=SERVER_CONFIG.host,
-        port=SERVER_CONFIG.port,
+        port=args.port or SERVER_CONFIG.port,
         debug=SERVER_CONFIG.debug,
         log_output=log_level == "debug",
     )
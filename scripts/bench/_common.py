@@ -0,0 +1,54 @@
+"""Shared helpers for the dashboard benchmark scripts."""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def ensure_import_paths() -> None:
+    """Mirror `main._ensure_import_paths` so scripts can import `dashboard`."""
+
+    for path in (
+        PROJECT_ROOT,
+        PROJECT_ROOT / "server",
+        PROJECT_ROOT / "apps",
+        PROJECT_ROOT / "thirdparty" / "pydjimqtt" / "src",
+    ):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_cpu_seconds(pid: int) -> float:
+    """User+system CPU time of a process (Linux `/proc`)."""
+
+    with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+        fields = handle.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    return (int(fields[11]) + int(fields[12])) / ticks
+
+
+def process_rss_bytes(pid: int) -> int:
+    with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+        for line in handle:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Load-test the full dashboard with N simulated operator screens.
+
+For every N in `--clients`, starts `server.create_app()` in a child process
+with `DASHBOARD_SIM=1` (in-process broker + fake gateway, see
+`apps/dashboard/sim`), connects the drone, then opens N Socket.IO clients on
+`/pose`, `/telemetry` and `/mission` while `--http-workers` threads poll
+`/api/ui/pose-strip` and `/api/drone/status` (one poller per screen by
+default). Reports pose latency (SLAM sample arrival -> browser), receive and
+HTTP throughput, and server CPU/RSS.
+
+Requires the client extra: `uv pip install "python-socketio[client]"`.
+
+    python scripts/bench/dashboard_load.py --clients 1,5,10,25,50 --seconds 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+from _common import (
+    ensure_import_paths,
+    free_port,
+    percentile,
+    process_cpu_seconds,
+    process_rss_bytes,
+)
+
+HTTP_PATHS = ("/api/ui/pose-strip", "/api/drone/status")
+
+
+def _serve(port: int) -> None:
+    os.environ["DASHBOARD_SIM"] = "1"
+    ensure_import_paths()
+    import logging
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    from dashboard.extensions import socketio
+    from server import create_app
+
+    app = create_app()
+    socketio.run(
+        app, host="127.0.0.1", port=port, allow_unsafe_werkzeug=True, log_output=False
+    )
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.recording = False
+        self.pose_latency: list[float] = []
+        self.frames = {"pose": 0, "telemetry": 0, "mission": 0}
+        self.http_latency: list[float] = []
+        self.http_errors = 0
+
+    def frame(self, kind: str, latency: float | None = None) -> None:
+        with self.lock:
+            if not self.recording:
+                return
+            self.frames[kind] += 1
+            if latency is not None:
+                self.pose_latency.append(latency)
+
+    def http(self, latency: float | None) -> None:
+        with self.lock:
+            if not self.recording:
+                return
+            if latency is None:
+                self.http_errors += 1
+            else:
+                self.http_latency.append(latency)
+
+
+def _wait_ready(base: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base}/dashboard/health", timeout=1.0):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("dashboard did not come up")
+
+
+def _post(base: str, path: str) -> None:
+    request = urllib.request.Request(f"{base}{path}", data=b"{}", method="POST")
+    request.add_header("Content-Type", "application/json")
+    with urllib.request.urlopen(request, timeout=10.0) as response:
+        response.read()
+
+
+def _open_screens(base: str, count: int, stats: _Stats) -> list:
+    import socketio
+
+    def _on_pose(data):
+        received_at = data.get("received_at") if isinstance(data, dict) else None
+        latency = time.time() - received_at if received_at else None
+        stats.frame("pose", latency)
+
+    screens = []
+    for _ in range(count):
+        client = socketio.Client(reconnection=False)
+        client.on("pose", _on_pose, namespace="/pose")
+        client.on("telemetry", lambda _data: stats.frame("telemetry"), namespace="/telemetry")
+        client.on("mission:update", lambda _data: stats.frame("mission"), namespace="/mission")
+        client.connect(
+            base,
+            namespaces=["/pose", "/telemetry", "/mission"],
+            transports=["websocket"],
+        )
+        screens.append(client)
+    return screens
+
+
+def _http_worker(base: str, stats: _Stats, stop: threading.Event, interval: float) -> None:
+    index = 0
+    while not stop.is_set():
+        path = HTTP_PATHS[index % len(HTTP_PATHS)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(f"{base}{path}", timeout=5.0) as response:
+                response.read()
+            stats.http(time.perf_counter() - started)
+        except OSError:
+            stats.http(None)
+        if interval:
+            stop.wait(interval)
+
+
+def _run_level(count: int, args: argparse.Namespace) -> dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    stats = _Stats()
+    stop = threading.Event()
+    screens: list = []
+    workers: list[threading.Thread] = []
+    try:
+        _wait_ready(base)
+        _post(base, "/api/drone/connect")
+        screens = _open_screens(base, count, stats)
+        http_workers = args.http_workers if args.http_workers >= 0 else count
+        for _ in range(http_workers):
+            worker = threading.Thread(
+                target=_http_worker,
+                args=(base, stats, stop, args.http_interval),
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+        time.sleep(args.warmup)
+
+        cpu_before = process_cpu_seconds(server.pid)
+        with stats.lock:
+            stats.recording = True
+        started = time.monotonic()
+        time.sleep(args.seconds)
+        with stats.lock:
+            stats.recording = False
+        elapsed = time.monotonic() - started
+        cpu_used = process_cpu_seconds(server.pid) - cpu_before
+        rss = process_rss_bytes(server.pid)
+    finally:
+        stop.set()
+        for client in screens:
+            try:
+                client.disconnect()
+            except Exception:  # noqa: BLE001
+                pass
+        server.terminate()
+        server.wait(timeout=10)
+
+    return {
+        "clients": count,
+        "pose_p50_ms": percentile(stats.pose_latency, 50) * 1000.0,
+        "pose_p95_ms": percentile(stats.pose_latency, 95) * 1000.0,
+        "pose_p99_ms": percentile(stats.pose_latency, 99) * 1000.0,
+        "frames_per_s": sum(stats.frames.values()) / elapsed,
+        "pose_frames_per_s": stats.frames["pose"] / elapsed,
+        "http_per_s": len(stats.http_latency) / elapsed,
+        "http_p95_ms": percentile(stats.http_latency, 95) * 1000.0,
+        "http_errors": stats.http_errors,
+        "cpu_pct": cpu_used / elapsed * 100.0,
+        "rss_mib": rss / (1024.0 * 1024.0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", default="1,5,10,25", help="comma-separated N values")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument(
+        "--http-workers", type=int, default=-1, help="HTTP pollers (default: one per client)"
+    )
+    parser.add_argument(
+        "--http-interval", type=float, default=0.5, help="seconds between polls per worker"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    parser.add_argument("--serve", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return 0
+
+    levels = [int(value) for value in args.clients.split(",") if value.strip()]
+    if not args.json:
+        print(
+            f"{'N':>4}{'pose p50':>10}{'p95':>8}{'p99':>8}{'frames/s':>10}"
+            f"{'http/s':>8}{'http p95':>10}{'err':>5}{'cpu %':>8}{'rss MiB':>9}"
+        )
+    for count in levels:
+        result = _run_level(count, args)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{result['clients']:>4}{result['pose_p50_ms']:>10.1f}"
+            f"{result['pose_p95_ms']:>8.1f}{result['pose_p99_ms']:>8.1f}"
+            f"{result['frames_per_s']:>10.1f}{result['http_per_s']:>8.1f}"
+            f"{result['http_p95_ms']:>10.1f}{result['http_errors']:>5}"
+            f"{result['cpu_pct']:>8.1f}{result['rss_mib']:>9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Time a large mission draft end to end: HTTP body -> draft -> run -> status.
+
+`legacy` replays the previous per-point path (field-by-field float
+coercion in the trajectory blueprint, `MissionWaypoint` per point in
+`parse_mission_waypoints`, `copy.deepcopy` of the draft on store and on
+start, a `MissionPoint` list for the control spec). `array` is the current
+path through `WaypointArray`: one vectorized conversion, shared read-only
+storage for draft, snapshot and control spec. Both modes decode the same
+JSON body and finish with the status payload (`snapshot.to_dict()`).
+
+    python scripts/bench/draft_ingest.py --points 100000 --trials 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import time
+from typing import Any, Callable
+
+from _common import ensure_import_paths, percentile
+
+ensure_import_paths()
+
+from apps.control.core.mission_runner import MissionPoint, MissionSpec  # noqa: E402
+from dashboard.services.mission_adapter import (  # noqa: E402
+    ReturnPoint,
+    build_snapshot,
+    to_control_spec,
+)
+from dashboard.services.mission_executor import MissionExecutor  # noqa: E402
+from dashboard.services.mission_models import MissionSnapshot, MissionWaypoint  # noqa: E402
+from dashboard.services.waypoints import WaypointArray, WaypointBounds  # noqa: E402
+
+STAGES = ("decode", "validate", "draft", "start", "status")
+
+
+def _body(count: int) -> bytes:
+    rng = random.Random(7)
+    points = [
+        {
+            "x": round(rng.uniform(-200.0, 200.0), 3),
+            "y": round(rng.uniform(-200.0, 200.0), 3),
+            "z": round(rng.uniform(1.0, 30.0), 3),
+            "yaw": round(rng.uniform(-180.0, 180.0), 2),
+            "takePhoto": rng.random() < 0.3,
+        }
+        for _ in range(count)
+    ]
+    return json.dumps({"trajectory_id": "bench", "points": points}).encode("utf-8")
+
+
+class _LegacyDraft:
+    def __init__(self) -> None:
+        self.points: list[dict[str, Any]] = []
+
+    @staticmethod
+    def coerce(points_raw: list[Any]) -> list[dict[str, Any]]:
+        return [
+            {
+                "x": float(entry.get("x")),
+                "y": float(entry.get("y")),
+                "z": float(entry.get("z")),
+                "yaw": float(entry.get("yaw")),
+                "takePhoto": bool(entry.get("takePhoto", True)),
+            }
+            for entry in points_raw
+        ]
+
+    @staticmethod
+    def parse(points_raw: list[dict[str, Any]]) -> list[MissionWaypoint]:
+        return [
+            MissionWaypoint(
+                x=float(entry.get("x")),
+                y=float(entry.get("y")),
+                z=float(entry.get("z")),
+                yaw=float(entry.get("yaw")),
+                take_photo=bool(entry.get("takePhoto", True)),
+            )
+            for entry in points_raw
+        ]
+
+    def update(self, points: list[dict[str, Any]]) -> None:
+        self.parse(points)
+        self.points = copy.deepcopy(points)
+
+    def start(self) -> tuple[list[MissionWaypoint], MissionSpec]:
+        points = self.parse(copy.deepcopy(self.points))
+        spec = MissionSpec(
+            initial=MissionPoint(points[0].x, points[0].y, points[0].z, points[0].yaw),
+            waypoints=[
+                MissionPoint(p.x, p.y, p.z, p.yaw, p.take_photo) for p in points
+            ],
+            final=MissionPoint(0.0, 0.0, 1.0, 0.0, False),
+        )
+        return points, spec
+
+    @staticmethod
+    def status(points: list[MissionWaypoint]) -> list[dict[str, Any]]:
+        return [
+            {"x": p.x, "y": p.y, "z": p.z, "yaw": p.yaw, "takePhoto": p.take_photo}
+            for p in points
+        ]
+
+
+def _legacy_trial(body: bytes, clock: Callable[[str], None]) -> None:
+    payload = json.loads(body)
+    clock("decode")
+    points = _LegacyDraft.coerce(payload["points"])
+    clock("validate")
+    draft = _LegacyDraft()
+    draft.update(points)
+    clock("draft")
+    snapshot_points, _spec = draft.start()
+    clock("start")
+    _LegacyDraft.status(snapshot_points)
+    clock("status")
+
+
+def _array_trial(body: bytes, clock: Callable[[str], None]) -> None:
+    payload = json.loads(body)
+    clock("decode")
+    points = WaypointArray.from_payload(payload["points"], WaypointBounds())
+    clock("validate")
+    executor = MissionExecutor(None, {})
+    executor.update_draft({"points": points})
+    clock("draft")
+    snapshot: MissionSnapshot = build_snapshot(
+        run_id="bench", revision=1, points=executor._draft.points
+    )
+    to_control_spec(snapshot, ReturnPoint())
+    clock("start")
+    snapshot.to_dict()
+    clock("status")
+
+
+def _run(mode: str, body: bytes, trials: int) -> dict[str, Any]:
+    trial = _legacy_trial if mode == "legacy" else _array_trial
+    samples: dict[str, list[float]] = {stage: [] for stage in (*STAGES, "total")}
+    for _ in range(trials):
+        started = last = time.perf_counter()
+
+        def clock(stage: str) -> None:
+            nonlocal last
+            now = time.perf_counter()
+            samples[stage].append(now - last)
+            last = now
+
+        trial(body, clock)
+        samples["total"].append(last - started)
+    return {
+        "mode": mode,
+        **{f"{stage}_ms": percentile(values, 50) * 1000.0 for stage, values in samples.items()},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--modes", default="legacy,array")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args()
+
+    body = _body(args.points)
+    if not args.json:
+        print(f"{args.points} points, {len(body) / 1e6:.1f} MB body, p50 of {args.trials}")
+        print(f"{'mode':>7}" + "".join(f"{stage:>10}" for stage in (*STAGES, "total")))
+    for mode in [value.strip() for value in args.modes.split(",") if value.strip()]:
+        result = _run(mode, body, args.trials)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{mode:>7}"
+            + "".join(f"{result[f'{stage}_ms']:>10.1f}" for stage in (*STAGES, "total"))
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Compare mission control-loop jitter: in-process thread vs spawned process.
+
+Emulates the dashboard process: `--load-threads` threads serialize
+telemetry-sized JSON (socket emits / HTTP handlers) while a writer thread
+updates the pose at `--pose-hz`. A 50 Hz loop that reads the pose and runs
+four PID axes (the shape of `run_complex_mission`) runs either as a thread
+in the same process (pose from a locked dict, like `PoseService.latest`) or
+in a spawned child reading a `PoseBlock` seqlock (`MISSION_PROCESS_MODE=process`).
+Reports |period - interval| percentiles and ticks later than one interval.
+
+    python scripts/bench/mission_jitter.py --seconds 10 --load-threads 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import threading
+import time
+
+from _common import ensure_import_paths, percentile
+
+ensure_import_paths()
+
+from apps.control.core.pid import PIDController  # noqa: E402
+from apps.control.core.pose_shm import PoseBlock  # noqa: E402
+
+TELEMETRY_SAMPLE = {
+    "position": {"latitude": 22.5, "longitude": 113.9, "altitude": 12.3},
+    "speed": {"horizontal": 1.2, "x": 0.4, "y": 0.9, "z": -0.1},
+    "battery": {"percent": 87},
+    "flight": {"mode_code": 17, "mode_label": "DRC"},
+    "camera": {"payload_index": "99-0-0", "gimbal": {"pitch": -30, "roll": 0, "yaw": 12}},
+    "history": [[index * 0.1, index * 0.2, index * 0.3] for index in range(200)],
+}
+
+
+def _control_loop(read_pose, seconds: float, hz: float) -> list[float]:
+    controllers = [PIDController(0.8, 0.05, 0.2, output_limit=660) for _ in range(4)]
+    interval = 1.0 / hz
+    periods: list[float] = []
+    deadline = time.monotonic() + seconds
+    last_at = None
+    next_at = time.monotonic()
+    while time.monotonic() < deadline:
+        now = time.monotonic()
+        if last_at is not None:
+            periods.append(now - last_at)
+        last_at = now
+        pose = read_pose()
+        if pose is not None:
+            for axis, controller in enumerate(controllers):
+                controller.compute(1.0 - pose[axis], now)
+        next_at += interval
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_at = time.monotonic()
+    return periods
+
+
+def _child(conn, block_name: str, seconds: float, hz: float) -> None:
+    block = PoseBlock.attach(block_name)
+
+    def read_pose():
+        sample = block.read()
+        if sample is None or sample.x is None:
+            return None
+        return (sample.x, sample.y, sample.z, sample.yaw)
+
+    conn.send(_control_loop(read_pose, seconds, hz))
+    block.close()
+    conn.close()
+
+
+def _load(stop: threading.Event) -> None:
+    while not stop.is_set():
+        json.loads(json.dumps(TELEMETRY_SAMPLE))
+
+
+def _run(mode: str, args: argparse.Namespace) -> dict:
+    stop = threading.Event()
+    lock = threading.Lock()
+    pose = {"x": 0.0, "y": 0.0, "z": 0.0, "yaw": 0.0}
+    block = PoseBlock.create()
+
+    def writer() -> None:
+        step = 0
+        while not stop.is_set():
+            step += 1
+            value = (step % 100) / 100.0
+            with lock:
+                pose.update(x=value, y=value, z=1.0, yaw=value * 90)
+                block.write(pose["x"], pose["y"], pose["z"], pose["yaw"])
+            time.sleep(1.0 / args.pose_hz)
+
+    threads = [threading.Thread(target=writer, daemon=True)]
+    threads += [
+        threading.Thread(target=_load, args=(stop,), daemon=True)
+        for _ in range(args.load_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        if mode == "thread":
+
+            def read_pose():
+                with lock:
+                    return (pose["x"], pose["y"], pose["z"], pose["yaw"])
+
+            periods = _control_loop(read_pose, args.seconds, args.hz)
+        else:
+            context = multiprocessing.get_context("spawn")
+            parent_conn, child_conn = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_child, args=(child_conn, block.name, args.seconds, args.hz)
+            )
+            process.start()
+            periods = parent_conn.recv()
+            process.join()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=1.0)
+        block.close()
+        block.unlink()
+
+    interval = 1.0 / args.hz
+    jitter = [abs(period - interval) for period in periods]
+    return {
+        "mode": mode,
+        "ticks": len(periods),
+        "jitter_p50_ms": percentile(jitter, 50) * 1000.0,
+        "jitter_p95_ms": percentile(jitter, 95) * 1000.0,
+        "jitter_p99_ms": percentile(jitter, 99) * 1000.0,
+        "jitter_max_ms": max(jitter, default=0.0) * 1000.0,
+        "late_ticks": sum(1 for period in periods if period > 2 * interval),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--hz", type=float, default=50.0)
+    parser.add_argument("--pose-hz", type=float, default=30.0)
+    parser.add_argument("--load-threads", type=int, default=4)
+    parser.add_argument("--modes", default="thread,process")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args()
+
+    if not args.json:
+        print(
+            f"{'mode':>8}{'ticks':>7}{'p50 ms':>9}{'p95 ms':>9}"
+            f"{'p99 ms':>9}{'max ms':>9}{'late':>6}"
+        )
+    for mode in [value.strip() for value in args.modes.split(",") if value.strip()]:
+        result = _run(mode, args)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{result['mode']:>8}{result['ticks']:>7}{result['jitter_p50_ms']:>9.2f}"
+            f"{result['jitter_p95_ms']:>9.2f}{result['jitter_p99_ms']:>9.2f}"
+            f"{result['jitter_max_ms']:>9.2f}{result['late_ticks']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure time-to-control-restored after a drone MQTT link blip.
+
+Runs a simulated `RuntimeHub` (`DASHBOARD_SIM=1`) in-process, connects the
+drone and enters DRC, then repeatedly cuts the dashboard's clients off the
+fake broker for `--outage` seconds (`SimEnvironment.link_outage`). `warm` is
+the supervised path: transport reconnect with backoff, subscription replay
+and automatic DRC re-entry. `cold` is the old recovery: disconnect, connect,
+auth request and confirm (the operator's confirmation on the remote
+controller is not included, so real cold recovery is slower still).
+Times are measured from the end of the outage until the drone reports
+`DRC_READY` again.
+
+    python scripts/bench/reconnect.py --trials 10 --outage 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+
+from _common import ensure_import_paths, percentile
+
+os.environ["DASHBOARD_SIM"] = "1"
+ensure_import_paths()
+
+from dashboard.config import get_config  # noqa: E402
+from dashboard.services.runtime_hub import RuntimeHub  # noqa: E402
+
+
+def _wait_ready(hub: RuntimeHub, timeout: float) -> float:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if hub.drone.status().state == "DRC_READY":
+            return time.monotonic()
+        time.sleep(0.005)
+    raise RuntimeError("DRC was not restored")
+
+
+def _enter_drc(hub: RuntimeHub) -> None:
+    assert hub.drone.drc is not None
+    hub.drone.drc.request_control()
+    hub.drone.drc.confirm_control()
+
+
+def _warm(hub: RuntimeHub, outage: float, timeout: float) -> float:
+    assert hub.sim is not None
+    started = time.monotonic()
+    hub.sim.link_outage(outage)
+    back_at = started + outage
+    # The supervisor must notice the loss before the outage ends.
+    while hub.drone.status().state != "RECONNECTING":
+        if time.monotonic() >= back_at:
+            raise RuntimeError("outage shorter than DRONE_LINK_CHECK_INTERVAL")
+        time.sleep(0.005)
+    time.sleep(max(back_at - time.monotonic(), 0.0))
+    return _wait_ready(hub, timeout) - back_at
+
+
+def _cold(hub: RuntimeHub, outage: float, timeout: float) -> float:
+    hub.drone.disconnect()
+    time.sleep(outage)
+    started = time.monotonic()
+    hub.drone.connect()
+    _enter_drc(hub)
+    return _wait_ready(hub, timeout) - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--outage", type=float, default=1.0, help="seconds offline")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--modes", default="warm,cold")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args()
+
+    config_class = get_config(None)
+    config = {key: getattr(config_class, key) for key in dir(config_class) if key.isupper()}
+    config["SIM_MODE"] = True
+    hub = RuntimeHub(config)
+    try:
+        ok, error = hub.connect_drone()
+        if not ok:
+            raise RuntimeError(error)
+        _enter_drc(hub)
+        _wait_ready(hub, args.timeout)
+
+        if not args.json:
+            print(f"{'mode':>6}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for mode in [value.strip() for value in args.modes.split(",") if value.strip()]:
+            measure = _warm if mode == "warm" else _cold
+            samples = [measure(hub, args.outage, args.timeout) for _ in range(args.trials)]
+            result = {
+                "mode": mode,
+                "trials": len(samples),
+                "p50_ms": percentile(samples, 50) * 1000.0,
+                "p99_ms": percentile(samples, 99) * 1000.0,
+                "max_ms": max(samples) * 1000.0,
+            }
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print(
+                    f"{mode:>6}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+                    f"{result['max_ms']:>10.1f}"
+                )
+    finally:
+        hub.stop_all()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Estimated flight time of random photo routes before/after `optimize_route`.
+
+Waypoints are scattered uniformly over a square with random heights and
+task yaws (all photo waypoints unless `--shaping` adds fixed non-photo
+ones); start and return point are the origin. Reports the cost model's
+seconds for the drawn order and the optimized order, and solve time.
+
+    python scripts/bench/route_optimize.py --points 50,200,1000 --trials 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any
+
+from _common import ensure_import_paths, percentile
+
+ensure_import_paths()
+
+from dashboard.services.route_optimizer import RouteCostModel, optimize_route  # noqa: E402
+from dashboard.services.waypoints import WaypointArray  # noqa: E402
+
+
+def _points(count: int, span: float, shaping: float, seed: int) -> WaypointArray:
+    rng = random.Random(seed)
+    return WaypointArray.from_payload(
+        [
+            {
+                "x": rng.uniform(-span, span),
+                "y": rng.uniform(-span, span),
+                "z": rng.uniform(1.0, 5.0),
+                "yaw": rng.uniform(-180.0, 180.0),
+                "takePhoto": rng.random() >= shaping,
+            }
+            for _ in range(count)
+        ]
+    )
+
+
+def _run(count: int, args: argparse.Namespace) -> dict[str, Any]:
+    model = RouteCostModel()
+    origin = (0.0, 0.0, 1.0, 0.0)
+    before: list[float] = []
+    after: list[float] = []
+    solve: list[float] = []
+    for trial in range(args.trials):
+        points = _points(count, args.span, args.shaping, seed=trial)
+        started = time.perf_counter()
+        result = optimize_route(points, origin, origin, model, time_budget_s=args.budget)
+        solve.append(time.perf_counter() - started)
+        before.append(result.cost_before_s)
+        after.append(result.cost_after_s)
+    return {
+        "points": count,
+        "before_s": percentile(before, 50),
+        "after_s": percentile(after, 50),
+        "saved_pct": 100.0 * (1.0 - sum(after) / max(sum(before), 1e-9)),
+        "solve_ms": percentile(solve, 50) * 1000.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", default="50,200,1000")
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--span", type=float, default=20.0, help="half side of the area (m)")
+    parser.add_argument("--shaping", type=float, default=0.0, help="share of non-photo points")
+    parser.add_argument("--budget", type=float, default=2.0, help="solver time budget (s)")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args()
+
+    if not args.json:
+        print(f"{'points':>7}{'before s':>11}{'after s':>10}{'saved %':>9}{'solve ms':>10}")
+    for count in [int(value) for value in args.points.split(",") if value.strip()]:
+        result = _run(count, args)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{count:>7}{result['before_s']:>11.1f}{result['after_s']:>10.1f}"
+            f"{result['saved_pct']:>9.1f}{result['solve_ms']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Compare read-heavy HTTP throughput: one process vs runtime daemon + N web workers.
+
+`local` starts one `server.create_app()` with `DASHBOARD_SIM=1`; `web:N`
+starts `main.py --role daemon` (same simulation) plus N
+`DASHBOARD_RUNTIME_ROLE=web` workers on their own ports. In both layouts the
+drone is connected, then `--threads` pollers hit `/api/ui/pose-strip`,
+`/api/drone/status` and `/api/mission/status`, spread round-robin over the
+workers. Reports requests/s, latency percentiles and CPU of all server
+processes.
+
+    python scripts/bench/runtime_split.py --layouts local,web:1,web:2,web:4 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from _common import (
+    PROJECT_ROOT,
+    ensure_import_paths,
+    free_port,
+    percentile,
+    process_cpu_seconds,
+)
+
+HTTP_PATHS = ("/api/ui/pose-strip", "/api/drone/status", "/api/mission/status")
+
+
+def _serve(port: int) -> None:
+    os.environ.setdefault("DASHBOARD_SIM", "1")
+    ensure_import_paths()
+    import logging
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    from dashboard.extensions import socketio
+    from server import create_app
+
+    app = create_app()
+    socketio.run(
+        app, host="127.0.0.1", port=port, allow_unsafe_werkzeug=True, log_output=False
+    )
+
+
+def _wait_ready(base: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base}/dashboard/health", timeout=1.0):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{base} did not come up")
+
+
+def _connect_drone(base: str, timeout: float = 30.0) -> None:
+    # A web worker answers before the daemon listens; retry until it does.
+    deadline = time.monotonic() + timeout
+    while True:
+        request = urllib.request.Request(
+            f"{base}/api/drone/connect", data=b"{}", method="POST"
+        )
+        request.add_header("Content-Type", "application/json")
+        try:
+            with urllib.request.urlopen(request, timeout=10.0) as response:
+                response.read()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+
+def _poller(
+    bases: list[str],
+    offset: int,
+    latencies: list[float],
+    errors: list[int],
+    lock: threading.Lock,
+    recording: threading.Event,
+    stop: threading.Event,
+) -> None:
+    index = offset
+    while not stop.is_set():
+        base = bases[index % len(bases)]
+        path = HTTP_PATHS[index % len(HTTP_PATHS)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(f"{base}{path}", timeout=5.0) as response:
+                response.read()
+            latency: float | None = time.perf_counter() - started
+        except OSError:
+            latency = None
+        if not recording.is_set():
+            continue
+        with lock:
+            if latency is None:
+                errors[0] += 1
+            else:
+                latencies.append(latency)
+
+
+def _spawn_web(port: int, env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _run_layout(layout: str, args: argparse.Namespace) -> dict:
+    env = dict(os.environ, DASHBOARD_SIM="1")
+    processes: list[subprocess.Popen] = []
+    workers = 1
+    if layout.startswith("web:"):
+        workers = int(layout.split(":", 1)[1])
+        tag = f"bench{os.getpid()}"
+        env.update(
+            DASHBOARD_RUNTIME_ADDRESS=os.path.join(tempfile.gettempdir(), f"{tag}.sock"),
+            DASHBOARD_RUNTIME_SNAPSHOT=f"{tag}_runtime",
+        )
+        processes.append(
+            subprocess.Popen(
+                [sys.executable, str(PROJECT_ROOT / "main.py"), "--role", "daemon"],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
+        env["DASHBOARD_RUNTIME_ROLE"] = "web"
+    ports = [free_port() for _ in range(workers)]
+    processes += [_spawn_web(port, env) for port in ports]
+    bases = [f"http://127.0.0.1:{port}" for port in ports]
+
+    latencies: list[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    recording = threading.Event()
+    stop = threading.Event()
+    try:
+        for base in bases:
+            _wait_ready(base)
+        _connect_drone(bases[0])
+        pollers = [
+            threading.Thread(
+                target=_poller,
+                args=(bases, offset, latencies, errors, lock, recording, stop),
+                daemon=True,
+            )
+            for offset in range(args.threads)
+        ]
+        for poller in pollers:
+            poller.start()
+        time.sleep(args.warmup)
+
+        cpu_before = sum(process_cpu_seconds(p.pid) for p in processes)
+        recording.set()
+        started = time.monotonic()
+        time.sleep(args.seconds)
+        recording.clear()
+        elapsed = time.monotonic() - started
+        cpu_used = sum(process_cpu_seconds(p.pid) for p in processes) - cpu_before
+    finally:
+        stop.set()
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=10)
+
+    return {
+        "layout": layout,
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000.0,
+        "p99_ms": percentile(latencies, 99) * 1000.0,
+        "errors": errors[0],
+        "cpu_pct": cpu_used / elapsed * 100.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layouts", default="local,web:1,web:2,web:4")
+    parser.add_argument("--threads", type=int, default=16, help="concurrent pollers")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    parser.add_argument("--serve", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return 0
+
+    if not args.json:
+        print(f"{'layout':>8}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'err':>6}{'cpu %':>8}")
+    for layout in [value.strip() for value in args.layouts.split(",") if value.strip()]:
+        result = _run_layout(layout, args)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(
+            f"{result['layout']:>8}{result['requests_per_s']:>9.0f}"
+            f"{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+            f"{result['errors']:>6}{result['cpu_pct']:>8.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
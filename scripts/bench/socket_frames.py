@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Compare JSON vs binary Socket.IO frames for the /pose and /telemetry streams.
+
+Starts a dashboard Socket.IO server in a child process (real
+`register_socketio_events` wiring, synthetic pose/telemetry sources), connects
+N websocket clients per encoding and reports wire bytes/sec plus server CPU.
+
+Requires the client extra: `uv pip install "python-socketio[client]"`.
+
+    python scripts/bench/socket_frames.py --clients 20 --rate 30 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from _common import ensure_import_paths, free_port, process_cpu_seconds
+
+
+def _serve(port: int, rate: float) -> None:
+    ensure_import_paths()
+    from flask import Flask
+
+    from dashboard.domain.models import TelemetrySnapshot
+    from dashboard.extensions import socketio
+    from dashboard.sockets.events import register_socketio_events
+
+    started = time.monotonic()
+
+    class _Pose:
+        def latest(self) -> dict:
+            t = time.monotonic() - started
+            return {
+                "x": math.cos(t),
+                "y": math.sin(t),
+                "z": 1.2,
+                "yaw": (t * 20.0) % 360.0 - 180.0,
+                "status": "running",
+                "frequency": {"rostopic": 30.0, "mqtt": 30.0, "timestamp": time.time()},
+            }
+
+    class _Telemetry:
+        def latest(self) -> TelemetrySnapshot:
+            snapshot = TelemetrySnapshot()
+            snapshot.position.latitude = 22.5
+            snapshot.position.longitude = 113.9
+            snapshot.position.altitude = 12.3
+            snapshot.position.relative_altitude = 1.2
+            snapshot.speed.horizontal = 0.4
+            snapshot.battery.percent = 87
+            snapshot.connection.osd_frequency = 30.0
+            snapshot.flight.mode_label = "虚拟摇杆"
+            return snapshot
+
+    hub = SimpleNamespace(
+        slam=SimpleNamespace(pose=_Pose()),
+        drone=SimpleNamespace(telemetry=_Telemetry()),
+        _app_config={
+            "POSE_SOCKET_RATE": 1.0 / rate,
+            "TELEMETRY_SOCKET_INTERVAL": 1.0 / rate,
+        },
+    )
+    executor = SimpleNamespace(status=lambda: {"run": {}, "snapshot": None})
+
+    app = Flask(__name__)
+    socketio.init_app(app, async_mode="threading")
+    app.extensions["runtime_hub"] = hub
+    app.extensions["mission_executor"] = executor
+    register_socketio_events(socketio, hub, executor)  # type: ignore[arg-type]
+    socketio.run(app, host="127.0.0.1", port=port, allow_unsafe_werkzeug=True)
+
+
+def _wire_size(namespace: str, event: str, data) -> int:
+    from socketio import packet
+
+    encoded = packet.Packet(
+        packet.EVENT, data=[event, data], namespace=namespace
+    ).encode()
+    if isinstance(encoded, list):
+        return sum(len(part) for part in encoded)
+    return len(encoded.encode("utf-8"))
+
+
+def _run_clients(port: int, encoding: str, clients: int, seconds: float) -> dict:
+    import socketio
+
+    totals = {"bytes": 0, "frames": 0}
+    lock = threading.Lock()
+    sockets = []
+
+    def _counter(namespace: str, event: str):
+        def _handler(data):
+            size = _wire_size(namespace, event, data)
+            with lock:
+                totals["bytes"] += size
+                totals["frames"] += 1
+
+        return _handler
+
+    for _ in range(clients):
+        client = socketio.Client(reconnection=False)
+        client.on("pose", _counter("/pose", "pose"), namespace="/pose")
+        client.on("telemetry", _counter("/telemetry", "telemetry"), namespace="/telemetry")
+        client.connect(
+            f"http://127.0.0.1:{port}",
+            namespaces=["/pose", "/telemetry"],
+            transports=["websocket"],
+            auth={"encoding": encoding},
+        )
+        sockets.append(client)
+
+    time.sleep(1.0)
+    with lock:
+        totals["bytes"] = 0
+        totals["frames"] = 0
+    started = time.monotonic()
+    time.sleep(seconds)
+    elapsed = time.monotonic() - started
+    with lock:
+        result = dict(totals)
+    for client in sockets:
+        client.disconnect()
+    result["elapsed"] = elapsed
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=30.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--serve", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.rate)
+        return 0
+
+    print(f"clients={args.clients} rate={args.rate:.0f}Hz seconds={args.seconds:.0f}")
+    print(f"{'encoding':<10}{'frames/s':>12}{'KiB/s':>12}{'B/frame':>10}{'cpu %':>9}")
+    for encoding in ("json", "binary"):
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, __file__, "--serve", str(port), "--rate", str(args.rate)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            time.sleep(2.0)
+            cpu_before = process_cpu_seconds(server.pid)
+            result = _run_clients(port, encoding, args.clients, args.seconds)
+            cpu_used = process_cpu_seconds(server.pid) - cpu_before
+        finally:
+            server.terminate()
+            server.wait(timeout=5)
+        elapsed = result["elapsed"]
+        frames = result["frames"] / elapsed
+        kib = result["bytes"] / elapsed / 1024.0
+        per_frame = result["bytes"] / max(result["frames"], 1)
+        # CPU window also covers client connect/disconnect; good enough for A/B.
+        cpu_pct = cpu_used / (elapsed + 1.0) * 100.0
+        print(f"{encoding:<10}{frames:>12.1f}{kib:>12.1f}{per_frame:>10.1f}{cpu_pct:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Track server startup cost: import time and time-to-first-HTTP-response.
+
+1. Runs `python -X importtime` over `from server import create_app` and
+   reports the total plus the slowest modules (cumulative).
+2. Starts the full server `--runs` times and measures spawn -> first 200
+   from `/dashboard/health`.
+
+`--check` exits non-zero when a budget (`--import-budget-ms`,
+`--ttfr-budget-ms`) is exceeded. Eager heavy imports are caught by
+`tests/test_startup_imports.py`.
+
+    python scripts/bench/startup.py --runs 5 --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from _common import PROJECT_ROOT, ensure_import_paths, free_port
+
+def _import_snippet() -> str:
+    paths = [
+        str(PROJECT_ROOT / "thirdparty" / "pydjimqtt" / "src"),
+        str(PROJECT_ROOT / "apps"),
+        str(PROJECT_ROOT / "server"),
+        str(PROJECT_ROOT),
+    ]
+    return f"import sys\nsys.path[:0] = {paths!r}\nfrom server import create_app\n"
+
+
+def _serve(port: int) -> None:
+    ensure_import_paths()
+    import logging
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    from dashboard.extensions import socketio
+    from server import create_app
+
+    socketio.run(
+        create_app(),
+        host="127.0.0.1",
+        port=port,
+        allow_unsafe_werkzeug=True,
+        log_output=False,
+    )
+
+
+def _import_profile() -> tuple[float, list[tuple[float, str]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _import_snippet()],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    rows: list[tuple[float, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        except ValueError:
+            continue
+        total_us += int(self_us)
+        rows.append((int(cumulative_us) / 1000.0, name.rstrip()))
+    rows.sort(reverse=True)
+    return total_us / 1000.0, rows
+
+
+def _time_to_first_response(timeout: float = 60.0) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/dashboard/health"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1.0) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000.0
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError("server did not answer in time")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--import-budget-ms", type=float, default=0.0)
+    parser.add_argument("--ttfr-budget-ms", type=float, default=0.0)
+    parser.add_argument("--serve", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return 0
+
+    failures: list[str] = []
+
+    total_ms, rows = _import_profile()
+    print(f"import `server` (sum of self times): {total_ms:.1f} ms")
+    print(f"{'cumulative ms':>14}  module")
+    for cumulative_ms, name in rows[: args.top]:
+        print(f"{cumulative_ms:>14.1f}  {name}")
+    if args.import_budget_ms and total_ms > args.import_budget_ms:
+        failures.append(
+            f"import time {total_ms:.0f} ms > {args.import_budget_ms:.0f} ms"
+        )
+
+    if args.runs > 0:
+        samples = [_time_to_first_response() for _ in range(args.runs)]
+        median = statistics.median(samples)
+        print(
+            f"time to first HTTP response: median {median:.0f} ms "
+            f"(min {min(samples):.0f}, max {max(samples):.0f}, runs {len(samples)})"
+        )
+        if args.ttfr_budget_ms and median > args.ttfr_budget_ms:
+            failures.append(f"TTFR {median:.0f} ms > {args.ttfr_budget_ms:.0f} ms")
+
+    if args.check and failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
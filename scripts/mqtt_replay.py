@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Replay an MQTT flight capture (`MQTT_RECORD_DIR`) into a broker.
+
+    python scripts/mqtt_replay.py captures/capture-20260101_120000-0001.d3rec \
+        --host 127.0.0.1 --port 1883 --speed 10
+    python scripts/mqtt_replay.py <capture> --info
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "apps"))
+
+from dashboard.services.flight_recorder import (  # noqa: E402
+    FlightCapture,
+    broker_sink,
+    replay,
+)
+
+
+def _print_info(capture: FlightCapture) -> None:
+    span = capture.time_range()
+    if span is None:
+        print("empty capture")
+        return
+    per_topic: Counter[tuple[str, str]] = Counter()
+    for message in capture.messages():
+        per_topic[(message.source, message.topic)] += 1
+    duration = span[1] - span[0]
+    print(f"from={span[0]:.3f} to={span[1]:.3f} duration={duration:.1f}s")
+    for (source, topic), count in per_topic.most_common():
+        rate = count / duration if duration > 0 else 0.0
+        print(f"  [{source}] {topic}: {count} msgs ({rate:.1f} Hz)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--username", default="")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--speed", type=float, default=1.0, help="1-100x real time")
+    parser.add_argument("--from", dest="start", type=float, default=None)
+    parser.add_argument("--to", dest="end", type=float, default=None)
+    parser.add_argument("--info", action="store_true", help="print summary and exit")
+    args = parser.parse_args()
+
+    capture = FlightCapture(args.capture)
+    if args.info:
+        _print_info(capture)
+        return 0
+
+    import paho.mqtt.client as mqtt
+
+    client = mqtt.Client()
+    if args.username:
+        client.username_pw_set(args.username, args.password)
+    client.connect(args.host, args.port)
+    client.loop_start()
+    try:
+        delivered = replay(
+            capture,
+            broker_sink(client),
+            speed=args.speed,
+            start=args.start,
+            end=args.end,
+        )
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        client.loop_stop()
+        client.disconnect()
+    print(f"replayed {delivered} messages at {args.speed:g}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
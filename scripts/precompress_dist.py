@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Write `.br`/`.gz` siblings for compressible files in `apps/frontend/dist`.
+
+The server (`server/assets.py`) picks them up by `Accept-Encoding`, so the
+Three.js/LAS bundle is compressed once at build time instead of per request.
+Brotli needs the optional `brotli` package; without it only gzip is written.
+
+    pnpm --dir apps/frontend build && uv run python scripts/precompress_dist.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+from pathlib import Path
+from typing import Callable
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DIST = PROJECT_ROOT / "apps" / "frontend" / "dist"
+COMPRESSIBLE_SUFFIXES = {
+    ".css",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".wasm",
+    ".xml",
+}
+MIN_BYTES = 1024
+# Drop a variant that does not save at least this fraction of the original.
+MAX_RATIO = 0.95
+
+
+def _compressors(level: int) -> dict[str, Callable[[bytes], bytes]]:
+    compressors = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors[".br"] = lambda data: brotli.compress(data, quality=level)
+    return compressors
+
+
+def precompress(dist: Path, *, level: int = 11, force: bool = False) -> tuple[int, int, int]:
+    """Return (files written, original bytes, compressed bytes)."""
+
+    compressors = _compressors(level)
+    written = original_total = compressed_total = 0
+    for path in sorted(dist.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        stat = path.stat()
+        if stat.st_size < MIN_BYTES:
+            continue
+        data = None
+        for suffix, compress in compressors.items():
+            target = path.with_name(path.name + suffix)
+            if (
+                not force
+                and target.exists()
+                and target.stat().st_mtime_ns >= stat.st_mtime_ns
+            ):
+                continue
+            data = path.read_bytes() if data is None else data
+            encoded = compress(data)
+            if len(encoded) > len(data) * MAX_RATIO:
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(encoded)
+            written += 1
+            original_total += len(data)
+            compressed_total += len(encoded)
+    return written, original_total, compressed_total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dist", type=Path, default=DEFAULT_DIST)
+    parser.add_argument("--brotli-level", type=int, default=11)
+    parser.add_argument("--force", action="store_true", help="rewrite up-to-date variants")
+    args = parser.parse_args()
+
+    if not args.dist.is_dir():
+        parser.error(f"{args.dist} does not exist; build the frontend first.")
+    if brotli is None:
+        print("brotli not installed; writing gzip only (uv pip install brotli).")
+    written, original, compressed = precompress(
+        args.dist, level=args.brotli_level, force=args.force
+    )
+    saved = 100.0 * (1 - compressed / original) if original else 0.0
+    print(
+        f"wrote {written} variants: {original / 1024:.0f} KiB -> "
+        f"{compressed / 1024:.0f} KiB ({saved:.0f}% smaller)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
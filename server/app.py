@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from flask import Flask, abort, send_file
+from flask import Flask, abort
 
 from dashboard import create_app as create_dashboard_app
 from dashboard.extensions import socketio
+from .assets import StaticAssetIndex
 from .config import MEDIA_CONFIG, SERVER_CONFIG
 from mediaweb.blueprint import MediaWebConfig, create_media_blueprint
 
 
 DIST_DIR = Path(__file__).resolve().parents[1] / "apps" / "frontend" / "dist"
+FRONTEND_MISSING = "前端尚未构建，请先运行前端构建输出 apps/frontend/dist 目录。"
 
 
 def create_app() -> Flask:
@@ -26,15 +28,33 @@ def create_app() -> Flask:
     )
     app.register_blueprint(create_media_blueprint(media_config), url_prefix="/media")
 
+    assets = StaticAssetIndex(DIST_DIR)
+    app.extensions["static_assets"] = assets
+
+    def lookup(requested: str):
+        asset = assets.get(requested)
+        if asset is None and requested.startswith("assets/"):
+            # A missing build file must not come back as index.html.
+            abort(404)
+        return asset or assets.index
+
+    def serve_asset(requested: str):
+        asset = lookup(requested)
+        if asset is None:
+            return FRONTEND_MISSING, 503
+        try:
+            return assets.serve(asset)
+        except FileNotFoundError:
+            # dist was rebuilt since the last scan.
+            assets.refresh()
+            asset = lookup(requested)
+            if asset is None:
+                return FRONTEND_MISSING, 503
+            return assets.serve(asset)
+
     @app.get("/")
     def index():
-        index_path = DIST_DIR / "index.html"
-        if index_path.exists():
-            return send_file(index_path)
-        return (
-            "前端尚未构建，请先运行前端构建输出 apps/frontend/dist 目录。",
-            503,
-        )
+        return serve_asset("index.html")
 
     @app.get("/<path:requested>")
     def spa_assets(requested: str):
@@ -45,16 +65,7 @@ def create_app() -> Flask:
             or requested.startswith("media")
         ):
             abort(404)
-        asset_path = DIST_DIR / requested
-        if asset_path.exists():
-            return send_file(asset_path)
-        index_path = DIST_DIR / "index.html"
-        if index_path.exists():
-            return send_file(index_path)
-        return (
-            "前端尚未构建，请先运行前端构建输出 apps/frontend/dist 目录。",
-            503,
-        )
+        return serve_asset(requested)
 
     return app
 
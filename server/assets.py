@@ -0,0 +1,150 @@
+"""Static asset index for the built SPA (`apps/frontend/dist`).
+
+`dist` is scanned at startup; each request is a dict lookup, and only an
+unknown path costs a `stat()` (a rescan when the file has appeared, e.g.
+after a frontend rebuild). ETags come from the served file's current stat,
+so files rewritten in place revalidate correctly. Precompressed siblings
+(`app.js.br`, `app.js.gz`, see `scripts/precompress_dist.py`) are served
+when the client accepts them; requesting one directly never triggers a
+rescan.
+Vite's content-hashed files under `assets/` are cached as immutable for a
+year; everything else (notably `index.html`) is revalidated via ETag.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flask import Response, request, send_file
+from werkzeug.security import safe_join
+
+# Preference order when the client accepts several encodings.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+ENCODED_SUFFIXES = tuple(suffix for _, suffix in ENCODINGS)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# Vite emits `assets/<name>-<8+ char hash>.<ext>`.
+HASHED_NAME = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+# Rescan at most this often while `dist` is missing (e.g. build in progress).
+MISSING_RESCAN_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    path: Path
+    mimetype: str
+    immutable: bool
+    variants: dict[str, Path] = field(default_factory=dict)
+
+
+class StaticAssetIndex:
+    """Map request paths under `root` to files and their encoded variants."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._assets: dict[str, StaticAsset] = {}
+        self._scanned_at = 0.0
+        self.refresh()
+
+    @property
+    def index(self) -> StaticAsset | None:
+        return self.get("index.html")
+
+    def get(self, requested: str) -> StaticAsset | None:
+        asset = self._assets.get(requested)
+        if asset is not None:
+            return asset
+        if not self._assets:
+            if time.monotonic() - self._scanned_at > MISSING_RESCAN_SECONDS:
+                self.refresh()
+        elif not self._is_variant(requested) and self._on_disk(requested):
+            # Written after the last scan (rebuild while running).
+            self.refresh()
+        return self._assets.get(requested)
+
+    def _is_variant(self, requested: str) -> bool:
+        """An encoded sibling of an indexed file (never indexed on its own)."""
+
+        return (
+            requested.endswith(ENCODED_SUFFIXES)
+            and requested.rsplit(".", 1)[0] in self._assets
+        )
+
+    def _on_disk(self, requested: str) -> bool:
+        path = safe_join(str(self.root), requested)
+        return path is not None and os.path.isfile(path)
+
+    def refresh(self) -> int:
+        assets: dict[str, StaticAsset] = {}
+        if self.root.is_dir():
+            files = {
+                path.relative_to(self.root).as_posix(): path
+                for path in self.root.rglob("*")
+                if path.is_file()
+            }
+            for name, path in files.items():
+                if name.endswith(ENCODED_SUFFIXES) and name.rsplit(".", 1)[0] in files:
+                    continue
+                assets[name] = self._describe(name, path, files)
+        self._assets = assets
+        self._scanned_at = time.monotonic()
+        return len(assets)
+
+    def serve(self, asset: StaticAsset) -> Response:
+        """Send ``asset``; raises `FileNotFoundError` if it left the disk."""
+
+        stat = asset.path.stat()
+        encoding, path = self._negotiate(asset, stat.st_mtime_ns)
+        etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        if encoding:
+            etag = f"{etag}-{encoding}"
+        response = send_file(
+            path,
+            mimetype=asset.mimetype,
+            conditional=True,
+            etag=etag,
+            max_age=IMMUTABLE_MAX_AGE if asset.immutable else 0,
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if asset.variants:
+            response.vary.add("Accept-Encoding")
+        if asset.immutable:
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
+
+    def _describe(self, name: str, path: Path, files: dict[str, Path]) -> StaticAsset:
+        mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        variants = {
+            encoding: files[name + suffix]
+            for encoding, suffix in ENCODINGS
+            if name + suffix in files
+        }
+        return StaticAsset(
+            path=path,
+            mimetype=mimetype,
+            immutable=name.startswith("assets/") and bool(HASHED_NAME.search(name)),
+            variants=variants,
+        )
+
+    @staticmethod
+    def _negotiate(asset: StaticAsset, mtime_ns: int) -> tuple[str | None, Path]:
+        accepted = request.accept_encodings
+        for encoding, _ in ENCODINGS:
+            variant = asset.variants.get(encoding)
+            if variant is None or accepted[encoding] <= 0:
+                continue
+            try:
+                fresh = variant.stat().st_mtime_ns >= mtime_ns
+            except FileNotFoundError:
+                fresh = False
+            # A variant older than its source predates a rebuild; skip it.
+            if fresh:
+                return encoding, variant
+        return None, asset.path
@@ -0,0 +1,17 @@
+"""Make `dashboard` and `apps.control` importable like `main._ensure_import_paths`."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+for path in (
+    PROJECT_ROOT,
+    PROJECT_ROOT / "server",
+    PROJECT_ROOT / "apps",
+    PROJECT_ROOT / "thirdparty" / "pydjimqtt" / "src",
+):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dashboard.services.mission_estimator import EstimatorProfile, estimate_mission
+from dashboard.services.route_optimizer import RouteCostModel
+from dashboard.services.waypoints import WaypointArray
+
+HOME = (0.0, 0.0, 1.0, 0.0)
+
+
+def _profile() -> EstimatorProfile:
+    return EstimatorProfile(
+        model=RouteCostModel(),
+        align_hold_s=0.5,
+        arrival_hold_s=1.0,
+        vertical_hold_s=1.0,
+        task_hold_s=1.0,
+        takeoff_s=15.0,
+        landing_s=15.0,
+        battery_pct_per_min=4.0,
+    )
+
+
+def _line(photos: set[int]) -> WaypointArray:
+    return WaypointArray.from_payload(
+        [
+            {"x": float(i), "y": 0.0, "z": 1.0, "yaw": 0.0, "takePhoto": i in photos}
+            for i in range(1, 5)
+        ]
+    )
+
+
+def test_last_waypoint_passes_through_like_the_controller() -> None:
+    # The return point lies straight ahead, so the last waypoint is flown
+    # through as well; only the return point stops.
+    points = _line(photos=set())
+    result = estimate_mission(_profile(), points, HOME, (10.0, 0.0, 1.0, 0.0, False))
+    flags = [segment["pass_through"] for segment in result["segments"]]
+    assert flags == [True, True, True, True, False]
+
+
+def test_photo_and_sharp_turn_stop() -> None:
+    points = _line(photos={2})
+    result = estimate_mission(_profile(), points, HOME, (*HOME, False))
+    flags = [segment["pass_through"] for segment in result["segments"]]
+    # Waypoint 1 (x=2) takes a photo; the last one turns 180 deg to go home.
+    assert flags == [True, False, True, False, False]
+    assert result["segments"][1]["task_s"] >= 1.0
+    assert result["segments"][3]["settle_s"] >= 1.0
+
+
+def test_first_leg_climbs_from_takeoff_height() -> None:
+    points = WaypointArray.from_payload(
+        [{"x": float(i), "y": 0.0, "z": 2.0, "yaw": 0.0, "takePhoto": False} for i in range(1, 5)]
+    )
+    result = estimate_mission(_profile(), points, HOME, (10.0, 0.0, 2.0, 0.0, False))
+    flags = [segment["pass_through"] for segment in result["segments"]]
+    # Waypoint 0 is 1 m above the takeoff height: stop and climb, then fly through.
+    assert flags == [False, True, True, True, False]
+    assert result["segments"][0]["vertical_s"] >= 1.0 / RouteCostModel().speed_z
+
+
+def test_small_height_steps_do_not_accumulate() -> None:
+    points = WaypointArray.from_payload(
+        [
+            {"x": float(i), "y": 0.0, "z": 1.0 + 0.05 * i, "yaw": 0.0, "takePhoto": False}
+            for i in range(1, 5)
+        ]
+    )
+    result = estimate_mission(_profile(), points, HOME, (10.0, 0.0, 1.2, 0.0, False))
+    flags = [segment["pass_through"] for segment in result["segments"]]
+    # Each step is 5 cm, but the height drifts 10 cm from the last stop by waypoint 1.
+    assert flags == [True, False, True, False, False]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from dashboard.services.mqtt_pool import MqttConnectionPool
+
+
+class _Raw:
+    def __init__(self) -> None:
+        self.on_message = None
+
+    def subscribe(self, topic, qos=0, *args, **kwargs):
+        return None
+
+    def unsubscribe(self, topic, *args, **kwargs):
+        return None
+
+
+class _Client:
+    def __init__(self, gateway_sn, mqtt_config) -> None:
+        self.gateway_sn = gateway_sn
+        self.client = _Raw()
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.records: list[tuple[str, str]] = []
+
+    def attach(self, client, source, resolve=None):
+        raw = client.client
+        original = raw.on_message
+
+        def _recording(raw_client, userdata, msg):
+            tagged = (resolve(msg.topic) if resolve else None) or source
+            self.records.append((tagged, msg.topic))
+            if original:
+                original(raw_client, userdata, msg)
+
+        raw.on_message = _recording
+
+
+def _deliver(lease, topic: str) -> None:
+    raw = lease.target.client
+    raw.on_message(raw, None, SimpleNamespace(topic=topic, payload=b"{}"))
+
+
+def test_routed_topics_are_recorded_under_the_subscribing_lease():
+    recorder = _Recorder()
+
+    def _instrument(client, source, router):
+        recorder.attach(client, source, resolve=router.owner)
+
+    pool = MqttConnectionPool(client_factory=_Client, on_connect=_instrument)
+    config = {"host": "broker", "port": 1883}
+    drone = pool.acquire(config, source="drone", gateway_sn="GW1")
+    slam = pool.acquire(config, source="slam")
+    assert slam.target is drone.target
+
+    received: list[str] = []
+    slam.router.add("slam/+/pose", lambda topic, payload: received.append(topic))
+    _deliver(drone, "slam/a/pose")
+    _deliver(drone, "thing/product/GW1/osd")
+
+    assert received == ["slam/a/pose"]
+    assert recorder.records == [
+        ("slam", "slam/a/pose"),
+        ("drone", "thing/product/GW1/osd"),
+    ]
+
+
+def test_removed_route_falls_back_to_the_connection_source():
+    pool = MqttConnectionPool(client_factory=_Client)
+    config = {"host": "broker", "port": 1883}
+    drone = pool.acquire(config, source="drone", gateway_sn="GW1")
+    slam = pool.acquire(config, source="slam")
+
+    def handler(topic, payload):
+        return None
+
+    slam.router.add("slam/pose", handler)
+    assert slam.router.owner("slam/pose") == "slam"
+    slam.router.remove("slam/pose", handler)
+    assert drone.router.owner("slam/pose") is None
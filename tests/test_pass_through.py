@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from apps.control.core.complex_runtime import (
+    ComplexContext,
+    _pass_through_heading,
+    init_phase,
+)
+
+
+def _setup() -> tuple[SimpleNamespace, ComplexContext]:
+    # Two non-photo waypoints at 2 m, then the return point.
+    cfg = SimpleNamespace(
+        PASS_THROUGH_ENABLED=True,
+        PLANE_USE_RANDOM_WAYPOINTS=False,
+        PASS_THROUGH_MAX_DZ=0.08,
+        PASS_THROUGH_MAX_TURN_DEG=90.0,
+        TOLERANCE_XY=0.1,
+        VERTICAL_TOLERANCE=0.08,
+        WAYPOINTS=[(1.0, 0.0, 2.0), (2.0, 0.0, 2.0), (0.0, 0.0, 1.0)],
+    )
+    ctx = ComplexContext(
+        current_waypoint=(1.0, 0.0),
+        current_target_yaw=0.0,
+        current_target_z=2.0,
+        waypoint_index=0,
+        total_waypoints=3,
+        final_index_start=2,
+        task_required=[False, False, False],
+    )
+    # Takeoff left the drone at 1 m, below waypoint 0.
+    init_phase(cfg, SimpleNamespace(phase=None), ctx, (0.0, 0.0, 1.0))
+    return cfg, ctx
+
+
+def test_waypoint_zero_above_takeoff_height_stops() -> None:
+    cfg, ctx = _setup()
+    assert ctx.move_target_index == 0
+    assert _pass_through_heading(cfg, ctx, 1.0) is None
+
+
+def test_waypoint_zero_at_height_passes() -> None:
+    cfg, ctx = _setup()
+    assert _pass_through_heading(cfg, ctx, 2.03) == 0.0
+
+
+def test_unknown_height_stops() -> None:
+    cfg, ctx = _setup()
+    assert _pass_through_heading(cfg, ctx, None) is None
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from dashboard.services.route_optimizer import RouteCostModel, optimize_route
+from dashboard.services.waypoints import WaypointArray
+
+ORIGIN = (0.0, 0.0, 1.0, 0.0)
+
+
+def _points(count: int, seed: int, shaping: float = 0.0) -> WaypointArray:
+    rng = random.Random(seed)
+    return WaypointArray.from_payload(
+        [
+            {
+                "x": rng.uniform(-20.0, 20.0),
+                "y": rng.uniform(-20.0, 20.0),
+                "z": rng.uniform(1.0, 5.0),
+                "yaw": rng.uniform(-180.0, 180.0),
+                "takePhoto": rng.random() >= shaping,
+            }
+            for _ in range(count)
+        ]
+    )
+
+
+@pytest.mark.parametrize("count", [4, 5, 6, 8, 12, 40])
+@pytest.mark.parametrize("shaping", [0.0, 0.3])
+def test_never_slower_than_input_order(count: int, shaping: float) -> None:
+    for seed in range(300 if count <= 8 else 30):
+        points = _points(count, seed, shaping)
+        result = optimize_route(points, ORIGIN, ORIGIN, RouteCostModel())
+        assert result.cost_after_s <= result.cost_before_s, seed
+        assert sorted(result.order.tolist()) == list(range(count))
+        # Non-photo waypoints are fixed anchors.
+        fixed = np.flatnonzero(~points.data["take_photo"])
+        assert (result.order[fixed] == fixed).all()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("numpy", "pandas", "plotly", "rich", "typer", "pydjimqtt")
+
+
+def test_import_dashboard_defers_heavy_modules():
+    pytest.importorskip("flask")
+    pytest.importorskip("pydantic")
+    paths = [
+        str(PROJECT_ROOT / "thirdparty" / "pydjimqtt" / "src"),
+        str(PROJECT_ROOT / "apps"),
+        str(PROJECT_ROOT / "server"),
+        str(PROJECT_ROOT),
+    ]
+    snippet = (
+        "import json, sys\n"
+        f"sys.path[:0] = {paths!r}\n"
+        "import dashboard\n"
+        "loaded = {name.split('.')[0] for name in sys.modules}\n"
+        f"print(json.dumps(sorted(loaded & set({HEAVY_MODULES!r}))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], capture_output=True, text=True, check=True
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []